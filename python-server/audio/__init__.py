@@ -1,3 +1,4 @@
 from .vad import VADProcessor
+from .buffer import PCMBuffer
 
-__all__ = ["VADProcessor"]
+__all__ = ["VADProcessor", "PCMBuffer"]
@@ -0,0 +1,125 @@
+"""
+PCM Buffer - 사전 할당된 int16 오디오 버퍼
+"""
+
+import numpy as np
+
+from config import Config
+
+
+class PCMBuffer:
+    """
+    세션별 사전 할당 int16 PCM 버퍼
+
+    - bytearray.extend + flush 시 bytes() 복사 대신 고정 numpy 배열에 직접 기록
+    - flush 시 복사 없이 view 반환, float32 변환은 사전 할당된 scratch에 in-place 수행
+    - 더블 버퍼: take() 시 기록 대상 뱅크를 교체하므로 반환된 view는 새 오디오에 덮어써지지 않음
+    - len()은 bytearray와 동일하게 byte 수 반환 (기존 byte 단위 임계값과 호환)
+    """
+
+    def __init__(self, capacity_bytes: int = Config.SENTENCE_MAX_BYTES * 2):
+        capacity = capacity_bytes // Config.BYTES_PER_SAMPLE
+        self._banks = [np.empty(capacity, dtype=np.int16), np.empty(capacity, dtype=np.int16)]
+        self._active = 0
+        self._pcm = self._banks[0]
+        self._f32 = np.empty(capacity, dtype=np.float32)
+        # partial STT 전용 scratch (final 파이프라인의 to_float32와 동시에 사용되므로 분리, 첫 사용 시 할당)
+        self._partial_f32 = np.empty(0, dtype=np.float32)
+        self._write = 0
+
+    def __len__(self) -> int:
+        return self._write * Config.BYTES_PER_SAMPLE
+
+    @property
+    def samples(self) -> int:
+        return self._write
+
+    def extend(self, pcm_bytes: bytes):
+        """int16 PCM bytes를 버퍼 끝에 기록"""
+        samples = np.frombuffer(pcm_bytes, dtype=np.int16, count=len(pcm_bytes) // Config.BYTES_PER_SAMPLE)
+        end = self._write + len(samples)
+        if end > len(self._pcm):
+            self._grow(end)
+        self._pcm[self._write:end] = samples
+        self._write = end
+
+    def extend_frames(self, frames: np.ndarray, mask: np.ndarray) -> int:
+        """
+        (n_frames, frame_samples) int16 프레임 중 mask가 True인 프레임만 버퍼에 직접 기록
+
+        중간 bytes 객체 없이 np.compress로 버퍼 슬롯에 바로 복사
+
+        Returns:
+            기록된 byte 수
+        """
+        frame_samples = frames.shape[1]
+        n_speech = int(np.count_nonzero(mask))
+        n = n_speech * frame_samples
+        if n == 0:
+            return 0
+        end = self._write + n
+        if end > len(self._pcm):
+            self._grow(end)
+        if n_speech == len(mask):
+            # 발화 중간 청크(전 프레임 음성)는 마스크 선택 없이 연속 복사 1회
+            self._pcm[self._write:end] = frames.reshape(-1)
+        else:
+            np.compress(mask, frames, axis=0, out=self._pcm[self._write:end].reshape(-1, frame_samples))
+        self._write = end
+        return n * Config.BYTES_PER_SAMPLE
+
+    def _grow(self, min_samples: int):
+        """용량 초과 시 확장 (최대 버퍼 크기를 넘는 청크가 들어온 경우에만 발생)"""
+        capacity = max(min_samples, len(self._pcm) * 2)
+        pcm = np.empty(capacity, dtype=np.int16)
+        pcm[:self._write] = self._pcm[:self._write]
+        self._banks[self._active] = pcm
+        self._pcm = pcm
+        if capacity > len(self._f32):
+            self._f32 = np.empty(capacity, dtype=np.float32)
+
+    def view(self) -> np.ndarray:
+        """현재까지 기록된 PCM (복사 없음)"""
+        return self._pcm[:self._write]
+
+    def take(self) -> np.ndarray:
+        """
+        기록된 PCM view를 반환하고 다른 뱅크로 교체 (복사 없음)
+
+        반환된 view는 다음 take() 전까지 유효 (그 사이 extend()는 다른 뱅크에 기록)
+        """
+        pcm = self._pcm[:self._write]
+        self._active ^= 1
+        self._pcm = self._banks[self._active]
+        self._write = 0
+        return pcm
+
+    def clear(self):
+        self._write = 0
+
+    def snapshot_float32(self) -> np.ndarray:
+        """
+        현재까지 기록된 PCM을 partial 전용 scratch에 float32로 변환 (int16 뱅크와 독립된 사본)
+
+        이후 take()/clear()/extend()에 영향받지 않음 (다음 snapshot_float32() 호출 전까지 유효)
+        """
+        pcm = self._pcm[:self._write]
+        if len(pcm) > len(self._partial_f32):
+            self._partial_f32 = np.empty(len(self._pcm), dtype=np.float32)
+        out = self._partial_f32[:len(pcm)]
+        np.multiply(pcm, np.float32(1.0 / 32768.0), out=out)
+        return out
+
+    def to_float32(self, pcm) -> np.ndarray:
+        """
+        int16 → float32 [-1, 1] 정규화 (scratch 버퍼에 in-place, 다음 호출 전까지 유효)
+
+        역수 곱셈 1회로 변환 (astype 복사 + 나눗셈 2 pass → 1 pass)
+        """
+        if not isinstance(pcm, np.ndarray):
+            pcm = np.frombuffer(pcm, dtype=np.int16, count=len(pcm) // Config.BYTES_PER_SAMPLE)
+        if len(pcm) > len(self._f32):
+            self._f32 = np.empty(len(pcm), dtype=np.float32)
+        out = self._f32[:len(pcm)]
+        np.multiply(pcm, np.float32(1.0 / 32768.0), out=out)
+        return out
@@ -0,0 +1,99 @@
+"""
+MP3 프레임 헤더 파싱 (Layer III)
+
+TTS 스트림을 프레임 경계에서 잘라 각 청크가 단독으로 디코딩 가능하도록 함
+프레임별 샘플 수 합산으로 재생 길이 계산 (비트레이트 추정 없이 CBR/VBR 모두 정확)
+"""
+
+from typing import Optional, Tuple
+
+# 비트레이트 테이블 (kbps, index 0/15는 free/bad)
+_BITRATES_V1_L3 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+_BITRATES_V2_L3 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+
+# version bits → 샘플레이트 테이블 (1은 reserved)
+_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),  # MPEG-1
+    2: (22050, 24000, 16000),  # MPEG-2
+    0: (11025, 12000, 8000),   # MPEG-2.5
+}
+
+HEADER_SIZE = 4
+
+
+def parse_frame_header(data, offset: int = 0) -> Optional[Tuple[int, int, int]]:
+    """
+    offset 위치의 Layer III 프레임 헤더 해석
+
+    Returns:
+        (frame_length_bytes, samples_per_frame, sample_rate) 또는 헤더가 아니면 None
+    """
+    if offset + HEADER_SIZE > len(data):
+        return None
+    b0, b1, b2 = data[offset], data[offset + 1], data[offset + 2]
+    if b0 != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+
+    version = (b1 >> 3) & 0x03
+    layer = (b1 >> 1) & 0x03
+    if version == 1 or layer != 1:  # reserved 버전, Layer III 외
+        return None
+
+    bitrate_index = b2 >> 4
+    sample_rate_index = (b2 >> 2) & 0x03
+    if bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+    padding = (b2 >> 1) & 0x01
+
+    sample_rate = _SAMPLE_RATES[version][sample_rate_index]
+    if version == 3:
+        bitrate = _BITRATES_V1_L3[bitrate_index] * 1000
+        return 144 * bitrate // sample_rate + padding, 1152, sample_rate
+
+    bitrate = _BITRATES_V2_L3[bitrate_index] * 1000
+    return 72 * bitrate // sample_rate + padding, 576, sample_rate
+
+
+def complete_frames_length(data) -> int:
+    """
+    data 앞부분에서 완전한 프레임들이 차지하는 byte 수
+
+    첫 위치가 프레임 헤더가 아니면(ID3 등) 0 → 호출 측은 스트림 끝까지 모아서 처리
+    """
+    offset = 0
+    while True:
+        header = parse_frame_header(data, offset)
+        if header is None or offset + header[0] > len(data):
+            return offset
+        offset += header[0]
+
+
+def _id3v2_size(data) -> int:
+    """앞에 붙은 ID3v2 태그 byte 수 (없으면 0)"""
+    if len(data) < 10 or bytes(data[:3]) != b"ID3":
+        return 0
+    # synchsafe 정수 (바이트당 7bit) + 헤더 10 byte (+ footer 10 byte)
+    size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def duration_ms(data) -> Optional[int]:
+    """
+    프레임 헤더를 순회해 재생 길이(ms) 계산
+
+    Returns:
+        재생 길이, 프레임을 하나도 찾지 못하면 None
+    """
+    offset = _id3v2_size(data)
+    total_ms = 0.0
+    found = False
+    while True:
+        header = parse_frame_header(data, offset)
+        if header is None:
+            break
+        frame_len, samples, sample_rate = header
+        total_ms += samples * 1000 / sample_rate
+        found = True
+        offset += frame_len
+    return int(total_ms) if found else None
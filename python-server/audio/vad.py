@@ -8,6 +8,37 @@ import webrtcvad
 
 from config import Config
 
+# Optional: numba JIT 에너지 커널 (없으면 NumPy 벡터 연산 사용)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _frame_energy_np(samples: np.ndarray, frame_len: int, energy_out: np.ndarray):
+    """프레임별 제곱 에너지 합 (NumPy, int32 프레임 → int64 누적)"""
+    n_frames = len(energy_out)
+    frames = samples[:n_frames * frame_len].reshape(n_frames, frame_len).astype(np.int32)
+    np.einsum("ij,ij->i", frames, frames, out=energy_out, dtype=np.int64)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def _frame_energy_nb(samples, frame_len, energy_out):
+        """프레임별 제곱 에너지 합 (numba, int64 누적)"""
+        for f in range(energy_out.shape[0]):
+            base = f * frame_len
+            acc = 0
+            for i in range(frame_len):
+                s = np.int64(samples[base + i])
+                acc += s * s
+            energy_out[f] = acc
+
+    _frame_energy = _frame_energy_nb
+else:
+    _frame_energy = _frame_energy_np
+
 
 class VADProcessor:
     """
@@ -27,11 +58,22 @@ class VADProcessor:
         self.sample_rate = Config.SAMPLE_RATE
         self.frame_duration_ms = 30  # WebRTC VAD는 10, 20, 30ms 지원
         self.frame_size = int(self.sample_rate * self.frame_duration_ms / 1000) * 2  # bytes
+        self.frame_samples = self.frame_size // 2
+        # 프레임 제곱합 기준 임계값: 무음(이하 → 비음성), 확실한 음성(이상 → WebRTC VAD 생략, 0이면 사용 안 함)
+        self.silence_energy = int(Config.SILENCE_THRESHOLD_RMS) ** 2 * self.frame_samples
+        self.confident_energy = (int(Config.VAD_CONFIDENT_RMS) ** 2 * self.frame_samples
+                                 if Config.VAD_CONFIDENT_RMS > 0 else None)
+
+        # process_chunk()에서 계산한 마스크를 filter_speech*()에서 재사용 (같은 청크 객체일 때)
+        self._last_audio = None
+        self._last_mask = None
 
         # 상태
         self.is_speaking = False
         self.silence_frames = 0
         self.speech_frames = 0
+        # 현재 발화에서 연속 음성(min_speech_frames)이 한 번이라도 확인됐는지 - 노이즈 블립만 쌓인 버퍼는 STT 생략
+        self.speech_confirmed = False
 
         # 설정
         self.min_speech_frames = 3    # 최소 음성 프레임 (노이즈 필터링)
@@ -41,8 +83,42 @@ class VADProcessor:
         """int16 오디오 데이터의 RMS 계산"""
         if len(audio_bytes) < 2:
             return 0.0
-        arr = np.frombuffer(audio_bytes, dtype=np.int16)
-        return float(np.sqrt(np.mean(arr.astype(np.float64) ** 2)))
+        arr = np.frombuffer(audio_bytes, dtype=np.int16, count=len(audio_bytes) // 2)
+        # float64 임시 배열 없이 int64 누적 내적 1회
+        return float(np.sqrt(np.einsum("i,i->", arr, arr, dtype=np.int64) / len(arr)))
+
+    def _speech_mask(self, audio_bytes: bytes) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        프레임별 음성 여부 마스크 계산
+
+        1) 에너지 커널로 모든 프레임 에너지를 한 번에 계산
+        2) RMS < SILENCE_THRESHOLD_RMS → 무음, RMS >= VAD_CONFIDENT_RMS(설정 시) → 음성으로 바로 판정
+        3) 나머지 프레임은 WebRTC VAD 판정 (VAD 오류 시 RMS 판정 유지)
+
+        Returns:
+            (samples, mask): int16 샘플 view, 프레임별 bool 마스크
+        """
+        samples = np.frombuffer(audio_bytes, dtype=np.int16, count=len(audio_bytes) // 2)
+        if audio_bytes is self._last_audio:
+            return samples, self._last_mask
+
+        n_frames = len(samples) // self.frame_samples
+        energy = np.empty(n_frames, dtype=np.int64)
+        _frame_energy(samples, self.frame_samples, energy)
+        mask = energy >= self.silence_energy
+
+        ambiguous = mask if self.confident_energy is None else mask & (energy < self.confident_energy)
+        for idx in np.flatnonzero(ambiguous):
+            offset = int(idx) * self.frame_size
+            try:
+                mask[idx] = self.vad.is_speech(audio_bytes[offset:offset + self.frame_size], self.sample_rate)
+            except Exception:
+                # VAD 오류 시 RMS 폴백 (에너지 마스크 값 유지)
+                pass
+
+        self._last_audio = audio_bytes
+        self._last_mask = mask
+        return samples, mask
 
     def has_speech(self, audio_bytes: bytes) -> bool:
         """
@@ -57,27 +133,10 @@ class VADProcessor:
         if len(audio_bytes) < self.frame_size:
             return False
 
-        speech_frame_count = 0
-        total_frames = 0
-
-        for i in range(0, len(audio_bytes) - self.frame_size + 1, self.frame_size):
-            frame = audio_bytes[i:i + self.frame_size]
-            if len(frame) == self.frame_size:
-                total_frames += 1
-                try:
-                    if self.vad.is_speech(frame, self.sample_rate):
-                        speech_frame_count += 1
-                except Exception:
-                    # VAD 오류 시 RMS 폴백
-                    rms = self.calculate_rms(frame)
-                    if rms >= Config.SILENCE_THRESHOLD_RMS:
-                        speech_frame_count += 1
+        _, mask = self._speech_mask(audio_bytes)
 
         # 30% 이상의 프레임이 음성이면 음성으로 판단
-        if total_frames > 0:
-            speech_ratio = speech_frame_count / total_frames
-            return speech_ratio >= 0.3
-        return False
+        return bool(np.count_nonzero(mask) >= 0.3 * len(mask))
 
     def filter_speech(self, audio_bytes: bytes) -> bytes:
         """
@@ -92,23 +151,31 @@ class VADProcessor:
         if len(audio_bytes) < self.frame_size:
             return audio_bytes
 
-        speech_frames = []
+        samples, mask = self._speech_mask(audio_bytes)
+        if not mask.any():
+            return b''
+
+        frames = samples[:len(mask) * self.frame_samples].reshape(len(mask), self.frame_samples)
+        return frames[mask].tobytes()
 
-        for i in range(0, len(audio_bytes) - self.frame_size + 1, self.frame_size):
-            frame = audio_bytes[i:i + self.frame_size]
-            if len(frame) == self.frame_size:
-                try:
-                    if self.vad.is_speech(frame, self.sample_rate):
-                        speech_frames.append(frame)
-                except Exception:
-                    # VAD 오류 시 RMS 폴백
-                    rms = self.calculate_rms(frame)
-                    if rms >= Config.SILENCE_THRESHOLD_RMS:
-                        speech_frames.append(frame)
+    def filter_speech_into(self, audio_bytes: bytes, out) -> int:
+        """
+        음성 프레임만 PCMBuffer에 직접 기록 (filter_speech + extend의 중간 bytes 생략)
+
+        Args:
+            audio_bytes: int16 PCM 오디오 데이터
+            out: 기록 대상 PCMBuffer
+
+        Returns:
+            기록된 byte 수
+        """
+        if len(audio_bytes) < self.frame_size:
+            out.extend(audio_bytes)
+            return len(audio_bytes)
 
-        if speech_frames:
-            return b''.join(speech_frames)
-        return b''
+        samples, mask = self._speech_mask(audio_bytes)
+        frames = samples[:len(mask) * self.frame_samples].reshape(len(mask), self.frame_samples)
+        return out.extend_frames(frames, mask)
 
     def process_chunk(self, audio_bytes: bytes) -> Tuple[bool, bool]:
         """
@@ -124,6 +191,7 @@ class VADProcessor:
             self.silence_frames = 0
             if not self.is_speaking and self.speech_frames >= self.min_speech_frames:
                 self.is_speaking = True
+                self.speech_confirmed = True
             return True, False
         else:
             if self.is_speaking:
@@ -141,3 +209,6 @@ class VADProcessor:
         self.is_speaking = False
         self.silence_frames = 0
         self.speech_frames = 0
+        self.speech_confirmed = False
+        self._last_audio = None
+        self._last_mask = None
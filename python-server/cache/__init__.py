@@ -1,4 +1,5 @@
 """Cache module - Room-based caching for STT/Translation/TTS"""
 from cache.room_cache import CacheEntry, RoomCacheManager
+from cache.lru_cache import LRUCache
 
-__all__ = ["CacheEntry", "RoomCacheManager"]
+__all__ = ["CacheEntry", "RoomCacheManager", "LRUCache"]
@@ -0,0 +1,44 @@
+"""
+LRU Cache - 스레드 안전 고정 크기 캐시
+
+Room 캐시(TTL 기반, 같은 발화 공유)와 달리 방/시간과 무관하게
+자주 반복되는 짧은 문구("Hello", "Yes" 등)의 결과를 재사용
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class LRUCache:
+    """OrderedDict 기반 LRU 캐시 (가장 오래 사용되지 않은 항목부터 제거)"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시 조회 (hit 시 최근 사용으로 이동)"""
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        """캐시 저장 (가득 차면 가장 오래된 항목 제거)"""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -17,6 +17,13 @@ from collections import defaultdict
 from config.settings import Config
 from utils.logger import DebugLogger
 
+# Optional: xxhash (XXH3 SIMD 해시, 없으면 hashlib.blake2b 사용)
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
 
 @dataclass
 class CacheEntry:
@@ -38,19 +45,28 @@ class RoomCacheManager:
     """
     _instance = None
     _lock = threading.Lock()
+    _init_lock = threading.Lock()
 
     def __new__(cls):
         if cls._instance is None:
             with cls._lock:
                 if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
+                    # 속성을 채운 뒤 공개 → lock 밖에서 읽는 스레드가 _initialized 없는 객체를 보지 않음
+                    instance = super().__new__(cls)
+                    instance._initialized = False
+                    cls._instance = instance
         return cls._instance
 
     def initialize(self):
         if self._initialized:
             return
 
+        with self._init_lock:
+            if self._initialized:
+                return
+            self._initialize_caches()
+
+    def _initialize_caches(self):
         # room_id -> speaker_id -> cache_key -> CacheEntry
         self.stt_cache: Dict[str, Dict[str, Dict[str, CacheEntry]]] = defaultdict(lambda: defaultdict(dict))
         self.translation_cache: Dict[str, Dict[str, CacheEntry]] = defaultdict(dict)
@@ -127,9 +143,15 @@ class RoomCacheManager:
         with self._cache_lock:
             return self.room_listeners[room_id][target_lang].copy()
 
-    def _make_audio_hash(self, audio_bytes: bytes) -> str:
-        """오디오 데이터의 해시 생성 (빠른 비교용)"""
-        return hashlib.md5(audio_bytes).hexdigest()[:16]
+    def _make_audio_hash(self, audio_bytes) -> str:
+        """
+        오디오 데이터의 해시 생성 (빠른 비교용)
+
+        PCM 버퍼 view(bytes/ndarray)를 복사 없이 해시, 64bit digest로 바로 16자 hex
+        """
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh3_64_hexdigest(audio_bytes)
+        return hashlib.blake2b(audio_bytes, digest_size=8).hexdigest()
 
     def get_or_create_stt(self, room_id: str, speaker_id: str, audio_bytes: bytes,
                           transcribe_fn) -> Tuple[str, float, bool]:
@@ -149,7 +171,7 @@ class RoomCacheManager:
                 if audio_hash in self.stt_cache[room_id][speaker_id]:
                     entry = self.stt_cache[room_id][speaker_id][audio_hash]
                     if not entry.is_expired():
-                        DebugLogger.log("CACHE_HIT", "STT cache hit", {"key": cache_key[:16]})
+                        DebugLogger.log_lazy("CACHE_HIT", "STT cache hit", lambda: {"key": cache_key[:16]})
                         return entry.value[0], entry.value[1], True
 
             # 처리 중인지 확인
@@ -179,7 +201,7 @@ class RoomCacheManager:
                     value=(text, confidence),
                     created_at=time.time()
                 )
-                DebugLogger.log("CACHE_SET", "STT cached", {"key": cache_key[:16], "text_len": len(text)})
+                DebugLogger.log_lazy("CACHE_SET", "STT cached", lambda: {"key": cache_key[:16], "text_len": len(text)})
 
             return text, confidence, False
         finally:
@@ -202,7 +224,7 @@ class RoomCacheManager:
             if cache_key in self.translation_cache:
                 entry = self.translation_cache[cache_key]
                 if not entry.is_expired():
-                    DebugLogger.log("CACHE_HIT", "Translation cache hit", {"room": room_id[:8], "key": cache_key[:24]})
+                    DebugLogger.log_lazy("CACHE_HIT", "Translation cache hit", lambda: {"room": room_id[:8], "key": cache_key[:24]})
                     return entry.value, True
 
         # 실제 번역 처리
@@ -214,7 +236,7 @@ class RoomCacheManager:
                 value=translated,
                 created_at=time.time()
             )
-            DebugLogger.log("CACHE_SET", "Translation cached", {"room": room_id[:8], "key": cache_key[:24]})
+            DebugLogger.log_lazy("CACHE_SET", "Translation cached", lambda: {"room": room_id[:8], "key": cache_key[:24]})
 
         return translated, False
 
@@ -232,7 +254,7 @@ class RoomCacheManager:
             if cache_key in self.tts_cache:
                 entry = self.tts_cache[cache_key]
                 if not entry.is_expired():
-                    DebugLogger.log("CACHE_HIT", "TTS cache hit", {"room": room_id[:8], "key": cache_key[:24]})
+                    DebugLogger.log_lazy("CACHE_HIT", "TTS cache hit", lambda: {"room": room_id[:8], "key": cache_key[:24]})
                     return entry.value[0], entry.value[1], True
 
         # 실제 TTS 처리
@@ -244,6 +266,6 @@ class RoomCacheManager:
                 value=(audio_bytes, duration_ms),
                 created_at=time.time()
             )
-            DebugLogger.log("CACHE_SET", "TTS cached", {"room": room_id[:8], "key": cache_key[:24]})
+            DebugLogger.log_lazy("CACHE_SET", "TTS cached", lambda: {"room": room_id[:8], "key": cache_key[:24]})
 
         return audio_bytes, duration_ms, False
@@ -12,6 +12,7 @@ class Config:
     SAMPLE_RATE = 16000
     BYTES_PER_SAMPLE = 2  # 16-bit
     BYTES_PER_SECOND = SAMPLE_RATE * BYTES_PER_SAMPLE  # 32000
+    INV_BYTES_PER_SECOND = 1.0 / BYTES_PER_SECOND  # bytes → 초 변환 (나눗셈 대신 곱셈)
 
     # Buffering strategies
     CHUNK_DURATION_MS = 1500  # 1.5초 청크
@@ -21,8 +22,21 @@ class Config:
     SENTENCE_MAX_DURATION_MS = 2500  # 문장 최대 대기 시간 (2.5초)
     SENTENCE_MAX_BYTES = int(BYTES_PER_SECOND * SENTENCE_MAX_DURATION_MS / 1000)
 
+    # 처리 최소 버퍼 크기 (bytes)
+    MIN_SPEECH_BYTES = int(BYTES_PER_SECOND * 0.5)       # 문장 끝 감지 시 최소 0.5초
+    SESSION_END_MIN_BYTES = int(BYTES_PER_SECOND * 0.3)  # 세션 종료 시 잔여 버퍼 최소 0.3초
+
+    # Partial STT: 버퍼링 중 일정 간격마다 중간 전사(is_partial)를 먼저 전송 (Whisper 경로만)
+    # partial마다 30초 패딩 인코더 비용을 다시 내므로 GPU 여유가 있을 때만 켬 (기본 off)
+    PARTIAL_STT_ENABLED = os.getenv("PARTIAL_STT", "false").lower() == "true"
+    PARTIAL_STT_INTERVAL_BYTES = int(BYTES_PER_SECOND * 0.8)  # 새 음성 0.8초마다
+
     # VAD settings
     SILENCE_THRESHOLD_RMS = 30
+    # 이 RMS 이상 프레임은 WebRTC VAD 없이 음성으로 판정 (0 = 끔, 기본)
+    # 켜면 VAD 호출은 줄지만 키보드/음악/문 소리처럼 큰 소음도 음성으로 통과해 STT/번역까지 감 (검출 품질 저하)
+    # 소음이 적은 환경에서만 높게 설정 (예: 1500 ≈ -27 dBFS)
+    VAD_CONFIDENT_RMS = int(os.getenv("VAD_CONFIDENT_RMS", "0"))
     SILENCE_DURATION_MS = 350  # 문장 끝 감지용 침묵 지속 시간
     SILENCE_FRAMES = int(SILENCE_DURATION_MS / 100)
 
@@ -70,12 +84,33 @@ class Config:
     # Single Model Settings (when STT_BACKEND="whisper")
     WHISPER_MODEL_SIZE = os.getenv("WHISPER_MODEL", "large-v3-turbo")
     WHISPER_DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
-    WHISPER_COMPUTE_TYPE = "int8_float16" if torch.cuda.is_available() else "int8"
+    # CTranslate2 양자화: GPU는 int8 weight + fp16 activation, CPU는 int8 (VNNI GEMM)
+    # CT2는 4-bit 가중치를 지원하지 않으므로 int8이 최소 정밀도
+    WHISPER_COMPUTE_TYPE = os.getenv(
+        "WHISPER_COMPUTE_TYPE", "int8_float16" if torch.cuda.is_available() else "int8"
+    )
+    # num_workers만큼 동시 transcribe 허용 (세션 간 공유), worker당 스레드는 코어를 나눠 가짐
+    # → cpu_threads × num_workers ≤ 코어 수 (oversubscription 방지)
+    WHISPER_NUM_WORKERS = max(1, int(os.getenv("WHISPER_NUM_WORKERS", "2")))
+    WHISPER_CPU_THREADS = int(os.getenv("WHISPER_CPU_THREADS", max(1, (os.cpu_count() or 2) // WHISPER_NUM_WORKERS)))
+    # 로컬 STT(Whisper/NeMo) 동시 호출 수 - CT2 worker 수에 맞춰 CPU oversubscription 방지
+    MAX_CONCURRENT_STT = int(os.getenv("MAX_CONCURRENT_STT", WHISPER_NUM_WORKERS))
+
+    # 세션 간 Whisper 요청 배치 (첫 요청 후 윈도우 동안 모아 encode/generate 1회)
+    STT_BATCH_ENABLED = os.getenv("STT_BATCH", "true").lower() == "true"
+    STT_BATCH_SIZE = int(os.getenv("STT_BATCH_SIZE", "8"))
+    STT_BATCH_WINDOW_MS = 15
+
+    # 서버 시작 시 STT 워밍업 반복 횟수 (첫 요청의 CT2/MKL 초기화 지연 제거)
+    STT_WARMUP_PASSES = 2
 
     # Real-time optimized parameters
-    WHISPER_BEAM_SIZE = 1
-    WHISPER_BEST_OF = 1
+    # greedy 기본 (beam 5 대비 디코더 비용 ~1/5), 정확도 우선 배포는 WHISPER_BEAM_SIZE로 조정
+    WHISPER_BEAM_SIZE = max(1, int(os.getenv("WHISPER_BEAM_SIZE", "1")))
+    # 단일 temperature → temperature fallback 재디코딩 없음 (best_of는 temperature > 0 샘플링에서만 의미)
     WHISPER_TEMPERATURE = 0.0
+    # Whisper 호출 전 Silero VAD로 무음 구간 제거 (WebRTC VAD로 이미 필터링하므로 기본 off)
+    WHISPER_VAD_FILTER = os.getenv("WHISPER_VAD_FILTER", "false").lower() == "true"
 
     # Language code mappings for Whisper
     WHISPER_LANG_CODES = {
@@ -121,6 +156,20 @@ class Config:
 
     # Qwen3 Translation Model (Alibaba)
     QWEN_MODEL = os.getenv("QWEN_MODEL", "Qwen/Qwen3-8B")
+    QWEN_MAX_NEW_TOKENS = 256
+    # 생성 길이 상한 = 원문 토큰 수 × 비율 (최소값 보장, 퇴화 반복 시 tail latency 제한 / 컴파일 경로는 고정 상한)
+    QWEN_NEW_TOKENS_RATIO = 1.6
+    QWEN_MIN_NEW_TOKENS = 32
+    # 이 VRAM(GB) 미만 GPU는 NF4 4-bit + double quant 로딩 (가중치 대역폭 ~1/4, decode는 메모리 대역폭 한계)
+    QWEN_HALF_PRECISION_MIN_VRAM_GB = float(os.getenv("QWEN_HALF_PRECISION_MIN_VRAM_GB", "40"))
+    # generate()를 static KV cache + torch.compile(CUDA graph)로 실행 (GPU half precision 전용, 버킷별 첫 컴파일이 느려 기본 off)
+    QWEN_COMPILE = os.getenv("QWEN_COMPILE", "false").lower() == "true"
+    # 컴파일 그래프 재사용을 위한 입력 길이 버킷 (left padding, 마지막 값이 최대 입력 길이)
+    QWEN_INPUT_BUCKETS = (64, 128, 256, 512)
+    # 세션 간 Qwen 번역 요청 배치 (첫 요청 후 윈도우 동안 모아 generate 1회, 컴파일 경로에서는 미사용)
+    QWEN_BATCH_ENABLED = os.getenv("QWEN_BATCH", "true").lower() == "true"
+    QWEN_BATCH_SIZE = int(os.getenv("QWEN_BATCH_SIZE", "8"))
+    QWEN_BATCH_WINDOW_MS = 10
 
     # GPU Device
     GPU_DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
@@ -143,18 +192,42 @@ class Config:
 
     # AWS Polly
     AWS_REGION = os.getenv("AWS_REGION", "ap-northeast-2")
+    # boto3 커넥션 풀 크기 (세션 × 타겟 언어 병렬 요청 수 이상)
+    AWS_MAX_POOL_CONNECTIONS = int(os.getenv("AWS_MAX_POOL_CONNECTIONS", "50"))
+    AWS_MAX_ATTEMPTS = 2
+    # 실시간 경로용 짧은 타임아웃 (기본 60s read timeout 대신 빠르게 실패 → 재시도/폴백)
+    AWS_CONNECT_TIMEOUT = 1.0
+    AWS_READ_TIMEOUT = 5.0
 
     # gRPC
     GRPC_PORT = int(os.getenv("GRPC_PORT", 50051))
     MAX_WORKERS = int(os.getenv("MAX_WORKERS", 32))  # 동시 세션 처리를 위해 증가
+    # HTTP/2 write 버퍼: 한 발화의 transcript + 여러 TTS 응답을 적은 write()로 묶어 전송
+    GRPC_WRITE_BUFFER_SIZE = int(os.getenv("GRPC_WRITE_BUFFER_SIZE", 256 * 1024))
+    # HTTP/2 keepalive: 유휴 스트림(발화 사이 침묵)이 LB/NAT에서 끊기지 않도록 ping, 응답 없는 연결은 빠르게 정리
+    GRPC_KEEPALIVE_TIME_MS = 10000
+    GRPC_KEEPALIVE_TIMEOUT_MS = 20000
+    GRPC_MAX_CONCURRENT_STREAMS = int(os.getenv("GRPC_MAX_CONCURRENT_STREAMS", "512"))
+    SESSION_SHARDS = 16  # 세션 저장소 샤드 수 (샤드별 락)
 
     # Timeouts (seconds) - 실시간 응답을 위해 짧게 설정
     STT_TIMEOUT = 15  # Amazon Transcribe 타임아웃 (15초로 단축)
     TRANSLATION_TIMEOUT = 10  # 번역 타임아웃 (10초로 단축)
     TTS_TIMEOUT = 8  # TTS 타임아웃 (8초로 단축)
 
-    # Filler words to skip TTS (common interjections/fillers)
-    FILLER_WORDS = {
+    # Polly AudioStream 읽기 단위 (bytes)
+    TTS_STREAM_CHUNK_SIZE = 4096
+    # TTS 오디오를 Polly 스트림 도착 순서대로 여러 AudioResult로 나눠 전송 (MP3 프레임 경계 기준)
+    # 클라이언트가 같은 transcript_id의 연속 청크를 이어 재생해야 하므로 기본 off
+    TTS_STREAM_AUDIO = os.getenv("TTS_STREAM_AUDIO", "false").lower() == "true"
+
+    # Polly 출력 포맷: "mp3" (클라이언트 기본) 또는 "pcm" (16-bit mono, 정확한 duration)
+    TTS_OUTPUT_FORMAT = os.getenv("TTS_OUTPUT_FORMAT", "mp3")
+    TTS_SAMPLE_RATES = {"mp3": 24000, "pcm": 16000}  # pcm은 Polly 최대 16kHz
+    POLLY_MP3_BITRATE_KBPS = 48  # Polly 24kHz MP3 비트레이트 (프레임 헤더 파싱 실패 시 duration 추정용)
+
+    # Filler words to skip TTS (common interjections/fillers) - 소문자로만 저장
+    FILLER_WORDS = frozenset({
         # Korean fillers
         "네", "예", "응", "음", "어", "아", "으", "흠", "뭐", "그", "저",
         "아아", "어어", "음음", "네네", "예예", "그래", "응응",
@@ -165,7 +238,15 @@ class Config:
         "あ", "え", "う", "ん", "はい", "うん", "ええ", "まあ",
         # Chinese fillers
         "嗯", "啊", "哦", "呃", "好", "是",
-    }
+    })
+    # 무의미한 망설임 소리만 (FILLER_WORDS의 부분집합) - 구두점/나열 허용 매칭은 이 단어들로만
+    # yes/no/네/はい/好 같은 응답 단어는 "No." / "Well, no."처럼 실제 답변이므로 정확히 한 단어일 때만 필러
+    HESITATION_WORDS = frozenset({
+        "음", "어", "아", "으", "흠", "아아", "어어", "음음",
+        "uh", "um", "ah", "hmm",
+        "あ", "え", "う", "ん",
+        "嗯", "啊", "呃",
+    })
 
     # Minimum text length for TTS (characters)
     MIN_TTS_TEXT_LENGTH = 2
@@ -191,7 +272,16 @@ class Config:
     CACHE_TTL_SECONDS = 10  # 캐시 유효 시간 (10초)
     CACHE_CLEANUP_INTERVAL = 30  # 캐시 정리 간격 (30초)
 
+    # 반복 문구 번역 LRU 캐시 (Room/TTL과 무관하게 전역 재사용)
+    TRANSLATION_CACHE_SIZE = int(os.getenv("TRANSLATION_CACHE_SIZE", "4096"))
+    # 반복 문구 TTS 오디오 LRU 캐시 ((text, lang, format) -> (audio_bytes, duration_ms))
+    TTS_CACHE_SIZE = int(os.getenv("TTS_CACHE_SIZE", "512"))
+    # 이 길이(문자)를 넘는 문장은 반복 가능성이 낮으므로 LRU에 저장하지 않음 (메모리 상한)
+    LRU_CACHE_MAX_TEXT_LENGTH = 64
+
     # ==========================================================================
     # Parallel Processing Settings
     # ==========================================================================
     PARALLEL_WORKERS = int(os.getenv("PARALLEL_WORKERS", "8"))  # 병렬 처리 worker 수
+    # AWS 네트워크 호출(Translate/Polly) 전용 worker 수 - RTT 동안 대기만 하므로 커넥션 풀 크기까지 허용
+    AWS_IO_WORKERS = int(os.getenv("AWS_IO_WORKERS", str(AWS_MAX_POOL_CONNECTIONS)))
@@ -1,3 +1,5 @@
 from .topology import BufferingStrategy, LanguageTopology
+from .filler import is_filler_text
+from .agreement import LocalAgreement
 
-__all__ = ["BufferingStrategy", "LanguageTopology"]
+__all__ = ["BufferingStrategy", "LanguageTopology", "is_filler_text", "LocalAgreement"]
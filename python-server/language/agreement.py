@@ -0,0 +1,69 @@
+"""
+Local Agreement - 스트리밍 STT 중간 결과 확정 (whisper_streaming LocalAgreement-2)
+"""
+
+from typing import List, Tuple
+
+# 띄어쓰기가 없는 언어는 문자 단위로 비교
+CHAR_LEVEL_LANGUAGES = {"ja", "zh"}
+
+
+class LocalAgreement:
+    """
+    연속된 두 partial hypothesis의 공통 접두부만 확정(commit)
+
+    - 확정된 접두부는 다음 partial 디코딩의 prefix로 전달 → 디코더는 미확정 꼬리만 생성
+    - 발화가 끝나면(final 처리) reset()
+    """
+
+    def __init__(self, language: str = "en"):
+        self.char_level = language in CHAR_LEVEL_LANGUAGES
+        self.committed: List[str] = []
+        self._previous: List[str] = []
+
+    def _tokenize(self, text: str) -> List[str]:
+        return list(text.replace(" ", "")) if self.char_level else text.split()
+
+    def _join(self, tokens: List[str]) -> str:
+        return ("" if self.char_level else " ").join(tokens)
+
+    @property
+    def committed_text(self) -> str:
+        return self._join(self.committed)
+
+    def compose(self, continuation: str) -> str:
+        """Whisper prefix 디코딩 결과(확정부 이후 이어지는 텍스트)를 전체 hypothesis로 복원 (다른 백엔드 결과에는 사용 금지)"""
+        committed = self.committed_text
+        continuation = continuation.strip()
+        if not committed or continuation.replace(" ", "").startswith(committed.replace(" ", "")):
+            return continuation
+        return self._join([committed, continuation]) if continuation else committed
+
+    def update(self, hypothesis: str) -> Tuple[str, str]:
+        """
+        새 hypothesis 반영
+
+        Args:
+            hypothesis: 확정 접두부를 포함한 전체 partial 텍스트
+
+        Returns:
+            (committed_text, tail_text): 확정 텍스트, 미확정 꼬리
+        """
+        tokens = self._tokenize(hypothesis)
+
+        # 이전 hypothesis와 일치하는 만큼 확정 범위 확장 (이미 확정된 부분은 유지)
+        n = len(self.committed)
+        limit = min(len(tokens), len(self._previous))
+        while n < limit and tokens[n] == self._previous[n]:
+            n += 1
+        if n > len(self.committed) and tokens[:len(self.committed)] == self.committed:
+            self.committed = tokens[:n]
+
+        self._previous = tokens
+        return self.committed_text, self._join(tokens[len(self.committed):])
+
+    def reset(self, language: str = None):
+        if language is not None:
+            self.char_level = language in CHAR_LEVEL_LANGUAGES
+        self.committed = []
+        self._previous = []
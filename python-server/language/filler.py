@@ -0,0 +1,30 @@
+"""
+Filler Word Detection - 감탄사/추임새 판별
+"""
+
+import re
+
+from config.settings import Config
+
+# 망설임 소리만 구두점/공백으로 이어진 발화 ("um, uh", "嗯。", "음... 어") - 긴 문구 우선 매칭
+_FILLER_ALT = "|".join(map(re.escape, sorted(Config.HESITATION_WORDS, key=len, reverse=True)))
+_FILLER_SEQUENCE = re.compile(rf"[\W_]*(?:{_FILLER_ALT})(?:[\W_]+(?:{_FILLER_ALT}))*[\W_]*")
+# 이보다 긴 발화(대부분)는 lower()/조회/정규식 없이 바로 False
+_MAX_FILLER_SEQUENCE_LEN = 32
+
+
+def is_filler_text(text: str) -> bool:
+    """
+    텍스트 전체가 필러(추임새)인지 확인
+
+    Config.FILLER_WORDS는 소문자 frozenset이므로 strip + lower 1회, 조회 1회
+    단일 필러가 아니면 망설임 소리(HESITATION_WORDS)만 이어진 짧은 발화인지 정규식 1회로 확인
+    (응답 단어 "no." / "Well, no." 등은 실제 답변이므로 번역 대상, 부분 포함도 필러 아님)
+    """
+    text = text.strip()
+    if len(text) > _MAX_FILLER_SEQUENCE_LEN:
+        return False
+    text = text.lower()
+    if text in Config.FILLER_WORDS:
+        return True
+    return _FILLER_SEQUENCE.fullmatch(text) is not None
@@ -1,5 +1,5 @@
-from .session import Participant, Speaker, SessionState
+from .session import Participant, Speaker, SessionState, SessionRegistry
 from .async_manager import AsyncLoopManager
 from .manager import ModelManager
 
-__all__ = ["Participant", "Speaker", "SessionState", "AsyncLoopManager", "ModelManager"]
+__all__ = ["Participant", "Speaker", "SessionState", "SessionRegistry", "AsyncLoopManager", "ModelManager"]
@@ -14,23 +14,30 @@ class AsyncLoopManager:
     """
     _instance = None
     _lock = threading.Lock()
+    _init_lock = threading.Lock()
 
     def __new__(cls):
         if cls._instance is None:
             with cls._lock:
                 if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
+                    # 속성을 채운 뒤 공개 → lock 밖에서 읽는 스레드가 _initialized 없는 객체를 보지 않음
+                    instance = super().__new__(cls)
+                    instance._initialized = False
+                    cls._instance = instance
         return cls._instance
 
     def initialize(self):
         if self._initialized:
             return
 
-        self.loop = asyncio.new_event_loop()
-        self.thread = threading.Thread(target=self._run_loop, daemon=True)
-        self.thread.start()
-        self._initialized = True
+        with self._init_lock:
+            if self._initialized:
+                return
+
+            self.loop = asyncio.new_event_loop()
+            self.thread = threading.Thread(target=self._run_loop, daemon=True)
+            self.thread.start()
+            self._initialized = True
 
     def _run_loop(self):
         asyncio.set_event_loop(self.loop)
@@ -0,0 +1,110 @@
+"""
+Micro Batcher - 여러 세션의 모델 요청을 짧은 윈도우 동안 모아 한 번에 처리
+
+gRPC 스트림 도착과 모델 실행을 분리:
+- 세션 스레드는 요청을 큐에 넣고 Future를 기다림
+- worker 스레드가 윈도우 동안 요청을 모아 그룹별로 배치 실행
+"""
+
+import time
+import queue
+import threading
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Any, Callable, Dict, Hashable, List
+
+from utils.logger import DebugLogger
+
+
+class MicroBatcher:
+    """
+    요청 리배처 (STT/번역 공용)
+
+    - 첫 요청 도착 후 window_ms 동안 최대 batch_size개까지 수집
+    - _group_key()가 같은 요청끼리 run_batch 1회로 처리
+    - 배치 실패 시 요청별 run_single로 폴백
+
+    요청 객체는 결과를 받을 `future: Future` 속성을 가져야 함
+    """
+
+    def __init__(self,
+                 run_single: Callable[[Any], Any],
+                 run_batch: Callable[[List[Any]], List[Any]],
+                 batch_size: int,
+                 window_ms: int,
+                 workers: int = 1,
+                 name: str = "batch"):
+        self._run_single = run_single
+        self._run_batch = run_batch
+        self.batch_size = batch_size
+        self.window_sec = window_ms / 1000.0
+        self.log_tag = name.upper().replace("-", "_")
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+
+        self._workers = [
+            threading.Thread(target=self._worker_loop, name=f"{name}-{i}", daemon=True)
+            for i in range(max(1, workers))
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, request, timeout: float) -> Any:
+        """요청을 큐에 넣고 결과를 기다림 (호출 스레드 블로킹)"""
+        self._queue.put(request)
+        try:
+            return request.future.result(timeout=timeout)
+        except FuturesTimeoutError:
+            # 기다리는 호출자가 없으므로 아직 대기 중이면 worker가 실행하지 않도록 취소 (과부하 시 누적 방지)
+            request.future.cancel()
+            raise
+
+    def _group_key(self, request) -> Hashable:
+        """같은 배치로 묶을 수 있는 요청 구분 키 (기본: 전체 1그룹)"""
+        return None
+
+    def _collect(self) -> List[Any]:
+        """첫 요청을 기다린 뒤 윈도우 안에 도착한 요청을 추가 수집"""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.window_sec
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _worker_loop(self):
+        while True:
+            batch = self._collect()
+
+            groups: Dict[Hashable, List[Any]] = {}
+            for request in batch:
+                groups.setdefault(self._group_key(request), []).append(request)
+
+            for requests in groups.values():
+                self._execute(requests)
+
+    def _execute(self, requests: List[Any]):
+        # 타임아웃으로 취소된 요청은 제외 (남은 요청은 RUNNING 상태가 되어 더 이상 취소되지 않음)
+        requests = [request for request in requests if request.future.set_running_or_notify_cancel()]
+        if not requests:
+            return
+        try:
+            results = self._run_batch(requests)
+            if len(requests) > 1:
+                DebugLogger.log(self.log_tag, f"Batched {len(requests)} requests")
+            for request, result in zip(requests, results):
+                request.future.set_result(result)
+            return
+        except Exception as e:
+            DebugLogger.log(f"{self.log_tag}_ERROR", f"Batch failed, falling back to single: {e}")
+
+        for request in requests:
+            if request.future.done():
+                continue
+            try:
+                request.future.set_result(self._run_single(request))
+            except Exception as e:
+                request.future.set_exception(e)
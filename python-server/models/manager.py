@@ -7,17 +7,23 @@ import os
 import time
 import threading
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import torch
 import boto3
+from botocore.config import Config as BotoConfig
 
 from config.settings import Config
 from utils.logger import DebugLogger
 from cache.room_cache import RoomCacheManager
+from cache.lru_cache import LRUCache
 from models.async_manager import AsyncLoopManager
-from models.stt import STTMixin
+from audio.vad import VADProcessor
+from models.stt import STTMixin, WHISPER_BATCH_AVAILABLE, WHISPER_TRANSCRIBE_OPTIONS, WHISPER_VAD_AVAILABLE
+from models.stt_batcher import STTBatcher, WhisperRequest
 from models.translation import TranslationMixin
+from models.translation_batcher import TranslationBatcher
 from models.tts import TTSMixin
 
 # Optional imports
@@ -43,8 +49,20 @@ except ImportError:
     AMAZON_TRANSCRIBE_AVAILABLE = False
     print("[WARNING] amazon-transcribe not installed.")
 
+try:
+    import flash_attn  # noqa: F401
+    FLASH_ATTN_AVAILABLE = True
+except ImportError:
+    FLASH_ATTN_AVAILABLE = False
+
 from transformers import AutoModelForCausalLM, AutoTokenizer
 
+# 워밍업용 1초 무음 (모델별/패스별로 재할당하지 않고 공유, 읽기 전용)
+_DUMMY_WHISPER_AUDIO = np.zeros(Config.SAMPLE_RATE, dtype=np.float32)
+_DUMMY_WHISPER_AUDIO.setflags(write=False)
+_DUMMY_PCM16 = np.zeros(Config.SAMPLE_RATE, dtype=np.int16)
+_DUMMY_PCM16.setflags(write=False)
+
 
 class ModelManager(STTMixin, TranslationMixin, TTSMixin):
     """
@@ -56,19 +74,29 @@ class ModelManager(STTMixin, TranslationMixin, TTSMixin):
     """
     _instance = None
     _lock = threading.Lock()
+    _init_lock = threading.Lock()  # 수 초 걸리는 initialize() 중복 실행 방지 (_lock과 분리)
 
     def __new__(cls):
         if cls._instance is None:
             with cls._lock:
                 if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
+                    # 속성을 채운 뒤 공개 → lock 밖에서 읽는 스레드가 _initialized 없는 객체를 보지 않음
+                    instance = super().__new__(cls)
+                    instance._initialized = False
+                    cls._instance = instance
         return cls._instance
 
     def initialize(self):
         if self._initialized:
             return
 
+        with self._init_lock:
+            # 다른 스레드가 먼저 로딩을 끝냈으면 재진입하지 않음
+            if self._initialized:
+                return
+            self._load_all_models()
+
+    def _load_all_models(self):
         print("=" * 70)
         print("Loading AI Models (v10 Modular)")
         print("=" * 70)
@@ -79,66 +107,126 @@ class ModelManager(STTMixin, TranslationMixin, TTSMixin):
         self.async_manager.initialize()
         self.room_cache = RoomCacheManager()
         self.room_cache.initialize()
+        self.translation_cache = LRUCache(Config.TRANSLATION_CACHE_SIZE)
+        # 로컬 STT 모델 동시 호출 상한 (초과 세션은 sleep 대신 여기서 대기)
+        self.stt_semaphore = threading.BoundedSemaphore(Config.MAX_CONCURRENT_STT)
+        self.tts_cache = LRUCache(Config.TTS_CACHE_SIZE)
+        # 세션 간 공유하는 번역/TTS 병렬 실행용 executor
+        self.executor = ThreadPoolExecutor(max_workers=Config.PARALLEL_WORKERS, thread_name_prefix="pipeline")
+        # AWS Translate/Polly 호출 전용 executor (RTT 대기 스레드가 PARALLEL_WORKERS를 점유하지 않도록 분리)
+        self.aws_executor = ThreadPoolExecutor(max_workers=Config.AWS_IO_WORKERS, thread_name_prefix="aws-io")
         print("      ✓ Async Loop Manager & Room Cache initialized")
 
-        # 1. STT Backend - Multi-Model or Single Model
+        # AWS 클라이언트 공용 설정: 커넥션 풀 + TCP keep-alive (TLS 핸드셰이크 재사용)
+        # boto3 client는 thread-safe → 모든 세션/언어 병렬 요청이 같은 풀 공유
+        aws_config = BotoConfig(
+            max_pool_connections=Config.AWS_MAX_POOL_CONNECTIONS,
+            connect_timeout=Config.AWS_CONNECT_TIMEOUT,
+            read_timeout=Config.AWS_READ_TIMEOUT,
+            tcp_keepalive=True,
+            retries={"max_attempts": Config.AWS_MAX_ATTEMPTS, "mode": "standard"},
+        )
+        # 자격 증명 해석을 1회만 하는 명시적 session (client 생성은 thread-safe가 아니므로 메인 스레드에서)
+        self.aws_session = boto3.session.Session(region_name=Config.AWS_REGION)
+
+        # 1. Amazon Polly TTS
+        print("[1/4] Initializing Amazon Polly...")
+        self.polly_client = self.aws_session.client("polly", config=aws_config)
+        print("      ✓ Polly initialized")
+
+        # 2. AWS Translate
+        print("[2/4] Initializing AWS Translate...")
+        self.translate_client = self.aws_session.client("translate", config=aws_config)
+        print(f"      ✓ AWS Translate initialized (backend: {Config.TRANSLATION_BACKEND})")
+
+        # CUDA context는 메인 스레드에서 초기화한 뒤 로딩 스레드에서 사용
+        if Config.GPU_DEVICE == "cuda":
+            torch.cuda.init()
+
+        # STT 모델 로딩, Qwen 로딩, AWS/VAD warmup을 병렬 실행
+        # (가중치 로딩은 디스크 I/O·CUDA 복사 중 GIL 해제 → cold start ≈ 가장 느린 작업 시간)
+        print(f"[3/4] Loading STT backend ({Config.STT_BACKEND})...")
+        print(f"[4/4] Loading Qwen3 {Config.QWEN_MODEL}...")
+        load_pool = ThreadPoolExecutor(max_workers=5, thread_name_prefix="load")
+        load_futures = [
+            load_pool.submit(self._load_stt_backend),
+            load_pool.submit(self._load_qwen_model),
+            load_pool.submit(self._warmup_translate),
+            load_pool.submit(self._warmup_tts),
+            load_pool.submit(self._warmup_vad),
+        ]
+
+        for future in load_futures:
+            future.result()
+        load_pool.shutdown(wait=False)
+
+        print("=" * 70)
+        print("All models loaded successfully!")
+        print(f"STT Backend: {Config.STT_BACKEND}")
+        print(f"Translation Backend: {Config.TRANSLATION_BACKEND}")
+        print("=" * 70)
+
+        self._initialized = True
+        self._warmup()
+
+    def _load_stt_backend(self):
+        """STT Backend 로딩 - Multi-Model or Single Model (+ Whisper 리배처)"""
         self.whisper_model = None  # Legacy single model
         self.whisper_models = {}   # Language-specific Whisper models
         self.nemo_models = {}      # Language-specific NeMo models
         self.transcribe_region = Config.AWS_REGION
+        self.stt_batcher = None
+        self._whisper_tokenizers = {}
 
         if Config.STT_BACKEND == "multi":
             self._load_multi_model_stt()
 
         elif Config.STT_BACKEND == "whisper" and FASTER_WHISPER_AVAILABLE:
-            print(f"[1/4] Loading faster-whisper ({Config.WHISPER_MODEL_SIZE})...")
+            print(f"      Loading faster-whisper ({Config.WHISPER_MODEL_SIZE})...")
             print(f"      Device: {Config.WHISPER_DEVICE}, Compute: {Config.WHISPER_COMPUTE_TYPE}")
 
-            self.whisper_model = WhisperModel(
-                Config.WHISPER_MODEL_SIZE,
-                device=Config.WHISPER_DEVICE,
-                compute_type=Config.WHISPER_COMPUTE_TYPE,
-            )
+            self.whisper_model = self._create_whisper_model(Config.WHISPER_MODEL_SIZE)
             print("      ✓ faster-whisper loaded")
 
         elif Config.STT_BACKEND == "transcribe" and AMAZON_TRANSCRIBE_AVAILABLE:
-            print(f"[1/4] Initializing Amazon Transcribe Streaming...")
+            print("      Initializing Amazon Transcribe Streaming...")
             print(f"      Region: {self.transcribe_region}")
             print("      ✓ Amazon Transcribe initialized")
 
         else:
-            print("[1/4] ⚠ No STT backend available!")
+            print("      ⚠ No STT backend available!")
             print(f"      STT_BACKEND={Config.STT_BACKEND}")
             print(f"      WHISPER_AVAILABLE={FASTER_WHISPER_AVAILABLE}")
             print(f"      NEMO_AVAILABLE={NEMO_AVAILABLE}")
             print(f"      TRANSCRIBE_AVAILABLE={AMAZON_TRANSCRIBE_AVAILABLE}")
 
-        # 2. Qwen3 Translation Model
-        print(f"[2/4] Loading Qwen3 {Config.QWEN_MODEL}...")
-        self._load_qwen_model()
-
-        # 3. Amazon Polly TTS
-        print("[3/4] Initializing Amazon Polly...")
-        self.polly_client = boto3.client("polly", region_name=Config.AWS_REGION)
-        print("      ✓ Polly initialized")
-
-        # 4. AWS Translate
-        print("[4/4] Initializing AWS Translate...")
-        self.translate_client = boto3.client("translate", region_name=Config.AWS_REGION)
-        print(f"      ✓ AWS Translate initialized (backend: {Config.TRANSLATION_BACKEND})")
-
-        print("=" * 70)
-        print("All models loaded successfully!")
-        print(f"STT Backend: {Config.STT_BACKEND}")
-        print(f"Translation Backend: {Config.TRANSLATION_BACKEND}")
-        print("=" * 70)
-
-        self._initialized = True
-        self._warmup()
+        # 로컬 Whisper 요청 리배처 (세션 간 요청을 모아 배치 실행)
+        if Config.STT_BATCH_ENABLED and WHISPER_BATCH_AVAILABLE and (self.whisper_models or self.whisper_model):
+            self.stt_batcher = STTBatcher(
+                run_single=lambda r: self._transcribe_whisper(r.audio, r.model, r.language, r.audio_rms, r.prefix),
+                run_batch=self._transcribe_whisper_batch,
+            )
+            print(f"      ✓ STT batcher enabled (batch={Config.STT_BATCH_SIZE}, window={Config.STT_BATCH_WINDOW_MS}ms)")
+
+    @staticmethod
+    def _create_whisper_model(model_name: str):
+        """공통 CTranslate2 설정으로 faster-whisper 모델 생성"""
+        model = WhisperModel(
+            model_name,
+            device=Config.WHISPER_DEVICE,
+            compute_type=Config.WHISPER_COMPUTE_TYPE,
+            cpu_threads=Config.WHISPER_CPU_THREADS,
+            num_workers=Config.WHISPER_NUM_WORKERS,
+        )
+        # CT2는 하드웨어가 지원하지 않는 타입을 조용히 대체 → 실제 적용된 타입 확인
+        effective = getattr(model.model, "compute_type", Config.WHISPER_COMPUTE_TYPE)
+        if effective != Config.WHISPER_COMPUTE_TYPE:
+            print(f"      ⚠ {model_name}: compute_type {Config.WHISPER_COMPUTE_TYPE} → {effective} (unsupported on this device)")
+        return model
 
     def _load_multi_model_stt(self):
         """Load language-specific STT models (with deduplication)"""
-        print("[1/4] Loading Multi-Model STT (Language-Specific)...")
+        print("      Loading Multi-Model STT (Language-Specific)...")
         print(f"      Device: {Config.WHISPER_DEVICE}, Compute: {Config.WHISPER_COMPUTE_TYPE}")
         print()
 
@@ -161,11 +249,7 @@ class ModelManager(STTMixin, TranslationMixin, TTSMixin):
                         self.whisper_models[lang] = loaded_whisper_models[model_name]
                         print(f"           ✓ Reusing already loaded model")
                     else:
-                        model = WhisperModel(
-                            model_name,
-                            device=Config.WHISPER_DEVICE,
-                            compute_type=Config.WHISPER_COMPUTE_TYPE,
-                        )
+                        model = self._create_whisper_model(model_name)
                         loaded_whisper_models[model_name] = model
                         self.whisper_models[lang] = model
                         print(f"           ✓ Loaded (faster-whisper)")
@@ -198,11 +282,7 @@ class ModelManager(STTMixin, TranslationMixin, TTSMixin):
                 self.whisper_models["fallback"] = loaded_whisper_models[fallback_name]
                 print(f"           ✓ Reusing already loaded model")
             else:
-                self.whisper_models["fallback"] = WhisperModel(
-                    fallback_name,
-                    device=Config.WHISPER_DEVICE,
-                    compute_type=Config.WHISPER_COMPUTE_TYPE,
-                )
+                self.whisper_models["fallback"] = self._create_whisper_model(fallback_name)
                 print(f"           ✓ Loaded")
         except Exception as e:
             print(f"           ✗ Failed: {e}")
@@ -216,27 +296,37 @@ class ModelManager(STTMixin, TranslationMixin, TTSMixin):
 
     def _load_qwen_model(self):
         """Load Qwen3 translation model"""
-        self.qwen_tokenizer = AutoTokenizer.from_pretrained(
-            Config.QWEN_MODEL,
-            trust_remote_code=True
-        )
+        # Qwen3는 transformers 기본 지원 → trust_remote_code 불필요 (fused SDPA/FlashAttention 경로 사용)
+        self.qwen_tokenizer = AutoTokenizer.from_pretrained(Config.QWEN_MODEL)
+        self.qwen_compiled = False
+        self.qwen_batcher = None
+        # (source, target) → (prefix_ids, suffix_ids) 프롬프트 토큰 캐시
+        self._qwen_prompt_cache = {}
+        quantized = False
 
         if Config.GPU_DEVICE == "cuda":
             gpu_mem = torch.cuda.get_device_properties(0).total_memory / (1024**3)
             print(f"      GPU Memory: {gpu_mem:.1f}GB")
 
-            if gpu_mem >= 20:
+            # static KV cache 컴파일 경로는 SDPA 사용
+            attn_impl = "flash_attention_2" if FLASH_ATTN_AVAILABLE and not Config.QWEN_COMPILE else "sdpa"
+            print(f"      Attention: {attn_impl}")
+
+            # Ampere 이상은 bf16 (fp16 softmax overflow 경로 회피, 4-bit compute dtype도 동일)
+            half_dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+
+            if gpu_mem >= Config.QWEN_HALF_PRECISION_MIN_VRAM_GB:
                 self.qwen_model = AutoModelForCausalLM.from_pretrained(
                     Config.QWEN_MODEL,
-                    torch_dtype=torch.float16,
+                    torch_dtype=half_dtype,
                     device_map={"": 0},
-                    trust_remote_code=True,
+                    attn_implementation=attn_impl,
                 )
             else:
                 from transformers import BitsAndBytesConfig
                 quantization_config = BitsAndBytesConfig(
                     load_in_4bit=True,
-                    bnb_4bit_compute_dtype=torch.float16,
+                    bnb_4bit_compute_dtype=half_dtype,
                     bnb_4bit_use_double_quant=True,
                     bnb_4bit_quant_type="nf4",
                 )
@@ -244,19 +334,58 @@ class ModelManager(STTMixin, TranslationMixin, TTSMixin):
                     Config.QWEN_MODEL,
                     quantization_config=quantization_config,
                     device_map={"": 0},
-                    trust_remote_code=True,
+                    attn_implementation=attn_impl,
                 )
+                quantized = True
                 print("      Using 4-bit quantization (low VRAM)")
         else:
             self.qwen_model = AutoModelForCausalLM.from_pretrained(
                 Config.QWEN_MODEL,
                 torch_dtype=torch.float32,
-                trust_remote_code=True,
+                attn_implementation="sdpa",
             )
 
+        # decode 단계마다 KV cache 재사용, pad token은 generation_config에 1회 설정
+        self.qwen_model.config.use_cache = True
+        self.qwen_model.generation_config.pad_token_id = self.qwen_tokenizer.eos_token_id
         self.qwen_model.eval()
+
+        if Config.QWEN_COMPILE and Config.GPU_DEVICE == "cuda" and not quantized:
+            self._compile_qwen()
+            print("      torch.compile: reduce-overhead + static KV cache")
+
+        # 세션 간 번역 요청 리배처 (컴파일 경로는 batch=1 고정 shape이므로 제외)
+        if Config.QWEN_BATCH_ENABLED and not self.qwen_compiled:
+            self.qwen_batcher = TranslationBatcher(
+                run_single=lambda r: self._translate_qwen_single(r.text, r.source_lang, r.target_lang),
+                run_batch=self._translate_qwen_batch,
+            )
+            print(f"      ✓ Qwen batcher enabled (batch={Config.QWEN_BATCH_SIZE}, window={Config.QWEN_BATCH_WINDOW_MS}ms)")
         print("      ✓ Qwen3-8B loaded")
 
+    def _compile_qwen(self):
+        """
+        Qwen3 decode 고정 shape 실행 - static KV cache + torch.compile(CUDA graph)
+
+        토큰마다 Python/커널 launch 오버헤드 제거, 입력은 QWEN_INPUT_BUCKETS 길이로 left padding
+        """
+        self.qwen_model.generation_config.cache_implementation = "static"
+        self.qwen_model.forward = torch.compile(self.qwen_model.forward, mode="reduce-overhead", fullgraph=True)
+        self.qwen_compiled = True
+
+    def _warmup_qwen(self):
+        """입력 버킷별로 generate 1회 실행해 컴파일/CUDA graph 캡처를 서비스 전에 완료"""
+        pad_id = self.qwen_tokenizer.eos_token_id
+        for bucket in Config.QWEN_INPUT_BUCKETS:
+            input_ids = torch.full((1, bucket), pad_id, dtype=torch.long, device=self.qwen_model.device)
+            with torch.inference_mode():
+                self.qwen_model.generate(
+                    input_ids=input_ids,
+                    attention_mask=torch.ones_like(input_ids),
+                    max_new_tokens=Config.QWEN_MAX_NEW_TOKENS,
+                    do_sample=False,
+                )
+
     def _warmup(self):
         """Warmup all loaded models"""
         print("\n" + "=" * 70)
@@ -264,7 +393,14 @@ class ModelManager(STTMixin, TranslationMixin, TTSMixin):
         print("=" * 70)
 
         warmup_start = time.time()
-        dummy_audio = np.zeros(16000, dtype=np.float32)
+        dummy_audio = _DUMMY_WHISPER_AUDIO
+
+        # Qwen 그래프 캡처는 STT 워밍업과 독립 → 백그라운드에서 동시에 실행
+        qwen_future = None
+        if self.qwen_compiled:
+            qwen_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="warmup")
+            qwen_future = qwen_pool.submit(self._warmup_qwen)
+            qwen_pool.shutdown(wait=False)
 
         # 1. Multi-Model warmup (deduplicated - only warmup unique models)
         if Config.STT_BACKEND == "multi":
@@ -280,13 +416,7 @@ class ModelManager(STTMixin, TranslationMixin, TTSMixin):
 
                 try:
                     print(f"         [{lang.upper()}] Warming up Whisper...")
-                    segments, info = model.transcribe(
-                        dummy_audio,
-                        language=Config.WHISPER_LANG_CODES.get(lang, "en"),
-                        beam_size=1,
-                        vad_filter=False,
-                    )
-                    list(segments)
+                    self._warmup_whisper(model, lang, dummy_audio)
                     warmed_whisper.add(model_id)
                     print(f"         [{lang.upper()}] ✓ Whisper warmup complete")
                 except Exception as e:
@@ -304,8 +434,7 @@ class ModelManager(STTMixin, TranslationMixin, TTSMixin):
                     print(f"         [{lang.upper()}] Warming up NeMo...")
                     with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
                         temp_path = f.name
-                        audio_int16 = np.zeros(16000, dtype=np.int16)
-                        sf.write(temp_path, audio_int16, Config.SAMPLE_RATE)
+                        sf.write(temp_path, _DUMMY_PCM16, Config.SAMPLE_RATE)
                     model.transcribe([temp_path])
                     os.unlink(temp_path)
                     warmed_nemo.add(model_id)
@@ -316,39 +445,79 @@ class ModelManager(STTMixin, TranslationMixin, TTSMixin):
         elif self.whisper_model:
             print("[Warmup] faster-whisper...")
             try:
-                segments, info = self.whisper_model.transcribe(
-                    dummy_audio,
-                    language="en",
-                    beam_size=1,
-                    vad_filter=False,
-                )
-                list(segments)
+                self._warmup_whisper(self.whisper_model, "en", dummy_audio)
                 print("         ✓ faster-whisper warmup complete")
             except Exception as e:
                 print(f"         ⚠ faster-whisper warmup failed: {e}")
 
-        # 2. Translation warmup
-        if Config.TRANSLATION_BACKEND == "aws":
-            print("[Warmup] AWS Translate...")
+        if qwen_future is not None:
+            print("[Warmup] Qwen3 compiled graphs...")
             try:
-                _ = self._translate_aws("안녕하세요", "ko", "en")
-                print("         ✓ AWS Translate warmup complete")
+                qwen_future.result()
+                print(f"         ✓ {len(Config.QWEN_INPUT_BUCKETS)} input buckets captured")
             except Exception as e:
-                print(f"         ⚠ AWS Translate warmup failed: {e}")
-
-        # 3. TTS warmup
-        print("[Warmup] Amazon Polly...")
-        try:
-            _, _ = self.synthesize_speech("Hello", "en")
-            print("         ✓ TTS warmup complete")
-        except Exception as e:
-            print(f"         ⚠ TTS warmup failed: {e}")
+                print(f"         ⚠ Qwen3 warmup failed: {e}")
 
         warmup_time = time.time() - warmup_start
         print("=" * 70)
         print(f"Warmup completed in {warmup_time:.2f}s")
         print("=" * 70 + "\n")
 
+    def _warmup_whisper(self, model, lang: str, dummy_audio: np.ndarray):
+        """
+        Whisper 워밍업 - CT2 그래프/MKL 스레드 풀 초기화
+
+        여러 번 실행해 스레드 파킹 상태를 안정화하고,
+        배처 사용 시 배치 shape(encode/generate)도 미리 한 번 실행
+        """
+        for _ in range(Config.STT_WARMUP_PASSES):
+            # 실제 요청과 같은 디코딩 옵션으로 실행 (타임스탬프/conditioning 경로 차이 없이 워밍업)
+            segments, info = model.transcribe(
+                dummy_audio,
+                language=Config.WHISPER_LANG_CODES.get(lang, "en"),
+                **WHISPER_TRANSCRIBE_OPTIONS,
+            )
+            list(segments)
+
+        if self.stt_batcher is not None:
+            self._transcribe_whisper_batch([
+                WhisperRequest(audio=dummy_audio, model=model, language=lang, audio_rms=0.0)
+                for _ in range(Config.STT_BATCH_SIZE)
+            ])
+
+        # Silero VAD 모델(ONNX) 로딩을 첫 요청 전에 완료
+        if Config.WHISPER_VAD_FILTER and WHISPER_VAD_AVAILABLE:
+            self._trim_to_speech(dummy_audio)
+
+    def _warmup_translate(self):
+        """AWS Translate warmup (Qwen 로딩과 병렬 실행)"""
+        if Config.TRANSLATION_BACKEND != "aws":
+            return
+        try:
+            _ = self.translate_client.translate_text(
+                Text="안녕하세요", SourceLanguageCode="ko", TargetLanguageCode="en"
+            )
+            print("[Warmup] ✓ AWS Translate warmup complete")
+        except Exception as e:
+            print(f"[Warmup] ⚠ AWS Translate warmup failed: {e}")
+
+    def _warmup_tts(self):
+        """Amazon Polly warmup (Qwen 로딩과 병렬 실행)"""
+        try:
+            _, _ = self.synthesize_speech("Hello", "en")
+            print("[Warmup] ✓ TTS warmup complete")
+        except Exception as e:
+            print(f"[Warmup] ⚠ TTS warmup failed: {e}")
+
+    def _warmup_vad(self):
+        """WebRTC VAD warmup (Qwen 로딩과 병렬 실행)"""
+        try:
+            vad = VADProcessor()
+            vad.process_chunk(bytes(Config.BYTES_PER_SECOND))
+            print("[Warmup] ✓ VAD warmup complete")
+        except Exception as e:
+            print(f"[Warmup] ⚠ VAD warmup failed: {e}")
+
     def get_stt_display(self) -> str:
         """Get STT backend display string for logging"""
         if Config.STT_BACKEND == "multi":
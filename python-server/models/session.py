@@ -2,14 +2,21 @@
 Participant & Session Management
 """
 
+import sys
+import threading
+import weakref
 from dataclasses import dataclass, field
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Tuple
 
-from audio import VADProcessor
-from language import BufferingStrategy, LanguageTopology
+from config import Config
+from audio import VADProcessor, PCMBuffer
+from language import BufferingStrategy, LanguageTopology, LocalAgreement
 
+# 세션마다 생성되는 작은 레코드는 __slots__ 사용 (인스턴스 __dict__ 생략, Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Participant:
     """참가자 정보"""
     participant_id: str
@@ -19,7 +26,7 @@ class Participant:
     translation_enabled: bool = True
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Speaker:
     """발화자 정보"""
     participant_id: str
@@ -28,54 +35,87 @@ class Speaker:
     source_language: str
 
 
-@dataclass
+@dataclass(eq=False)
 class SessionState:
-    """세션 상태 관리"""
+    """세션 상태 관리 (eq=False: 동일성 기준 hash → WeakSet/약한 참조 인덱스에 사용)"""
     session_id: str
     room_id: str
     speaker: Speaker
     participants: Dict[str, Participant] = field(default_factory=dict)
 
     # 오디오 버퍼
-    audio_buffer: bytearray = field(default_factory=bytearray)
+    audio_buffer: PCMBuffer = field(default_factory=PCMBuffer)
     text_buffer: str = ""
 
     # VAD
     vad: VADProcessor = field(default_factory=VADProcessor)
 
+    # 세션 동안 불변인 proto (SpeakerInfo, 응답 템플릿) - 세션 초기화/스피커 변경 시에만 재생성
+    pb_speaker: Optional[object] = field(default=None, repr=False)
+    transcript_template: Optional[object] = field(default=None, repr=False)
+    audio_template: Optional[object] = field(default=None, repr=False)
+
+    # 참가자/스피커 변경용 세션 단위 락 (UpdateParticipantSettings ↔ 스트림 스레드)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    # 이 세션을 사용 중인 스트림 수 (SessionRegistry 샤드 락 하에서만 변경)
+    stream_refs: int = field(default=0, repr=False)
+
     # 현재 버퍼링 전략 (타겟 언어에 따라 다를 수 있음)
     primary_strategy: BufferingStrategy = BufferingStrategy.CHUNK_BASED
 
+    # Partial STT: 마지막 partial 시점의 버퍼 크기(bytes), 현재 발화의 transcript id
+    partial_mark: int = 0
+    utterance_id: str = ""
+    # 발화가 final 처리/폐기될 때마다 증가 (그 전에 시작된 partial 결과는 버림)
+    utterance_seq: int = 0
+    stt_agreement: LocalAgreement = field(default_factory=LocalAgreement, repr=False)
+
     # 처리 통계
+    chunks_received: int = 0
     chunks_processed: int = 0
     silence_skipped: int = 0
     sentences_completed: int = 0
 
     # Latency tracking
-    total_stt_latency_ms: float = 0
-    total_translation_latency_ms: float = 0
-    total_tts_latency_ms: float = 0
+    total_stt_latency_ms: int = 0
+    total_translation_latency_ms: int = 0
+    total_tts_latency_ms: int = 0
 
-    def get_target_languages(self) -> Set[str]:
-        """번역이 활성화된 참가자들의 타겟 언어 목록"""
-        languages = set()
+    # 타겟 언어 인덱스 캐시 (determine_primary_strategy()에서만 재계산)
+    _target_languages: Optional[Tuple[str, ...]] = field(default=None, repr=False)
+    _participants_by_lang: Dict[str, List[str]] = field(default_factory=dict, repr=False)
+
+    def _rebuild_target_index(self):
+        """참가자 목록에서 타겟 언어 / 언어별 참가자 인덱스 재계산"""
+        participants_by_lang: Dict[str, List[str]] = {}
         for p in self.participants.values():
-            if p.translation_enabled and p.target_language != self.speaker.source_language:
-                languages.add(p.target_language)
-        return languages
+            if p.translation_enabled:
+                participants_by_lang.setdefault(p.target_language, []).append(p.participant_id)
+
+        source_lang = self.speaker.source_language
+        self._participants_by_lang = participants_by_lang
+        self._target_languages = tuple(lang for lang in participants_by_lang if lang != source_lang)
+
+    def get_target_languages(self) -> Tuple[str, ...]:
+        """번역이 활성화된 참가자들의 타겟 언어 목록 (참가자 순서, 중복 없음)"""
+        if self._target_languages is None:
+            self._rebuild_target_index()
+        return self._target_languages
 
     def get_participants_by_target_language(self, target_lang: str) -> List[str]:
         """특정 타겟 언어를 원하는 참가자 ID 목록"""
-        return [
-            p.participant_id for p in self.participants.values()
-            if p.translation_enabled and p.target_language == target_lang
-        ]
+        if self._target_languages is None:
+            self._rebuild_target_index()
+        return self._participants_by_lang.get(target_lang, [])
 
     def determine_primary_strategy(self) -> BufferingStrategy:
         """
         모든 타겟 언어를 고려하여 주요 버퍼링 전략 결정
         하나라도 SENTENCE_BASED가 필요하면 SENTENCE_BASED 사용
+
+        참가자/스피커 변경 시 호출되므로 타겟 언어 인덱스도 여기서 갱신
         """
+        self._rebuild_target_index()
         source_lang = self.speaker.source_language
 
         for target_lang in self.get_target_languages():
@@ -86,3 +126,91 @@ class SessionState:
 
         self.primary_strategy = BufferingStrategy.CHUNK_BASED
         return self.primary_strategy
+
+
+class SessionRegistry:
+    """
+    세션 저장소 (샤딩)
+
+    - session_id 해시로 샤드를 나누고 샤드별 락 사용 → 단일 락 경합 제거
+    - room_id → 세션 인덱스로 방 단위 조회 시 전체 세션 스캔 불필요
+    - 스트림 종료 시 discard()로 명시적 제거 (재접속 스트림이 이어받은 세션은 유지)
+    - 약한 참조만 보관 → discard 누락 시(중간 예외 등)에도 마지막 참조가 사라지면 제거되는 backstop
+    """
+
+    def __init__(self, num_shards: int = Config.SESSION_SHARDS):
+        self._shards = [(threading.Lock(), weakref.WeakValueDictionary()) for _ in range(num_shards)]
+        self._rooms: Dict[str, "weakref.WeakSet[SessionState]"] = {}
+        self._rooms_lock = threading.Lock()
+
+    def _shard(self, session_id: str):
+        return self._shards[hash(session_id) % len(self._shards)]
+
+    def get(self, session_id: str) -> Optional[SessionState]:
+        lock, sessions = self._shard(session_id)
+        with lock:
+            return sessions.get(session_id)
+
+    def add(self, state: SessionState):
+        """새 세션 등록 (등록한 스트림이 첫 참조)"""
+        lock, sessions = self._shard(state.session_id)
+        with lock:
+            state.stream_refs = 1
+            sessions[state.session_id] = state
+        with self._rooms_lock:
+            self._rooms.setdefault(state.room_id, weakref.WeakSet()).add(state)
+
+    def remove(self, session_id: str) -> Optional[SessionState]:
+        """명시적 세션 종료 (session_end)"""
+        lock, sessions = self._shard(session_id)
+        with lock:
+            state = sessions.pop(session_id, None)
+        if state is not None:
+            self._discard_from_room(state)
+        return state
+
+    def attach(self, state: SessionState):
+        """기존 세션을 이어받는 스트림 추가 (재접속)"""
+        lock, _ = self._shard(state.session_id)
+        with lock:
+            state.stream_refs += 1
+
+    def discard(self, state: SessionState) -> bool:
+        """
+        스트림 종료 시 세션 참조 해제 - 마지막 스트림이고 등록된 세션이 state 자신일 때만 제거
+
+        같은 세션을 이어받은 재접속 스트림이 있거나, 같은 session_id로 새 세션이 등록됐다면 그 세션은 유지
+        """
+        lock, sessions = self._shard(state.session_id)
+        with lock:
+            state.stream_refs = max(0, state.stream_refs - 1)
+            if state.stream_refs:
+                return False
+            removed = sessions.get(state.session_id) is state
+            if removed:
+                del sessions[state.session_id]
+        # 레지스트리에서 이미 교체/제거된 세션도 방 인덱스에서는 제거
+        self._discard_from_room(state)
+        return removed
+
+    def _discard_from_room(self, state: SessionState):
+        with self._rooms_lock:
+            room = self._rooms.get(state.room_id)
+            if room is not None:
+                room.discard(state)
+                if not room:
+                    del self._rooms[state.room_id]
+
+    def sessions_in_room(self, room_id: str) -> List[SessionState]:
+        """방에 속한 세션 목록 (O(방 내 세션 수))"""
+        with self._rooms_lock:
+            room = self._rooms.get(room_id)
+            if room is None:
+                return []
+            states = list(room)
+            if not states:
+                del self._rooms[room_id]
+        return states
+
+    def __len__(self) -> int:
+        return sum(len(sessions) for _, sessions in self._shards)
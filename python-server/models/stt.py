@@ -5,14 +5,17 @@ Multi-model support: NeMo, faster-whisper, Amazon Transcribe
 
 import os
 import re
+import math
 import time
 import asyncio
 import tempfile
-from typing import Tuple, List
+import threading
+from typing import Tuple, List, Optional
 
 import numpy as np
 
 from config.settings import Config
+from models.stt_batcher import WhisperRequest
 from utils.logger import DebugLogger
 
 # Optional imports
@@ -22,6 +25,19 @@ try:
 except ImportError:
     SOUNDFILE_AVAILABLE = False
 
+try:
+    from faster_whisper.audio import pad_or_trim
+    from faster_whisper.tokenizer import Tokenizer as WhisperTokenizer
+    WHISPER_BATCH_AVAILABLE = True
+except ImportError:
+    WHISPER_BATCH_AVAILABLE = False
+
+try:
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+    WHISPER_VAD_AVAILABLE = True
+except ImportError:
+    WHISPER_VAD_AVAILABLE = False
+
 try:
     from amazon_transcribe.client import TranscribeStreamingClient
     from amazon_transcribe.handlers import TranscriptResultStreamHandler
@@ -31,6 +47,57 @@ except ImportError:
     AMAZON_TRANSCRIBE_AVAILABLE = False
 
 
+# 무음 스킵 기준 (RMS 0.001의 제곱 → sqrt 없이 비교)
+_SILENCE_MEAN_SQUARE = 0.001 ** 2
+
+# faster-whisper transcribe 고정 옵션 (호출마다 dict/list 재생성 없이 재사용, 호출별로는 language/prefix만 전달)
+WHISPER_TRANSCRIBE_OPTIONS = dict(
+    beam_size=Config.WHISPER_BEAM_SIZE,
+    temperature=Config.WHISPER_TEMPERATURE,
+    # 입력은 이미 VADProcessor(WebRTC)로 음성 프레임만 남긴 상태, Silero VAD는 필요 시 _trim_to_speech()에서 1회만
+    vad_filter=False,
+    # 스트리밍 greedy: 이전 텍스트 conditioning/타임스탬프 토큰 미사용 (temperature 단일값 → fallback 재디코딩 없음)
+    condition_on_previous_text=False,
+    without_timestamps=True,
+    word_timestamps=False,
+    suppress_blank=True,
+    suppress_tokens=[-1],
+    no_speech_threshold=0.6,
+    log_prob_threshold=-0.8,
+    compression_ratio_threshold=2.0,
+)
+
+# WHISPER_VAD_FILTER 사용 시 Whisper 호출 전에 1회 실행하는 Silero VAD 설정 (단일/배치 경로 공통)
+_WHISPER_VAD_OPTIONS = (
+    VadOptions(min_silence_duration_ms=200, speech_pad_ms=100) if WHISPER_VAD_AVAILABLE else None
+)
+
+
+# 스레드별 PCM 변환용 scratch 버퍼 (요청마다 float32/int16 임시 배열 할당 방지)
+_pcm_scratch = threading.local()
+
+
+def _to_pcm16(audio_data: np.ndarray, scale: float) -> np.ndarray:
+    """
+    float32 [-1, 1] → int16 PCM 변환 (스레드별 재사용 버퍼에 in-place 연산)
+
+    반환 배열은 같은 스레드의 다음 호출 전까지만 유효
+    """
+    n = len(audio_data)
+    f32 = getattr(_pcm_scratch, "f32", None)
+    if f32 is None or len(f32) < n:
+        capacity = max(n, Config.SENTENCE_MAX_BYTES // Config.BYTES_PER_SAMPLE)
+        f32 = _pcm_scratch.f32 = np.empty(capacity, dtype=np.float32)
+        _pcm_scratch.i16 = np.empty(capacity, dtype=np.int16)
+
+    tmp = f32[:n]
+    out = _pcm_scratch.i16[:n]
+    np.multiply(audio_data, scale, out=tmp)
+    np.clip(tmp, -32768, 32767, out=tmp)
+    np.copyto(out, tmp, casting="unsafe")
+    return out
+
+
 class STTMixin:
     """STT 관련 메서드를 제공하는 Mixin 클래스"""
 
@@ -115,12 +182,12 @@ class STTMixin:
 
         return False
 
-    async def _transcribe_streaming(self, audio_bytes: bytes, language_code: str) -> Tuple[str, float]:
+    async def _transcribe_streaming(self, audio_bytes: memoryview, language_code: str) -> Tuple[str, float]:
         """
         Amazon Transcribe Streaming을 사용한 음성 전사
 
         Args:
-            audio_bytes: int16 PCM audio bytes
+            audio_bytes: int16 PCM byte view (청크 단위로만 bytes 변환)
             language_code: Amazon Transcribe 언어 코드 (예: "ko-KR", "en-US")
 
         Returns:
@@ -146,7 +213,8 @@ class STTMixin:
                             conf = alt.confidence if hasattr(alt, 'confidence') and alt.confidence else 0.95
                             if text:
                                 self.transcripts.append((text, conf))
-                                DebugLogger.log("TRANSCRIBE", f"Segment: {text[:50]}", {"conf": f"{conf:.2f}"})
+                                if DebugLogger.enabled("TRANSCRIBE"):
+                                    DebugLogger.log("TRANSCRIBE", f"Segment: {text[:50]}", {"conf": f"{conf:.2f}"})
 
         try:
             stream = await client.start_stream_transcription(
@@ -160,17 +228,15 @@ class STTMixin:
             chunk_size = 8192
             async def send_audio():
                 for i in range(0, len(audio_bytes), chunk_size):
-                    chunk = audio_bytes[i:i + chunk_size]
+                    chunk = audio_bytes[i:i + chunk_size].tobytes()
                     await stream.input_stream.send_audio_event(audio_chunk=chunk)
                 await stream.input_stream.end_stream()
 
             await asyncio.gather(send_audio(), handler.handle_events())
 
             if handler.transcripts:
-                texts = [t[0] for t in handler.transcripts]
-                confidences = [t[1] for t in handler.transcripts]
-                full_text = " ".join(texts)
-                avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+                full_text = " ".join(text for text, _ in handler.transcripts)
+                avg_confidence = sum(conf for _, conf in handler.transcripts) / len(handler.transcripts)
                 return full_text, avg_confidence
             else:
                 return "", 0.0
@@ -199,10 +265,11 @@ class STTMixin:
             # NeMo requires audio file input
             with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
                 temp_path = f.name
-                audio_int16 = (audio_data * 32767).clip(-32768, 32767).astype(np.int16)
+                audio_int16 = _to_pcm16(audio_data, 32767.0)
                 sf.write(temp_path, audio_int16, Config.SAMPLE_RATE)
 
-            transcriptions = model.transcribe([temp_path])
+            with self.stt_semaphore:
+                transcriptions = model.transcribe([temp_path])
             os.unlink(temp_path)
 
             if transcriptions and len(transcriptions) > 0:
@@ -222,7 +289,8 @@ class STTMixin:
             DebugLogger.log("STT_ERROR", f"NeMo transcription failed: {e}")
             return "", 0.0
 
-    def _transcribe_whisper(self, audio_data: np.ndarray, model, language: str, audio_rms: float) -> Tuple[str, float]:
+    def _transcribe_whisper(self, audio_data: np.ndarray, model, language: str, audio_rms: float,
+                            prefix: Optional[str] = None) -> Tuple[str, float]:
         """
         Transcribe using faster-whisper model
 
@@ -231,53 +299,45 @@ class STTMixin:
             model: WhisperModel instance
             language: Language code
             audio_rms: Pre-computed RMS for hallucination detection
+            prefix: 이미 확정된 partial 텍스트 (디코더에 강제 입력, 이후 토큰만 생성)
 
         Returns:
             (text, confidence)
         """
         whisper_lang = Config.WHISPER_LANG_CODES.get(language, "en")
 
-        segments, info = model.transcribe(
-            audio_data,
-            language=whisper_lang,
-            beam_size=Config.WHISPER_BEAM_SIZE,
-            best_of=Config.WHISPER_BEST_OF,
-            temperature=Config.WHISPER_TEMPERATURE,
-            vad_filter=True,
-            vad_parameters=dict(
-                min_silence_duration_ms=200,
-                speech_pad_ms=100,
-            ),
-            condition_on_previous_text=False,
-            without_timestamps=True,
-            suppress_blank=True,
-            suppress_tokens=[-1],
-            no_speech_threshold=0.6,
-            log_prob_threshold=-0.8,
-            compression_ratio_threshold=2.0,
-        )
-
         texts = []
         max_no_speech_prob = 0.0
 
-        for segment in segments:
-            segment_text = segment.text.strip()
-            max_no_speech_prob = max(max_no_speech_prob, segment.no_speech_prob)
+        # 로컬 모델 동시 실행 수 제한 (segments는 lazy generator → 순회까지 포함)
+        with self.stt_semaphore:
+            segments, info = model.transcribe(
+                audio_data, language=whisper_lang, prefix=prefix, **WHISPER_TRANSCRIBE_OPTIONS
+            )
+
+            for segment in segments:
+                segment_text = segment.text.strip()
+                max_no_speech_prob = max(max_no_speech_prob, segment.no_speech_prob)
 
-            if segment.no_speech_prob > 0.6:
-                continue
+                if segment.no_speech_prob > 0.6:
+                    continue
 
-            if self._is_audio_artifact(segment_text):
-                continue
+                if self._is_audio_artifact(segment_text):
+                    continue
 
-            if segment_text:
-                texts.append(segment_text)
+                if segment_text:
+                    texts.append(segment_text)
 
-        result_text = " ".join(texts).strip()
+        # 각 segment는 strip + 빈 문자열 제외 후 추가 → join 결과에 추가 strip 불필요
+        result_text = " ".join(texts)
         confidence = info.language_probability if info.language_probability else 0.95
 
-        # Hallucination detection
-        if self._is_likely_hallucination(result_text, audio_rms, max_no_speech_prob):
+        return self._finalize_whisper_text(result_text, confidence, audio_rms, max_no_speech_prob)
+
+    def _finalize_whisper_text(self, result_text: str, confidence: float, audio_rms: float,
+                               no_speech_prob: float) -> Tuple[str, float]:
+        """Hallucination / artifact 필터 (단일/배치 경로 공통)"""
+        if self._is_likely_hallucination(result_text, audio_rms, no_speech_prob):
             return "", 0.0
 
         if result_text and self._is_audio_artifact(result_text):
@@ -285,42 +345,162 @@ class STTMixin:
 
         return result_text, confidence
 
-    def transcribe(self, audio_data: np.ndarray, language: str) -> Tuple[str, float]:
+    def _whisper_tokenizer(self, model, language: str):
+        """(모델, 언어)별 faster-whisper Tokenizer (최초 1회 생성 후 재사용)"""
+        key = (id(model), language)
+        tokenizer = self._whisper_tokenizers.get(key)
+        if tokenizer is None:
+            tokenizer = WhisperTokenizer(
+                model.hf_tokenizer,
+                model.model.is_multilingual,
+                task="transcribe",
+                language=Config.WHISPER_LANG_CODES.get(language, "en"),
+            )
+            self._whisper_tokenizers[key] = tokenizer
+        return tokenizer
+
+    def _transcribe_whisper_batch(self, requests: List[WhisperRequest]) -> List[Tuple[str, float]]:
+        """
+        같은 Whisper 모델의 여러 요청을 encode + generate 1회로 처리 (STTBatcher worker에서 호출)
+
+        - 요청별 30초 패딩 mel을 (batch, n_mels, 3000)으로 쌓아 인코더 1회
+        - 요청별 prompt(SOT + 언어 + notimestamps + prefix)로 디코더 배치 실행
+        """
+        model = requests[0].model
+        features = np.stack([
+            r.features if r.features is not None else self._whisper_features(model, r.audio)
+            for r in requests
+        ])
+
+        prompts = []
+        tokenizers = []
+        for request in requests:
+            tokenizer = self._whisper_tokenizer(model, request.language)
+            prompt = list(tokenizer.sot_sequence) + [tokenizer.no_timestamps]
+            if request.prefix:
+                prompt.extend(tokenizer.encode(" " + request.prefix.strip()))
+            prompts.append(prompt)
+            tokenizers.append(tokenizer)
+
+        with self.stt_semaphore:
+            encoder_output = model.encode(features)
+            results = model.model.generate(
+                encoder_output,
+                prompts,
+                beam_size=Config.WHISPER_BEAM_SIZE,
+                return_scores=True,
+                return_no_speech_prob=True,
+                suppress_blank=True,
+                suppress_tokens=[-1],
+            )
+
+        outputs = []
+        for request, tokenizer, result in zip(requests, tokenizers, results):
+            text = tokenizer.decode(result.sequences_ids[0]).strip()
+            if result.no_speech_prob > 0.6 or self._is_audio_artifact(text):
+                text = ""
+            # 언어를 지정하므로 language_probability는 1.0 (단일 경로와 동일)
+            outputs.append(self._finalize_whisper_text(text, 1.0, request.audio_rms, result.no_speech_prob))
+        return outputs
+
+    @staticmethod
+    def _whisper_features(model, audio_data: np.ndarray) -> np.ndarray:
+        """log-mel 특징 (n_mels, 3000) - 30초 패딩"""
+        return pad_or_trim(model.feature_extractor(audio_data))
+
+    @staticmethod
+    def _trim_to_speech(audio_data: np.ndarray) -> np.ndarray:
+        """
+        Silero VAD로 음성 구간만 이어붙임 (무음 구간만큼 인코더 입력 감소)
+
+        Returns:
+            음성 구간 배열 (음성이 없으면 빈 배열)
+        """
+        timestamps = get_speech_timestamps(audio_data, _WHISPER_VAD_OPTIONS)
+        if not timestamps:
+            return audio_data[:0]
+        if len(timestamps) == 1:
+            return audio_data[timestamps[0]["start"]:timestamps[0]["end"]]
+        return np.concatenate([audio_data[t["start"]:t["end"]] for t in timestamps])
+
+    def uses_whisper_stt(self, language: str) -> bool:
+        """
+        transcribe()가 이 언어를 Whisper로 처리하는지 (transcribe()의 백엔드 라우팅과 동일한 기준)
+
+        prefix는 Whisper 디코더에만 전달되므로, NeMo/Amazon Transcribe는 확정 접두부 없이 발화 전체를 반환
+        """
+        if Config.STT_BACKEND == "multi":
+            return language not in self.nemo_models and (
+                language in self.whisper_models or "fallback" in self.whisper_models
+            )
+        if Config.STT_BACKEND == "transcribe" and AMAZON_TRANSCRIBE_AVAILABLE:
+            return False
+        return bool(self.whisper_model)
+
+    def _run_whisper(self, audio_data: np.ndarray, model, language: str, audio_rms: float,
+                     prefix: Optional[str] = None) -> Tuple[str, float]:
+        """Whisper 실행 - 배처가 있으면 다른 세션 요청과 묶어서 처리"""
+        if Config.WHISPER_VAD_FILTER and WHISPER_VAD_AVAILABLE:
+            # transcribe(vad_filter=True) 대신 호출 전 1회 실행 → 배치 경로에도 적용, 음성 없으면 모델 호출 생략
+            audio_data = self._trim_to_speech(audio_data)
+            if len(audio_data) == 0:
+                DebugLogger.log("STT_SKIP", "No speech after Silero VAD")
+                return "", 0.0
+
+        if self.stt_batcher is not None:
+            # mel 계산은 호출 스레드에서 (세션 간 병렬), 실패 시 worker에서 재시도/폴백
+            try:
+                features = self._whisper_features(model, audio_data)
+            except Exception:
+                features = None
+            return self.stt_batcher.transcribe(
+                WhisperRequest(audio=audio_data, model=model, language=language, audio_rms=audio_rms,
+                               prefix=prefix, features=features)
+            )
+        return self._transcribe_whisper(audio_data, model, language, audio_rms, prefix)
+
+    def transcribe(self, audio_data: np.ndarray, language: str, prefix: Optional[str] = None,
+                   pcm16: Optional[np.ndarray] = None) -> Tuple[str, float]:
         """
         Speech to Text - Routes to appropriate model based on language and backend
 
         Args:
             audio_data: float32 normalized audio array [-1, 1]
             language: Language code (ko, en, ja, zh, etc.)
+            prefix: 스트리밍 partial의 확정 접두 텍스트 (Whisper 경로만 사용)
+            pcm16: audio_data의 원본 int16 PCM (있으면 Transcribe 경로에서 float32 → int16 재변환 생략)
 
         Returns:
             (text, confidence)
         """
-        start_time = time.time()
+        start_time = time.monotonic_ns()
 
         DebugLogger.stt_start(len(audio_data) * 4, language)
 
-        # Audio validation
-        audio_rms = np.sqrt(np.mean(audio_data ** 2))
+        # Audio validation (제곱 임시 배열 없이 내적 1회, 무음 판정은 제곱 평균으로 비교)
+        mean_square = float(np.dot(audio_data, audio_data)) / len(audio_data) if len(audio_data) else 0.0
+        audio_rms = math.sqrt(mean_square)
         audio_duration = len(audio_data) / Config.SAMPLE_RATE
 
-        DebugLogger.log("STT_AUDIO", f"Audio analysis", {
-            "samples": len(audio_data),
-            "duration_sec": f"{audio_duration:.2f}",
-            "rms": f"{audio_rms:.4f}",
-            "max": f"{np.max(np.abs(audio_data)):.4f}",
-            "language": language,
-            "backend": Config.STT_BACKEND
-        })
+        # peak(np.abs 전체 순회)는 로그 출력 시에만 계산
+        if DebugLogger.enabled("STT_AUDIO"):
+            DebugLogger.log("STT_AUDIO", f"Audio analysis", {
+                "samples": len(audio_data),
+                "duration_sec": f"{audio_duration:.2f}",
+                "rms": f"{audio_rms:.4f}",
+                "max": f"{np.max(np.abs(audio_data)):.4f}",
+                "language": language,
+                "backend": Config.STT_BACKEND
+            })
 
         # Skip if audio is too quiet
-        if audio_rms < 0.001:
-            DebugLogger.log("STT_SKIP", "Silence detected", {"rms": f"{audio_rms:.6f}"})
+        if mean_square < _SILENCE_MEAN_SQUARE:
+            DebugLogger.log_lazy("STT_SKIP", "Silence detected", lambda: {"rms": f"{audio_rms:.6f}"})
             return "", 0.0
 
         # Skip if audio is too short
         if audio_duration < Config.MIN_AUDIO_DURATION:
-            DebugLogger.log("STT_SKIP", "Audio too short", {"duration": f"{audio_duration:.2f}"})
+            DebugLogger.log_lazy("STT_SKIP", "Audio too short", lambda: {"duration": f"{audio_duration:.2f}"})
             return "", 0.0
 
         try:
@@ -331,18 +511,21 @@ class STTMixin:
             if Config.STT_BACKEND == "multi":
                 if language in self.nemo_models:
                     model = self.nemo_models[language]
-                    DebugLogger.log("STT_ROUTE", f"Using NeMo model for {language}")
+                    if DebugLogger.enabled("STT_ROUTE"):
+                        DebugLogger.log("STT_ROUTE", f"Using NeMo model for {language}")
                     result_text, confidence = self._transcribe_nemo(audio_data, model, language)
 
                 elif language in self.whisper_models:
                     model = self.whisper_models[language]
-                    DebugLogger.log("STT_ROUTE", f"Using Whisper model for {language}: {Config.MULTI_MODEL_STT[language]['model']}")
-                    result_text, confidence = self._transcribe_whisper(audio_data, model, language, audio_rms)
+                    if DebugLogger.enabled("STT_ROUTE"):
+                        DebugLogger.log("STT_ROUTE", f"Using Whisper model for {language}: {Config.MULTI_MODEL_STT[language]['model']}")
+                    result_text, confidence = self._run_whisper(audio_data, model, language, audio_rms, prefix)
 
                 elif "fallback" in self.whisper_models:
                     model = self.whisper_models["fallback"]
-                    DebugLogger.log("STT_ROUTE", f"Using fallback model for {language}")
-                    result_text, confidence = self._transcribe_whisper(audio_data, model, language, audio_rms)
+                    if DebugLogger.enabled("STT_ROUTE"):
+                        DebugLogger.log("STT_ROUTE", f"Using fallback model for {language}")
+                    result_text, confidence = self._run_whisper(audio_data, model, language, audio_rms, prefix)
 
                 else:
                     DebugLogger.log("STT_ERROR", f"No model available for language: {language}")
@@ -351,10 +534,13 @@ class STTMixin:
             # ===== Amazon Transcribe Backend =====
             elif Config.STT_BACKEND == "transcribe" and AMAZON_TRANSCRIBE_AVAILABLE:
                 transcribe_lang = Config.TRANSCRIBE_LANG_CODES.get(language, "en-US")
-                DebugLogger.log("STT_LANG", f"Using Amazon Transcribe: {transcribe_lang}")
+                if DebugLogger.enabled("STT_LANG"):
+                    DebugLogger.log("STT_LANG", f"Using Amazon Transcribe: {transcribe_lang}")
 
-                audio_int16 = (audio_data * 32768).clip(-32768, 32767).astype(np.int16)
-                audio_bytes = audio_int16.tobytes()
+                # tobytes() 전체 복사 없이 int16 배열의 byte view 전달 (호출 스레드는 결과까지 블로킹 → scratch 유효)
+                if pcm16 is None:
+                    pcm16 = _to_pcm16(audio_data, 32768.0)
+                audio_bytes = memoryview(pcm16).cast("B")
 
                 result_text, confidence = self.async_manager.run_async(
                     self._transcribe_streaming(audio_bytes, transcribe_lang),
@@ -364,19 +550,20 @@ class STTMixin:
             # ===== faster-whisper Backend (Single Model) =====
             elif self.whisper_model:
                 whisper_lang = Config.WHISPER_LANG_CODES.get(language, "en")
-                DebugLogger.log("STT_LANG", f"Using faster-whisper: {whisper_lang}")
-                result_text, confidence = self._transcribe_whisper(audio_data, self.whisper_model, language, audio_rms)
+                if DebugLogger.enabled("STT_LANG"):
+                    DebugLogger.log("STT_LANG", f"Using faster-whisper: {whisper_lang}")
+                result_text, confidence = self._run_whisper(audio_data, self.whisper_model, language, audio_rms, prefix)
 
             else:
                 DebugLogger.log("STT_ERROR", "No STT backend available")
                 return "", 0.0
 
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.monotonic_ns() - start_time) // 1_000_000
 
             if result_text:
                 DebugLogger.stt_result(result_text, confidence, latency_ms)
             else:
-                DebugLogger.log("STT_EMPTY", f"No valid text detected", {"latency_ms": f"{latency_ms:.0f}"})
+                DebugLogger.log_lazy("STT_EMPTY", "No valid text detected", lambda: {"latency_ms": f"{latency_ms:.0f}"})
 
             return result_text, confidence
 
@@ -0,0 +1,50 @@
+"""
+STT Batcher - 여러 세션의 Whisper 요청을 모아 한 번에 처리하는 리배처
+"""
+
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from config.settings import Config
+from models.batcher import MicroBatcher
+
+
+@dataclass
+class WhisperRequest:
+    """배치 대기 중인 Whisper 전사 요청"""
+    audio: np.ndarray
+    model: object
+    language: str
+    audio_rms: float
+    prefix: Optional[str] = None
+    features: Optional[np.ndarray] = None  # 제출 스레드에서 미리 계산한 30초 패딩 mel
+    future: Future = field(default_factory=Future, repr=False)
+
+
+class STTBatcher(MicroBatcher):
+    """
+    Whisper 요청 리배처
+
+    - 첫 요청 도착 후 STT_BATCH_WINDOW_MS 동안 최대 STT_BATCH_SIZE개까지 수집
+    - mel 특징은 제출한 세션 스레드에서 병렬 계산 → worker는 encode/generate만 수행
+    - 같은 모델 인스턴스 요청은 run_batch 1회로 처리 (1개여도 미리 계산한 mel 재사용)
+    - 배치 실패 시 요청별 run_single로 폴백
+    """
+
+    def __init__(self,
+                 run_single: Callable[[WhisperRequest], Tuple[str, float]],
+                 run_batch: Callable[[List[WhisperRequest]], List[Tuple[str, float]]],
+                 batch_size: int = Config.STT_BATCH_SIZE,
+                 window_ms: int = Config.STT_BATCH_WINDOW_MS,
+                 workers: int = Config.WHISPER_NUM_WORKERS):
+        super().__init__(run_single, run_batch, batch_size, window_ms, workers, name="stt-batch")
+
+    def transcribe(self, request: WhisperRequest, timeout: float = Config.STT_TIMEOUT) -> Tuple[str, float]:
+        """요청을 큐에 넣고 결과를 기다림 (호출 스레드 블로킹)"""
+        return self.submit(request, timeout)
+
+    def _group_key(self, request: WhisperRequest):
+        return id(request.model)
@@ -3,11 +3,48 @@ Translation Mixin
 AWS Translate and Qwen3 LLM support
 """
 
+import re
 import time
+import threading
+from typing import List, Tuple
+
 import torch
 
 from config.settings import Config
 from utils.logger import DebugLogger
+from models.translation_batcher import TranslationRequest
+
+# LLM 출력의 안내 접두어 (대소문자 무시, 연속으로 붙은 경우도 한 번에 제거)
+_TRANSLATION_PREFIX_RE = re.compile(
+    r"^(?:\s*(?:here is the translation|here's the translation|translation|the translation is|translated text)\s*:)+\s*",
+    re.IGNORECASE,
+)
+# Qwen 번역 프롬프트 ("Text:" 뒤 공백은 원문 토큰 쪽에 붙여 BPE 경계를 원래 프롬프트와 맞춤)
+_QWEN_PROMPT = """Translate this {source_name} text to {target_name}.
+Rules:
+- Output ONLY the {target_name} translation
+- Do NOT include the original text
+- Do NOT add explanations
+
+Text:{text}
+
+{target_name} translation:"""
+_TEXT_SENTINEL = "\x00TEXT\x00"
+
+# 같은 종류의 따옴표로 감싼 전체 문자열
+_WRAPPING_QUOTES_RE = re.compile(r"^([\"'])(.*)\1$", re.DOTALL)
+
+# 스레드별 Qwen 입력 host 버퍼 (CUDA는 pinned → non_blocking H2D 복사, 요청마다 pageable 텐서 생성 방지)
+_qwen_host_buffers = threading.local()
+
+
+def _nonempty_lines(text: str):
+    """앞에서부터 비어있지 않은 줄을 strip해서 하나씩 반환 (전체 split 없이 필요한 만큼만 partition)"""
+    while text:
+        line, _, text = text.partition("\n")
+        line = line.strip()
+        if line:
+            yield line
 
 
 class TranslationMixin:
@@ -25,12 +62,25 @@ class TranslationMixin:
         Returns:
             Translated text
         """
-        if not text.strip():
+        stripped = text.strip()
+        if not stripped:
             return ""
         if source_lang == target_lang:
             return text
 
-        start_time = time.time()
+        # 한 글자 / 구두점뿐인 입력은 모델 호출 없이 스킵
+        if len(stripped) < 2 or not any(ch.isalnum() for ch in stripped):
+            return ""
+
+        # 반복 문구는 LRU 캐시에서 즉시 반환
+        cache_key = (stripped.casefold(), source_lang, target_lang)
+        cached = self.translation_cache.get(cache_key)
+        if cached is not None:
+            if DebugLogger.enabled("TRANS_CACHE"):
+                DebugLogger.log("TRANS_CACHE", f"LRU hit {source_lang}→{target_lang}")
+            return cached
+
+        start_time = time.monotonic_ns()
         DebugLogger.translation_start(text, source_lang, target_lang)
 
         if Config.TRANSLATION_BACKEND == "aws":
@@ -38,9 +88,13 @@ class TranslationMixin:
         else:
             result = self._translate_qwen(text, source_lang, target_lang)
 
-        latency_ms = (time.time() - start_time) * 1000
+        latency_ms = (time.monotonic_ns() - start_time) // 1_000_000
         DebugLogger.translation_result(result, source_lang, target_lang, latency_ms)
 
+        # 실패(빈 결과)와 긴 문장은 캐시하지 않음
+        if result and len(stripped) <= Config.LRU_CACHE_MAX_TEXT_LENGTH:
+            self.translation_cache.put(cache_key, result)
+
         return result
 
     def _translate_aws(self, text: str, source_lang: str, target_lang: str) -> str:
@@ -71,55 +125,128 @@ class TranslationMixin:
         Translate using Qwen3-8B LLM
 
         Local inference, useful when AWS is not available.
+        동시 요청은 리배처가 모아 generate 1회로 처리
         """
-        source_name = Config.LANGUAGE_NAMES.get(source_lang, "English")
-        target_name = Config.LANGUAGE_NAMES.get(target_lang, "English")
-
         try:
-            prompt = f"""Translate this {source_name} text to {target_name}.
-Rules:
-- Output ONLY the {target_name} translation
-- Do NOT include the original text
-- Do NOT add explanations
+            if self.qwen_batcher is not None:
+                return self.qwen_batcher.translate(TranslationRequest(text, source_lang, target_lang))
+            return self._translate_qwen_single(text, source_lang, target_lang)
+
+        except Exception as e:
+            DebugLogger.log("TRANS_ERROR", f"Qwen translation failed: {e}")
+            return ""
 
-Text: {text}
+    def _translate_qwen_single(self, text: str, source_lang: str, target_lang: str) -> str:
+        """요청 1개 generate (컴파일 경로는 가장 가까운 버킷 길이로 left padding → 그래프 재사용)"""
+        ids, text_len = self._qwen_input_ids(text, source_lang, target_lang)
 
-{target_name} translation:"""
+        pad = 0
+        if self.qwen_compiled:
+            pad = next(b for b in Config.QWEN_INPUT_BUCKETS if b >= len(ids)) - len(ids)
+        return self._generate_qwen([ids], len(ids) + pad, self._qwen_max_new_tokens(text_len))[0]
 
-            messages = [{"role": "user", "content": prompt}]
+    def _translate_qwen_batch(self, requests: List[TranslationRequest]) -> List[str]:
+        """여러 요청을 가장 긴 입력 길이로 left padding 후 generate 1회 (언어 쌍 무관)"""
+        inputs = [self._qwen_input_ids(r.text, r.source_lang, r.target_lang) for r in requests]
+        batch_ids = [ids for ids, _ in inputs]
+        max_new_tokens = self._qwen_max_new_tokens(max(text_len for _, text_len in inputs))
+        return self._generate_qwen(batch_ids, max(map(len, batch_ids)), max_new_tokens)
 
-            input_text = self.qwen_tokenizer.apply_chat_template(
-                messages,
-                tokenize=False,
-                add_generation_prompt=True,
-                enable_thinking=False
+    def _qwen_input_ids(self, text: str, source_lang: str, target_lang: str) -> Tuple[List[int], int]:
+        """
+        언어 쌍 프롬프트 토큰 + 원문 토큰 (전체 길이는 최대 입력 버킷 이내로 자름)
+
+        Returns:
+            (input_ids, 원문 토큰 수)
+        """
+        prefix_ids, suffix_ids = self._qwen_prompt_ids(source_lang, target_lang)
+        budget = Config.QWEN_INPUT_BUCKETS[-1] - len(prefix_ids) - len(suffix_ids)
+        text_ids = self.qwen_tokenizer(" " + text.strip(), add_special_tokens=False)["input_ids"][:budget]
+        return prefix_ids + text_ids + suffix_ids, len(text_ids)
+
+    def _qwen_max_new_tokens(self, text_len: int) -> int:
+        """원문 길이에 비례한 생성 상한 (컴파일 경로는 static cache 크기 고정을 위해 QWEN_MAX_NEW_TOKENS)"""
+        if self.qwen_compiled:
+            return Config.QWEN_MAX_NEW_TOKENS
+        scaled = int(text_len * Config.QWEN_NEW_TOKENS_RATIO)
+        return min(Config.QWEN_MAX_NEW_TOKENS, max(Config.QWEN_MIN_NEW_TOKENS, scaled))
+
+    def _generate_qwen(self, batch_ids: List[List[int]], length: int, max_new_tokens: int) -> List[str]:
+        """입력들을 length로 left padding (eos + attention_mask 0) 후 greedy generate, 정리된 번역 반환"""
+        device = self.qwen_model.device
+        host_ids, host_mask = self._qwen_host_inputs(batch_ids, length)
+        input_ids = host_ids.to(device, non_blocking=True)
+        attention_mask = host_mask.to(device, non_blocking=True)
+
+        with torch.inference_mode():
+            outputs = self.qwen_model.generate(
+                input_ids=input_ids,
+                attention_mask=attention_mask,
+                max_new_tokens=max_new_tokens,
+                do_sample=False,
+                use_cache=True,
             )
-            inputs = self.qwen_tokenizer(
-                input_text,
-                return_tensors="pt",
-                truncation=True,
-                max_length=512
-            ).to(self.qwen_model.device)
-
-            with torch.no_grad():
-                outputs = self.qwen_model.generate(
-                    **inputs,
-                    max_new_tokens=256,
-                    do_sample=False,
-                    pad_token_id=self.qwen_tokenizer.eos_token_id,
-                )
-
-            input_len = inputs["input_ids"].shape[1]
-            result = self.qwen_tokenizer.decode(
-                outputs[0][input_len:],
-                skip_special_tokens=True
-            ).strip()
-
-            return self._clean_translation(result)
 
-        except Exception as e:
-            DebugLogger.log("TRANS_ERROR", f"Qwen translation failed: {e}")
-            return ""
+        results = self.qwen_tokenizer.batch_decode(outputs[:, length:], skip_special_tokens=True)
+        return [self._clean_translation(result) for result in results]
+
+    def _qwen_host_inputs(self, batch_ids: List[List[int]], length: int) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        left padding된 input_ids / attention_mask를 스레드별 host 버퍼에 채움
+
+        같은 스레드의 다음 호출은 generate 완료(출력 decode) 이후이므로 이전 비동기 복사와 겹치지 않음
+
+        Returns:
+            (input_ids, attention_mask): (batch, length) contiguous CPU 텐서 (버퍼 view)
+        """
+        capacity = max(Config.QWEN_BATCH_SIZE, len(batch_ids)) * Config.QWEN_INPUT_BUCKETS[-1]
+        ids_buf = getattr(_qwen_host_buffers, "ids", None)
+        if ids_buf is None or ids_buf.numel() < capacity:
+            pin = self.qwen_model.device.type == "cuda"
+            ids_buf = _qwen_host_buffers.ids = torch.empty(capacity, dtype=torch.long, pin_memory=pin)
+            _qwen_host_buffers.mask = torch.empty(capacity, dtype=torch.long, pin_memory=pin)
+
+        size = len(batch_ids) * length
+        input_ids = ids_buf[:size].view(len(batch_ids), length)
+        attention_mask = _qwen_host_buffers.mask[:size].view(len(batch_ids), length)
+
+        ids_np = input_ids.numpy()
+        mask_np = attention_mask.numpy()
+        ids_np.fill(self.qwen_tokenizer.eos_token_id)
+        mask_np.fill(0)
+        for row, ids in enumerate(batch_ids):
+            ids_np[row, length - len(ids):] = ids
+            mask_np[row, length - len(ids):] = 1
+        return input_ids, attention_mask
+
+    def _qwen_prompt_ids(self, source_lang: str, target_lang: str) -> Tuple[List[int], List[int]]:
+        """
+        언어 쌍별 프롬프트의 고정 앞/뒤 토큰 (chat template 렌더링 + 토크나이즈는 쌍마다 1회)
+
+        Returns:
+            (prefix_ids, suffix_ids): 원문 토큰 앞뒤에 붙일 토큰 ID
+        """
+        key = (source_lang, target_lang)
+        cached = self._qwen_prompt_cache.get(key)
+        if cached is not None:
+            return cached
+
+        source_name = Config.LANGUAGE_NAMES.get(source_lang, "English")
+        target_name = Config.LANGUAGE_NAMES.get(target_lang, "English")
+        prompt = _QWEN_PROMPT.format(source_name=source_name, target_name=target_name, text=_TEXT_SENTINEL)
+        rendered = self.qwen_tokenizer.apply_chat_template(
+            [{"role": "user", "content": prompt}],
+            tokenize=False,
+            add_generation_prompt=True,
+            enable_thinking=False
+        )
+        prefix, suffix = rendered.split(_TEXT_SENTINEL)
+        cached = (
+            self.qwen_tokenizer(prefix, add_special_tokens=False)["input_ids"],
+            self.qwen_tokenizer(suffix, add_special_tokens=False)["input_ids"],
+        )
+        self._qwen_prompt_cache[key] = cached
+        return cached
 
     def _clean_translation(self, text: str) -> str:
         """
@@ -127,27 +254,16 @@ Text: {text}
 
         Removes common prefixes and formatting issues from LLM output.
         """
-        result = text.strip()
-
-        prefixes = [
-            "Here is the translation:", "Here's the translation:",
-            "Translation:", "The translation is:", "Translated text:",
-        ]
-        for prefix in prefixes:
-            if result.lower().startswith(prefix.lower()):
-                result = result[len(prefix):].strip()
-
-        lines = [line.strip() for line in result.split('\n') if line.strip()]
-        if len(lines) > 1:
-            if len(lines[0]) < 5 and len(lines) > 1:
-                result = lines[1]
-            else:
-                result = lines[0]
-        elif lines:
-            result = lines[0]
-
-        if (result.startswith('"') and result.endswith('"')) or \
-           (result.startswith("'") and result.endswith("'")):
-            result = result[1:-1]
+        result = _TRANSLATION_PREFIX_RE.sub("", text.strip(), count=1)
+
+        # 여러 줄이면 앞의 비어있지 않은 두 줄만 확인 (첫 줄이 짧으면 라벨로 보고 다음 줄 사용)
+        if "\n" in result:
+            lines = _nonempty_lines(result)
+            first = next(lines, "")
+            result = next(lines, first) if len(first) < 5 else first
+
+        quoted = _WRAPPING_QUOTES_RE.match(result)
+        if quoted:
+            result = quoted.group(2)
 
         return result.strip()
@@ -0,0 +1,40 @@
+"""
+Translation Batcher - 여러 세션의 Qwen3 번역 요청을 모아 generate() 1회로 처리
+"""
+
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable, List
+
+from config.settings import Config
+from models.batcher import MicroBatcher
+
+
+@dataclass
+class TranslationRequest:
+    """배치 대기 중인 Qwen3 번역 요청"""
+    text: str
+    source_lang: str
+    target_lang: str
+    future: Future = field(default_factory=Future, repr=False)
+
+
+class TranslationBatcher(MicroBatcher):
+    """
+    Qwen3 번역 리배처
+
+    - 첫 요청 도착 후 QWEN_BATCH_WINDOW_MS 동안 최대 QWEN_BATCH_SIZE개까지 수집
+    - 언어 쌍이 달라도 같은 배치로 처리 (left padding + attention_mask)
+    - worker 1개 → GPU generate는 한 번에 하나만 실행
+    """
+
+    def __init__(self,
+                 run_single: Callable[[TranslationRequest], str],
+                 run_batch: Callable[[List[TranslationRequest]], List[str]],
+                 batch_size: int = Config.QWEN_BATCH_SIZE,
+                 window_ms: int = Config.QWEN_BATCH_WINDOW_MS):
+        super().__init__(run_single, run_batch, batch_size, window_ms, workers=1, name="trans-batch")
+
+    def translate(self, request: TranslationRequest, timeout: float = Config.TRANSLATION_TIMEOUT) -> str:
+        """요청을 큐에 넣고 결과를 기다림 (호출 스레드 블로킹)"""
+        return self.submit(request, timeout)
@@ -4,10 +4,11 @@ Amazon Polly support with neural/standard voices
 """
 
 import time
-from typing import Tuple
+from typing import Iterator, Tuple
 
 from config.settings import Config
 from utils.logger import DebugLogger
+from audio.mp3 import complete_frames_length, duration_ms as mp3_duration_ms
 
 
 class TTSMixin:
@@ -29,43 +30,138 @@ class TTSMixin:
         "tr": ("Filiz", "standard"),
     }
 
-    def synthesize_speech(self, text: str, target_lang: str) -> Tuple[bytes, int]:
+    def synthesize_speech_stream(self, text: str, target_lang: str,
+                                 output_format: str = Config.TTS_OUTPUT_FORMAT) -> Iterator[bytes]:
+        """
+        Text to Speech using Amazon Polly (incremental)
+
+        Polly 응답 스트림을 끝까지 기다리지 않고 도착하는 대로 MP3 청크를 yield
+
+        Args:
+            text: Text to synthesize
+            target_lang: Target language code
+            output_format: "mp3" or "pcm"
+
+        Yields:
+            MP3 audio chunks
+        """
+        voice_id, engine = self.VOICE_CONFIG.get(target_lang, ("Joanna", "neural"))
+
+        response = self.polly_client.synthesize_speech(
+            Text=text,
+            OutputFormat=output_format,
+            VoiceId=voice_id,
+            Engine=engine,
+            SampleRate=str(Config.TTS_SAMPLE_RATES[output_format]),
+        )
+
+        stream = response["AudioStream"]
+        try:
+            for chunk in stream.iter_chunks(chunk_size=Config.TTS_STREAM_CHUNK_SIZE):
+                yield chunk
+        finally:
+            stream.close()
+
+    def synthesize_speech_frames(self, text: str, target_lang: str,
+                                 output_format: str = Config.TTS_OUTPUT_FORMAT) -> Iterator[bytes]:
+        """
+        단독 재생 가능한 단위로 나눈 Polly 오디오 청크 (TTS_STREAM_AUDIO 전송용)
+
+        - mp3: 완전한 프레임이 TTS_STREAM_CHUNK_SIZE 이상 모일 때마다 프레임 경계에서 yield
+        - pcm: 샘플(2 bytes) 경계에서 yield
+        - LRU 캐시 hit 시 전체 오디오 1개, miss 시 스트림 완료 후 전체 오디오를 캐시에 저장
+        """
+        stripped = text.strip()
+        if not stripped:
+            return
+
+        cacheable = len(stripped) <= Config.LRU_CACHE_MAX_TEXT_LENGTH
+        cache_key = (stripped.casefold(), target_lang, output_format)
+        if cacheable:
+            cached = self.tts_cache.get(cache_key)
+            if cached is not None:
+                if DebugLogger.enabled("TTS_CACHE"):
+                    DebugLogger.log("TTS_CACHE", f"LRU hit ({target_lang})")
+                yield cached[0]
+                return
+
+        sent = []
+        pending = bytearray()
+        for chunk in self.synthesize_speech_stream(text, target_lang, output_format):
+            pending += chunk
+            if output_format == "mp3":
+                ready = complete_frames_length(pending)
+            else:
+                ready = len(pending) & ~1
+            if ready >= Config.TTS_STREAM_CHUNK_SIZE:
+                sent.append(bytes(pending[:ready]))
+                del pending[:ready]
+                yield sent[-1]
+        if pending:
+            sent.append(bytes(pending))
+            yield sent[-1]
+
+        if cacheable and sent:
+            audio_data = b"".join(sent)
+            self.tts_cache.put(cache_key, (audio_data, self.audio_duration_ms(audio_data, output_format)))
+
+    def synthesize_speech(self, text: str, target_lang: str,
+                          output_format: str = Config.TTS_OUTPUT_FORMAT) -> Tuple[bytes, int]:
         """
         Text to Speech using Amazon Polly
 
         Args:
             text: Text to synthesize
             target_lang: Target language code
+            output_format: "mp3" or "pcm"
 
         Returns:
             (audio_data_bytes, duration_ms)
         """
-        if not text.strip():
+        stripped = text.strip()
+        if not stripped:
             return b"", 0
 
-        start_time = time.time()
-        DebugLogger.tts_start(text, target_lang)
+        # 반복 문구는 LRU 캐시에서 즉시 반환 (Polly 호출 생략)
+        cacheable = len(stripped) <= Config.LRU_CACHE_MAX_TEXT_LENGTH
+        cache_key = (stripped.casefold(), target_lang, output_format)
+        if cacheable:
+            cached = self.tts_cache.get(cache_key)
+            if cached is not None:
+                if DebugLogger.enabled("TTS_CACHE"):
+                    DebugLogger.log("TTS_CACHE", f"LRU hit ({target_lang})")
+                return cached
 
-        voice_id, engine = self.VOICE_CONFIG.get(target_lang, ("Joanna", "neural"))
+        start_time = time.monotonic_ns()
+        DebugLogger.tts_start(text, target_lang)
 
         try:
-            response = self.polly_client.synthesize_speech(
-                Text=text,
-                OutputFormat="mp3",
-                VoiceId=voice_id,
-                Engine=engine,
-                SampleRate="24000",
-            )
-
-            audio_data = response["AudioStream"].read()
-            # Estimate duration from audio size (rough estimate for MP3)
-            duration_ms = int(len(audio_data) / 24 * 8)
-
-            latency_ms = (time.time() - start_time) * 1000
+            audio_data = b"".join(self.synthesize_speech_stream(text, target_lang, output_format))
+            duration_ms = self.audio_duration_ms(audio_data, output_format)
+
+            latency_ms = (time.monotonic_ns() - start_time) // 1_000_000
             DebugLogger.tts_result(len(audio_data), duration_ms, latency_ms)
 
+            if cacheable and audio_data:
+                self.tts_cache.put(cache_key, (audio_data, duration_ms))
+
             return audio_data, duration_ms
 
         except Exception as e:
             DebugLogger.log("TTS_ERROR", f"Polly failed: {e}")
             return b"", 0
+
+    @staticmethod
+    def audio_duration_ms(audio_data: bytes, output_format: str) -> int:
+        """
+        오디오 길이 계산
+
+        - pcm: 16-bit mono 샘플 수 기준 (정확)
+        - mp3: 프레임 헤더의 샘플 수 합산 (헤더를 못 찾으면 비트레이트 기준 추정)
+        """
+        if output_format == "pcm":
+            return len(audio_data) * 1000 // (2 * Config.TTS_SAMPLE_RATES["pcm"])
+        parsed = mp3_duration_ms(audio_data)
+        if parsed is not None:
+            return parsed
+        return len(audio_data) * 8 // Config.POLLY_MP3_BITRATE_KBPS
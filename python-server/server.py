@@ -13,20 +13,27 @@ Features:
 import sys
 import os
 import asyncio
-import uuid
+import secrets
+import itertools
+import math
+import re
 import time
+import queue
+import logging
+import logging.handlers
 import threading
+import weakref
 from concurrent import futures
-from datetime import datetime
-from typing import Dict, List, Set, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 
 import grpc
 import numpy as np
 import torch
 import boto3
+from botocore.config import Config as BotoConfig
 import webrtcvad
 
 # Amazon Transcribe Streaming
@@ -42,6 +49,23 @@ from generated import conversation_pb2
 from generated import conversation_pb2_grpc
 
 
+# =============================================================================
+# Logging
+# =============================================================================
+# 요청 경로의 로그는 QueueHandler로 큐에 넣고, 실제 포맷/stdout 출력은
+# 백그라운드 QueueListener 스레드에서 처리 (요청 스레드가 stdout I/O에 막히지 않음)
+log = logging.getLogger("eum")
+log.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+log.propagate = False
+
+_log_queue = queue.SimpleQueue()
+log.addHandler(logging.handlers.QueueHandler(_log_queue))
+
+_log_stream_handler = logging.StreamHandler(sys.stdout)
+_log_stream_handler.setFormatter(logging.Formatter("[%(asctime)s] %(message)s", "%H:%M:%S"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream_handler)
+
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -51,6 +75,9 @@ class Config:
     SAMPLE_RATE = 16000
     BYTES_PER_SAMPLE = 2  # 16-bit
     BYTES_PER_SECOND = SAMPLE_RATE * BYTES_PER_SAMPLE  # 32000
+    INV_BYTES_PER_SECOND = 1.0 / BYTES_PER_SECOND  # bytes → 초 변환 (나눗셈 대신 곱셈)
+    MIN_SPEECH_BYTES = int(BYTES_PER_SECOND * 0.5)       # 문장 끝 감지 시 최소 0.5초
+    SESSION_END_MIN_BYTES = int(BYTES_PER_SECOND * 0.3)  # 세션 종료 시 잔여 버퍼 최소 0.3초
 
     # Buffering strategies
     CHUNK_DURATION_MS = 1500  # 1.5초 청크
@@ -124,18 +151,28 @@ class Config:
 
     # AWS Polly
     AWS_REGION = os.getenv("AWS_REGION", "ap-northeast-2")
+    AWS_MAX_POOL_CONNECTIONS = int(os.getenv("AWS_MAX_POOL_CONNECTIONS", "50"))
 
     # gRPC
     GRPC_PORT = int(os.getenv("GRPC_PORT", 50051))
     MAX_WORKERS = int(os.getenv("MAX_WORKERS", 32))  # 동시 세션 처리를 위해 증가
+    # 타겟 언어별 번역/TTS 병렬 실행 worker 수 (세션 간 공유)
+    MAX_TRANSLATION_CONCURRENCY = int(os.getenv("MAX_TRANSLATION_CONCURRENCY", "16"))
+    SESSION_SHARDS = 32  # 세션 저장소 락 샤드 수
+    # Transcribe 스트리밍용 이벤트 루프 수 (동시 STT가 루프 1개에 몰리지 않도록 분산)
+    ASYNC_LOOP_COUNT = int(os.getenv("ASYNC_LOOP_COUNT", min(8, os.cpu_count() or 1)))
+    # HTTP/2 keepalive: 유휴 스트림이 LB/NAT에서 끊기지 않도록 ping, 응답 없는 연결은 빠르게 정리
+    GRPC_KEEPALIVE_TIME_MS = 10000
+    GRPC_KEEPALIVE_TIMEOUT_MS = 20000
+    GRPC_MAX_CONCURRENT_STREAMS = int(os.getenv("GRPC_MAX_CONCURRENT_STREAMS", "512"))
 
     # Timeouts (seconds) - 실시간 응답을 위해 짧게 설정
     STT_TIMEOUT = 15  # Amazon Transcribe 타임아웃 (15초로 단축)
     TRANSLATION_TIMEOUT = 10  # 번역 타임아웃 (10초로 단축)
     TTS_TIMEOUT = 8  # TTS 타임아웃 (8초로 단축)
 
-    # Filler words to skip TTS (common interjections/fillers)
-    FILLER_WORDS = {
+    # Filler words to skip TTS (common interjections/fillers) - 소문자 frozenset (strip + lower 1회 후 조회)
+    FILLER_WORDS = frozenset({
         # Korean fillers
         "네", "예", "응", "음", "어", "아", "으", "흠", "뭐", "그", "저",
         "아아", "어어", "음음", "네네", "예예", "그래", "응응",
@@ -146,10 +183,24 @@ class Config:
         "あ", "え", "う", "ん", "はい", "うん", "ええ", "まあ",
         # Chinese fillers
         "嗯", "啊", "哦", "呃", "好", "是",
-    }
+    })
+    # 무의미한 망설임 소리만 (FILLER_WORDS의 부분집합) - 구두점/나열 허용 매칭은 이 단어들로만
+    # yes/no/네/はい/好 같은 응답 단어는 "No." / "Well, no."처럼 실제 답변이므로 정확히 한 단어일 때만 필러
+    HESITATION_WORDS = frozenset({
+        "음", "어", "아", "으", "흠", "아아", "어어", "음음",
+        "uh", "um", "ah", "hmm",
+        "あ", "え", "う", "ん",
+        "嗯", "啊", "呃",
+    })
 
     # Minimum text length for TTS (characters)
     MIN_TTS_TEXT_LENGTH = 2
+    POLLY_MP3_BITRATE_KBPS = 48  # Polly 24kHz MP3 비트레이트 (duration 추정용)
+
+    # 반복 문구 LRU 캐시 (번역: (text, src, tgt), TTS: (text, lang) → 모델/API 호출 생략)
+    TRANSLATION_CACHE_SIZE = int(os.getenv("TRANSLATION_CACHE_SIZE", "4096"))
+    TTS_CACHE_SIZE = int(os.getenv("TTS_CACHE_SIZE", "512"))
+    LRU_CACHE_MAX_TEXT_LENGTH = 64  # 이보다 긴 문장은 반복 가능성이 낮아 저장하지 않음
 
 
 # =============================================================================
@@ -247,8 +298,9 @@ class VADProcessor:
         """int16 오디오 데이터의 RMS 계산"""
         if len(audio_bytes) < 2:
             return 0.0
-        arr = np.frombuffer(audio_bytes, dtype=np.int16)
-        return float(np.sqrt(np.mean(arr.astype(np.float64) ** 2)))
+        arr = np.frombuffer(audio_bytes, dtype=np.int16, count=len(audio_bytes) // 2)
+        # float64 임시 배열 없이 int64 누적 내적 1회
+        return float(np.sqrt(np.einsum("i,i->", arr, arr, dtype=np.int64) / len(arr)))
 
     def has_speech(self, audio_bytes: bytes) -> bool:
         """
@@ -316,6 +368,42 @@ class VADProcessor:
             return b''.join(speech_frames)
         return b''
 
+    def filter_speech_into(self, audio_bytes: bytes, out: "PCMRing") -> int:
+        """
+        음성 프레임만 out 버퍼에 바로 기록 (filter_speech의 b''.join 중간 bytes 생성 없음)
+
+        Returns:
+            기록된 byte 수
+        """
+        if len(audio_bytes) < self.frame_size:
+            out.extend(audio_bytes)
+            return len(audio_bytes)
+
+        # 연속된 음성 프레임은 구간 단위로 한 번에 기록 (발화 중간 청크는 extend 1회)
+        view = memoryview(audio_bytes)
+        written = 0
+        run_start = None
+        end = len(audio_bytes) - self.frame_size + 1
+        for i in range(0, end, self.frame_size):
+            frame = audio_bytes[i:i + self.frame_size]
+            try:
+                is_speech = self.vad.is_speech(frame, self.sample_rate)
+            except Exception:
+                # VAD 오류 시 RMS 폴백
+                is_speech = self.calculate_rms(frame) >= Config.SILENCE_THRESHOLD_RMS
+            if is_speech:
+                if run_start is None:
+                    run_start = i
+            elif run_start is not None:
+                out.extend(view[run_start:i])
+                written += i - run_start
+                run_start = None
+        if run_start is not None:
+            run_end = i + self.frame_size
+            out.extend(view[run_start:run_end])
+            written += run_end - run_start
+        return written
+
     def process_chunk(self, audio_bytes: bytes) -> Tuple[bool, bool]:
         """
         오디오 청크 처리 및 문장 경계 탐지
@@ -353,7 +441,84 @@ class VADProcessor:
 # Participant & Session Management
 # =============================================================================
 
-@dataclass
+class PCMRing:
+    """
+    사전 할당 int16 PCM 버퍼 (bytearray.extend + bytes() 복사 대체)
+
+    - write_pos까지 기록, take()는 복사 없이 view 반환 후 write_pos 리셋
+    - 더블 버퍼: take() 시 기록 대상 뱅크를 교체 → 반환된 view는 다음 take() 전까지 유효
+      (파이프라인이 처리하는 동안 새 오디오는 다른 뱅크에 기록)
+    - len()은 byte 수 반환 (기존 byte 단위 임계값과 호환)
+    """
+
+    def __init__(self, capacity_bytes: int = Config.SENTENCE_MAX_BYTES * 2):
+        self.banks = [np.empty(capacity_bytes // 2, dtype=np.int16), np.empty(capacity_bytes // 2, dtype=np.int16)]
+        self.active = 0
+        self.pcm = self.banks[0]
+        self.write_pos = 0
+
+    def __len__(self) -> int:
+        return self.write_pos * 2
+
+    def extend(self, pcm_bytes: bytes):
+        new = np.frombuffer(pcm_bytes, dtype=np.int16, count=len(pcm_bytes) // 2)
+        end = self.write_pos + len(new)
+        if end > len(self.pcm):
+            grown = np.empty(max(end, len(self.pcm) * 2), dtype=np.int16)
+            grown[:self.write_pos] = self.pcm[:self.write_pos]
+            self.banks[self.active] = grown
+            self.pcm = grown
+        self.pcm[self.write_pos:end] = new
+        self.write_pos = end
+
+    def take(self) -> np.ndarray:
+        pcm = self.pcm[:self.write_pos]
+        self.active ^= 1
+        self.pcm = self.banks[self.active]
+        self.write_pos = 0
+        return pcm
+
+    def clear(self):
+        self.write_pos = 0
+
+
+class Float32Pool:
+    """
+    STT 입력용 float32 버퍼 풀 (발화마다 정규화 배열 새로 할당 방지)
+
+    - acquire()로 n 샘플 view를 받고 사용 후 release()로 반환
+    - 풀 버퍼보다 긴 입력은 일회성 배열 할당 (release 시 버림)
+    """
+
+    def __init__(self, capacity_samples: int = Config.SENTENCE_MAX_BYTES, preallocate: int = 4):
+        self.capacity = capacity_samples
+        self._free: "queue.SimpleQueue" = queue.SimpleQueue()
+        for _ in range(preallocate):
+            self._free.put(np.empty(capacity_samples, dtype=np.float32))
+
+    def acquire(self, n: int) -> np.ndarray:
+        if n > self.capacity:
+            return np.empty(n, dtype=np.float32)
+        try:
+            buf = self._free.get_nowait()
+        except queue.Empty:
+            buf = np.empty(self.capacity, dtype=np.float32)
+        return buf[:n]
+
+    def release(self, view: np.ndarray):
+        base = view.base if view.base is not None else view
+        if len(base) == self.capacity:
+            self._free.put(base)
+
+
+_float32_pool = Float32Pool()
+
+
+# 세션마다 생성되는 작은 레코드는 __slots__ 사용 (인스턴스 __dict__ 생략, Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class Participant:
     """참가자 정보"""
     participant_id: str
@@ -363,7 +528,7 @@ class Participant:
     translation_enabled: bool = True
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Speaker:
     """발화자 정보"""
     participant_id: str
@@ -381,12 +546,15 @@ class SessionState:
     participants: Dict[str, Participant] = field(default_factory=dict)
 
     # 오디오 버퍼
-    audio_buffer: bytearray = field(default_factory=bytearray)
+    audio_buffer: PCMRing = field(default_factory=PCMRing)
     text_buffer: str = ""
 
     # VAD
     vad: VADProcessor = field(default_factory=VADProcessor)
 
+    # 참가자 설정 변경용 세션 단위 락 (UpdateParticipantSettings ↔ 다른 RPC의 동시 업데이트)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
     # 현재 버퍼링 전략 (타겟 언어에 따라 다를 수 있음)
     primary_strategy: BufferingStrategy = BufferingStrategy.CHUNK_BASED
 
@@ -395,26 +563,106 @@ class SessionState:
     silence_skipped: int = 0
     sentences_completed: int = 0
 
-    def get_target_languages(self) -> Set[str]:
-        """번역이 활성화된 참가자들의 타겟 언어 목록"""
-        languages = set()
+    # 타겟 언어 인덱스 캐시 (determine_primary_strategy()에서만 재계산)
+    _target_languages: Optional[Tuple[str, ...]] = field(default=None, repr=False)
+    _participants_by_lang: Dict[str, List[str]] = field(default_factory=dict, repr=False)
+
+    # 세션 동안 불변인 응답 proto 템플릿 (SpeakerInfo 등) - 첫 응답 시 1회 구성
+    _transcript_template: Optional[conversation_pb2.ChatResponse] = field(default=None, repr=False)
+    _audio_template: Optional[conversation_pb2.ChatResponse] = field(default=None, repr=False)
+
+    def _build_response_templates(self):
+        speaker = self.speaker
+        self._transcript_template = conversation_pb2.ChatResponse(
+            session_id=self.session_id,
+            room_id=self.room_id,
+            transcript=conversation_pb2.TranscriptResult(
+                speaker=conversation_pb2.SpeakerInfo(
+                    participant_id=speaker.participant_id,
+                    nickname=speaker.nickname,
+                    profile_img=speaker.profile_img,
+                    source_language=speaker.source_language
+                ),
+                original_language=speaker.source_language,
+                is_partial=False,
+                is_final=True,
+            )
+        )
+        self._audio_template = conversation_pb2.ChatResponse(
+            session_id=self.session_id,
+            room_id=self.room_id,
+            audio=conversation_pb2.AudioResult(
+                format="mp3",
+                sample_rate=24000,
+                speaker_participant_id=speaker.participant_id
+            )
+        )
+
+    def transcript_response(self, transcript_id: str, original_text: str, confidence: float,
+                            translations=(), is_final: bool = True) -> conversation_pb2.ChatResponse:
+        """템플릿 CopyFrom 후 발화별 필드만 채운 트랜스크립트 응답"""
+        if self._transcript_template is None:
+            self._build_response_templates()
+        response = conversation_pb2.ChatResponse()
+        response.CopyFrom(self._transcript_template)
+        transcript = response.transcript
+        transcript.id = transcript_id
+        transcript.original_text = original_text
+        transcript.confidence = confidence
+        transcript.timestamp_ms = int(time.time() * 1000)
+        if translations:
+            transcript.translations.extend(translations)
+        if not is_final:
+            transcript.is_partial = True
+            transcript.is_final = False
+        return response
+
+    def audio_response(self, transcript_id: str, target_lang: str, target_participant_ids,
+                       audio_data: bytes, duration_ms: int) -> conversation_pb2.ChatResponse:
+        """템플릿 CopyFrom 후 발화별 필드만 채운 TTS 오디오 응답"""
+        if self._audio_template is None:
+            self._build_response_templates()
+        response = conversation_pb2.ChatResponse()
+        response.CopyFrom(self._audio_template)
+        audio = response.audio
+        audio.transcript_id = transcript_id
+        audio.target_language = target_lang
+        audio.target_participant_ids.extend(target_participant_ids)
+        audio.audio_data = audio_data
+        audio.duration_ms = duration_ms
+        return response
+
+    def _rebuild_target_index(self):
+        """참가자 목록에서 타겟 언어 / 언어별 참가자 인덱스 재계산"""
+        participants_by_lang: Dict[str, List[str]] = {}
         for p in self.participants.values():
-            if p.translation_enabled and p.target_language != self.speaker.source_language:
-                languages.add(p.target_language)
-        return languages
+            if p.translation_enabled:
+                participants_by_lang.setdefault(p.target_language, []).append(p.participant_id)
+
+        source_lang = self.speaker.source_language
+        self._participants_by_lang = participants_by_lang
+        self._target_languages = tuple(lang for lang in participants_by_lang if lang != source_lang)
+
+    def get_target_languages(self) -> Tuple[str, ...]:
+        """번역이 활성화된 참가자들의 타겟 언어 목록 (참가자 순서, 중복 없음)"""
+        if self._target_languages is None:
+            self._rebuild_target_index()
+        return self._target_languages
 
     def get_participants_by_target_language(self, target_lang: str) -> List[str]:
         """특정 타겟 언어를 원하는 참가자 ID 목록"""
-        return [
-            p.participant_id for p in self.participants.values()
-            if p.translation_enabled and p.target_language == target_lang
-        ]
+        if self._target_languages is None:
+            self._rebuild_target_index()
+        return self._participants_by_lang.get(target_lang, [])
 
     def determine_primary_strategy(self) -> BufferingStrategy:
         """
         모든 타겟 언어를 고려하여 주요 버퍼링 전략 결정
         하나라도 SENTENCE_BASED가 필요하면 SENTENCE_BASED 사용
+
+        참가자 설정 변경 시 호출되므로 타겟 언어 인덱스도 여기서 갱신
         """
+        self._rebuild_target_index()
         source_lang = self.speaker.source_language
 
         for target_lang in self.get_target_languages():
@@ -436,30 +684,47 @@ class AsyncLoopManager:
     전용 asyncio 이벤트 루프 관리자
 
     별도 스레드에서 이벤트 루프를 실행하여 asyncio.run() 블로킹 문제 해결
+    루프 N개를 round-robin으로 사용 → 동시 스트림의 Transcribe 이벤트 인코딩/서명이
+    단일 루프 스레드에 직렬화되지 않음
     """
     _instance = None
     _lock = threading.Lock()
+    _init_lock = threading.Lock()
 
     def __new__(cls):
         if cls._instance is None:
             with cls._lock:
                 if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
+                    # 속성을 채운 뒤 공개 → lock 밖에서 읽는 스레드가 _initialized 없는 객체를 보지 않음
+                    instance = super().__new__(cls)
+                    instance._initialized = False
+                    cls._instance = instance
         return cls._instance
 
-    def initialize(self):
+    def initialize(self, num_loops: int = 0):
         if self._initialized:
             return
 
-        self.loop = asyncio.new_event_loop()
-        self.thread = threading.Thread(target=self._run_loop, daemon=True)
-        self.thread.start()
-        self._initialized = True
+        with self._init_lock:
+            if self._initialized:
+                return
 
-    def _run_loop(self):
-        asyncio.set_event_loop(self.loop)
-        self.loop.run_forever()
+            num_loops = max(1, num_loops or Config.ASYNC_LOOP_COUNT)
+            self.loops = [asyncio.new_event_loop() for _ in range(num_loops)]
+            self.threads = [
+                threading.Thread(target=self._run_loop, args=(loop,), name=f"async-loop-{i}", daemon=True)
+                for i, loop in enumerate(self.loops)
+            ]
+            for thread in self.threads:
+                thread.start()
+            # next()는 GIL 하에서 원자적 → 락 없이 round-robin
+            self._next_loop = itertools.cycle(self.loops)
+            self._initialized = True
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop):
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
 
     def run_async(self, coro, timeout: float = 30.0):
         """
@@ -472,19 +737,110 @@ class AsyncLoopManager:
         Returns:
             코루틴 결과
         """
-        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        future = asyncio.run_coroutine_threadsafe(coro, next(self._next_loop))
         try:
             return future.result(timeout=timeout)
-        except asyncio.TimeoutError:
+        except (asyncio.TimeoutError, futures.TimeoutError):
             future.cancel()
             raise TimeoutError(f"Async operation timed out after {timeout}s")
         except Exception as e:
             raise e
 
     def shutdown(self):
-        if self._initialized and self.loop.is_running():
-            self.loop.call_soon_threadsafe(self.loop.stop)
-            self.thread.join(timeout=5)
+        if not self._initialized:
+            return
+        for loop in self.loops:
+            if loop.is_running():
+                loop.call_soon_threadsafe(loop.stop)
+        for thread in self.threads:
+            thread.join(timeout=5)
+
+
+class LRUCache:
+    """OrderedDict 기반 스레드 안전 LRU 캐시 (반복 문구 번역/TTS 결과 재사용)"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._data: "OrderedDict" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+
+# Qwen 번역 후처리 패턴 (모듈 로드 시 1회 컴파일)
+_TRANSLATION_PREFIX_RE = re.compile(
+    r"^(?:\s*(?:here is the translation|here's the translation|translation|the translation is|translated text"
+    r"|in english|in korean|in japanese|in chinese)\s*:)+\s*",
+    re.IGNORECASE,
+)
+_WRAPPING_QUOTES_RE = re.compile(r"^([\"'])(.*)\1$", re.DOTALL)
+_PAREN_NOTE_RE = re.compile(r"\s*\([^)]*(?:translation|english|korean)[^)]*\)\s*", re.IGNORECASE)
+
+
+# Polly 음성 ID 및 엔진 매핑 (호출마다 dict 재생성 없이 모듈 상수로 공유)
+# Neural 지원 음성: Seoyeon(ko), Joanna(en), Zhiyu(zh), Takumi(ja), Lucia(es), Lea(fr), Vicki(de), Camila(pt)
+_POLLY_VOICES = {
+    "ko": ("Seoyeon", "neural"),
+    "en": ("Joanna", "neural"),
+    "zh": ("Zhiyu", "neural"),
+    "ja": ("Takumi", "neural"),  # Mizuki는 neural 미지원, Takumi 사용
+    "es": ("Lucia", "neural"),
+    "fr": ("Lea", "neural"),
+    "de": ("Vicki", "neural"),
+    "pt": ("Camila", "neural"),
+    "ru": ("Tatyana", "standard"),  # neural 미지원
+    "ar": ("Zeina", "standard"),    # neural 미지원
+    "hi": ("Aditi", "standard"),    # neural 미지원
+    "tr": ("Filiz", "standard"),    # neural 미지원
+}
+_DEFAULT_POLLY_VOICE = ("Joanna", "neural")
+
+
+# transcript id: 임의 오프셋에서 증가하는 32bit 카운터 (uuid4 생성 + 문자열 포맷 + slice 대체)
+_transcript_ids = itertools.count(secrets.randbits(32))
+
+
+def _next_transcript_id() -> str:
+    return f"{next(_transcript_ids) & 0xFFFFFFFF:08x}"
+
+
+# 망설임 소리만 구두점/공백으로 이어진 발화 ("um, uh", "嗯。", "음... 어") - 긴 문구 우선 매칭
+_FILLER_ALT = "|".join(map(re.escape, sorted(Config.HESITATION_WORDS, key=len, reverse=True)))
+_FILLER_SEQUENCE = re.compile(rf"[\W_]*(?:{_FILLER_ALT})(?:[\W_]+(?:{_FILLER_ALT}))*[\W_]*")
+# 이보다 긴 발화(대부분)는 lower()/조회/정규식 없이 바로 False
+_MAX_FILLER_SEQUENCE_LEN = 32
+
+
+def _is_filler(text: str) -> bool:
+    """텍스트 전체가 필러(추임새) 또는 망설임 소리 나열인지 확인 (FILLER_WORDS는 소문자만 저장)"""
+    text = text.strip()
+    if len(text) > _MAX_FILLER_SEQUENCE_LEN:
+        return False
+    text = text.lower()
+    return text in Config.FILLER_WORDS or _FILLER_SEQUENCE.fullmatch(text) is not None
+
+
+def _nonempty_lines(text: str):
+    """앞에서부터 비어있지 않은 줄을 strip해서 하나씩 반환 (전체 split 없이 필요한 만큼만 partition)"""
+    while text:
+        line, _, text = text.partition("\n")
+        line = line.strip()
+        if line:
+            yield line
 
 
 class ModelManager:
@@ -492,19 +848,29 @@ class ModelManager:
 
     _instance = None
     _lock = threading.Lock()
+    _init_lock = threading.Lock()  # 수 초 걸리는 initialize() 중복 실행 방지 (_lock과 분리)
 
     def __new__(cls):
         if cls._instance is None:
             with cls._lock:
                 if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
+                    # 속성을 채운 뒤 공개 → lock 밖에서 읽는 스레드가 _initialized 없는 객체를 보지 않음
+                    instance = super().__new__(cls)
+                    instance._initialized = False
+                    cls._instance = instance
         return cls._instance
 
     def initialize(self):
         if self._initialized:
             return
 
+        with self._init_lock:
+            # 다른 스레드가 먼저 로딩을 끝냈으면 재진입하지 않음
+            if self._initialized:
+                return
+            self._load_all_models()
+
+    def _load_all_models(self):
         print("=" * 60)
         print("Loading AI Models...")
         print("=" * 60)
@@ -515,6 +881,9 @@ class ModelManager:
         self.async_manager.initialize()
         print("      ✓ Async Loop Manager initialized")
 
+        self.translation_cache = LRUCache(Config.TRANSLATION_CACHE_SIZE)
+        self.tts_cache = LRUCache(Config.TTS_CACHE_SIZE)
+
         # STT: Amazon Transcribe Streaming
         print("[1/3] Initializing Amazon Transcribe Streaming...")
         self.transcribe_region = Config.AWS_REGION
@@ -567,12 +936,21 @@ class ModelManager:
 
         # TTS: Amazon Polly
         print("[3/3] Initializing Amazon Polly...")
-        self.polly_client = boto3.client("polly", region_name=Config.AWS_REGION)
+        # 공용 session + keep-alive 커넥션 풀 (동시 요청이 작은 기본 풀(10)에서 직렬화되지 않도록)
+        self.aws_session = boto3.session.Session(region_name=Config.AWS_REGION)
+        aws_config = BotoConfig(
+            max_pool_connections=Config.AWS_MAX_POOL_CONNECTIONS,
+            connect_timeout=1.0,
+            read_timeout=5.0,
+            tcp_keepalive=True,
+            retries={"max_attempts": 2, "mode": "standard"},
+        )
+        self.polly_client = self.aws_session.client("polly", config=aws_config)
         print("      ✓ Polly initialized")
 
         # Translation: AWS Translate (빠른 번역용)
         print("[3.5/3] Initializing AWS Translate...")
-        self.translate_client = boto3.client("translate", region_name=Config.AWS_REGION)
+        self.translate_client = self.aws_session.client("translate", config=aws_config)
         print(f"      ✓ AWS Translate initialized (backend: {Config.TRANSLATION_BACKEND})")
 
         print("=" * 60)
@@ -640,38 +1018,42 @@ class ModelManager:
         print(f"Warmup completed in {warmup_time:.2f}s")
         print("=" * 60 + "\n")
 
-    def transcribe(self, audio_data: np.ndarray, language: str) -> Tuple[str, float]:
+    def transcribe(self, audio_data: np.ndarray, language: str,
+                   pcm16: Optional[np.ndarray] = None) -> Tuple[str, float]:
         """
         음성을 텍스트로 변환 (Amazon Transcribe Streaming)
 
         Args:
             audio_data: float32 normalized audio array
             language: 언어 코드 (예: "ko", "en")
+            pcm16: audio_data의 원본 int16 PCM (있으면 float32 → int16 재변환 생략)
 
         Returns:
             (text, confidence)
         """
         try:
-            # ========== 디버그: 오디오 분석 ==========
-            audio_rms = np.sqrt(np.mean(audio_data ** 2))
-            audio_max = np.max(np.abs(audio_data))
-            audio_duration = len(audio_data) / Config.SAMPLE_RATE
+            # 무음 판정은 제곱 평균으로 비교 (RMS sqrt는 로그 출력 시에만)
+            mean_square = float(np.dot(audio_data, audio_data)) / len(audio_data) if len(audio_data) else 0.0
 
-            print(f"[STT DEBUG] Audio: {len(audio_data)} samples ({audio_duration:.2f}s), "
-                  f"RMS={audio_rms:.4f}, Max={audio_max:.4f}")
+            # ========== 디버그: 오디오 분석 (DEBUG 레벨에서만 계산) ==========
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("[STT DEBUG] Audio: %d samples (%.2fs), RMS=%.4f, Max=%.4f",
+                          len(audio_data), len(audio_data) / Config.SAMPLE_RATE,
+                          math.sqrt(mean_square), np.max(np.abs(audio_data)))
 
             # 완전 침묵만 스킵 (매우 낮은 임계값)
-            if audio_rms < 0.001:
-                print(f"[STT] Skipped (silence): RMS={audio_rms:.6f}")
+            if mean_square < 0.001 ** 2:
+                log.debug("[STT] Skipped (silence): RMS=%.6f", math.sqrt(mean_square))
                 return "", 0.0
 
             # Amazon Transcribe 언어 코드 변환
             transcribe_lang = Config.TRANSCRIBE_LANG_CODES.get(language, "en-US")
-            print(f"[STT] Using Amazon Transcribe with language: {transcribe_lang}")
+            log.debug("[STT] Using Amazon Transcribe with language: %s", transcribe_lang)
 
-            # 오디오를 int16 bytes로 변환
-            audio_int16 = (audio_data * 32768).clip(-32768, 32767).astype(np.int16)
-            audio_bytes = audio_int16.tobytes()
+            # 원본 int16이 없을 때만 변환 (tobytes() 전체 복사 없이 byte view 전달)
+            if pcm16 is None:
+                pcm16 = (audio_data * 32768).clip(-32768, 32767).astype(np.int16)
+            audio_bytes = memoryview(pcm16).cast("B")
 
             # 전용 이벤트 루프에서 스트리밍 전사 실행 (타임아웃 적용)
             result_text, confidence = self.async_manager.run_async(
@@ -680,27 +1062,25 @@ class ModelManager:
             )
 
             if result_text:
-                print(f"[STT] Final result: {len(result_text)} chars (confidence={confidence:.2f})")
+                log.debug("[STT] Final result: %d chars (confidence=%.2f)", len(result_text), confidence)
             else:
-                print(f"[STT] No speech detected")
+                log.debug("[STT] No speech detected")
 
             return result_text, confidence
 
         except TimeoutError as e:
-            print(f"[STT Timeout] {e}")
+            log.warning("[STT Timeout] %s", e)
             return "", 0.0
         except Exception as e:
-            import traceback
-            print(f"[STT Error] {e}")
-            print(f"[STT Error Traceback] {traceback.format_exc()}")
+            log.exception("[STT Error] %s", e)
             return "", 0.0
 
-    async def _transcribe_streaming(self, audio_bytes: bytes, language_code: str) -> Tuple[str, float]:
+    async def _transcribe_streaming(self, audio_bytes: memoryview, language_code: str) -> Tuple[str, float]:
         """
         Amazon Transcribe Streaming을 사용한 음성 전사
 
         Args:
-            audio_bytes: int16 PCM audio bytes
+            audio_bytes: int16 PCM byte view (청크 단위로만 bytes 변환)
             language_code: Amazon Transcribe 언어 코드 (예: "ko-KR", "en-US")
 
         Returns:
@@ -723,7 +1103,7 @@ class ModelManager:
                             conf = alt.confidence if hasattr(alt, 'confidence') and alt.confidence else 0.95
                             if text:
                                 self.transcripts.append((text, conf))
-                                print(f"[Transcribe] Final: {len(text)} chars (conf={conf:.2f})")
+                                log.debug("[Transcribe] Final: %d chars (conf=%.2f)", len(text), conf)
 
         try:
             # 스트리밍 세션 시작
@@ -739,7 +1119,7 @@ class ModelManager:
             chunk_size = 8192
             async def send_audio():
                 for i in range(0, len(audio_bytes), chunk_size):
-                    chunk = audio_bytes[i:i + chunk_size]
+                    chunk = audio_bytes[i:i + chunk_size].tobytes()
                     await stream.input_stream.send_audio_event(audio_chunk=chunk)
                 await stream.input_stream.end_stream()
 
@@ -751,16 +1131,14 @@ class ModelManager:
 
             # 결과 조합
             if handler.transcripts:
-                texts = [t[0] for t in handler.transcripts]
-                confidences = [t[1] for t in handler.transcripts]
-                full_text = " ".join(texts)
-                avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+                full_text = " ".join(text for text, _ in handler.transcripts)
+                avg_confidence = sum(conf for _, conf in handler.transcripts) / len(handler.transcripts)
                 return full_text, avg_confidence
             else:
                 return "", 0.0
 
         except Exception as e:
-            print(f"[Transcribe Error] {e}")
+            log.error("[Transcribe Error] %s", e)
             return "", 0.0
 
     def translate(self, text: str, source_lang: str, target_lang: str) -> str:
@@ -775,18 +1153,30 @@ class ModelManager:
         Returns:
             번역된 텍스트
         """
-        if not text.strip():
+        stripped = text.strip()
+        if not stripped:
             return ""
 
         # 같은 언어면 번역 불필요
         if source_lang == target_lang:
             return text
 
+        # 반복 문구는 LRU 캐시에서 즉시 반환
+        cache_key = (stripped.casefold(), source_lang, target_lang)
+        cached = self.translation_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # 번역 백엔드 선택
         if Config.TRANSLATION_BACKEND == "aws":
-            return self._translate_aws(text, source_lang, target_lang)
+            result = self._translate_aws(text, source_lang, target_lang)
         else:
-            return self._translate_qwen(text, source_lang, target_lang)
+            result = self._translate_qwen(text, source_lang, target_lang)
+
+        # 실패(빈 결과)와 긴 문장은 캐시하지 않음
+        if result and len(stripped) <= Config.LRU_CACHE_MAX_TEXT_LENGTH:
+            self.translation_cache.put(cache_key, result)
+        return result
 
     def _translate_aws(self, text: str, source_lang: str, target_lang: str) -> str:
         """
@@ -797,7 +1187,7 @@ class ModelManager:
             aws_source = Config.AWS_TRANSLATE_LANG_CODES.get(source_lang, source_lang)
             aws_target = Config.AWS_TRANSLATE_LANG_CODES.get(target_lang, target_lang)
 
-            start_time = time.time()
+            start_time = time.monotonic_ns()
 
             response = self.translate_client.translate_text(
                 Text=text,
@@ -806,13 +1196,14 @@ class ModelManager:
             )
 
             result = response['TranslatedText']
-            elapsed = (time.time() - start_time) * 1000
+            elapsed = (time.monotonic_ns() - start_time) // 1_000_000
 
-            print(f"[AWS Translate] {source_lang}→{target_lang}: {len(text)} chars → {len(result)} chars ({elapsed:.0f}ms)")
+            log.debug("[AWS Translate] %s→%s: %d chars → %d chars (%.0fms)",
+                      source_lang, target_lang, len(text), len(result), elapsed)
             return result
 
         except Exception as e:
-            print(f"[AWS Translate Error] {e}, falling back to Qwen")
+            log.warning("[AWS Translate Error] %s, falling back to Qwen", e)
             # AWS 실패 시 Qwen으로 폴백
             return self._translate_qwen(text, source_lang, target_lang)
 
@@ -825,7 +1216,7 @@ class ModelManager:
         target_name = Config.LANGUAGE_NAMES.get(target_lang, "English")
 
         try:
-            start_time = time.time()
+            start_time = time.monotonic_ns()
 
             # 번역 프롬프트 구성 (명확하고 직접적, 이중 번역 방지)
             prompt = f"""Translate this {source_name} text to {target_name}.
@@ -859,7 +1250,7 @@ Text: {text}
             ).to(self.qwen_model.device)
 
             # 번역 생성
-            with torch.no_grad():
+            with torch.inference_mode():
                 outputs = self.qwen_model.generate(
                     **inputs,
                     max_new_tokens=256,
@@ -879,14 +1270,13 @@ Text: {text}
             # 결과 정제 (불필요한 접두어 제거)
             result = self._clean_translation(result)
 
-            elapsed = (time.time() - start_time) * 1000
-            print(f"[Qwen Translation] {source_lang}→{target_lang}: {len(text)} chars → {len(result)} chars ({elapsed:.0f}ms)")
+            elapsed = (time.monotonic_ns() - start_time) // 1_000_000
+            log.debug("[Qwen Translation] %s→%s: %d chars → %d chars (%.0fms)",
+                      source_lang, target_lang, len(text), len(result), elapsed)
             return result
 
         except Exception as e:
-            import traceback
-            print(f"[Qwen Translation Error] {e}")
-            print(f"[Qwen Translation Traceback] {traceback.format_exc()}")
+            log.exception("[Qwen Translation Error] %s", e)
             return ""
 
     def _clean_translation(self, text: str, target_lang: str = "") -> str:
@@ -895,45 +1285,23 @@ Text: {text}
 
         Qwen3가 때때로 여러 언어로 번역하거나 설명을 추가하는 경우 처리
         """
-        result = text.strip()
-
-        # 1. 흔한 접두어 패턴 제거
-        prefixes = [
-            "Here is the translation:",
-            "Here's the translation:",
-            "Translation:",
-            "The translation is:",
-            "Translated text:",
-            "In English:",
-            "In Korean:",
-            "In Japanese:",
-            "In Chinese:",
-        ]
-        for prefix in prefixes:
-            if result.lower().startswith(prefix.lower()):
-                result = result[len(prefix):].strip()
+        # 1. 흔한 접두어 패턴 제거 (정규식 1회)
+        result = _TRANSLATION_PREFIX_RE.sub("", text.strip(), count=1)
 
         # 2. 이중 번역 방지: 여러 줄이 있으면 첫 번째 의미있는 줄만 사용
-        lines = [line.strip() for line in result.split('\n') if line.strip()]
-        if len(lines) > 1:
-            # 첫 번째 줄이 너무 짧으면 (라벨일 수 있음) 두 번째 줄 사용
-            if len(lines[0]) < 5 and len(lines) > 1:
-                result = lines[1]
-            else:
-                result = lines[0]
-        elif lines:
-            result = lines[0]
+        # 첫 번째 줄이 너무 짧으면 (라벨일 수 있음) 두 번째 줄 사용 → 앞의 두 줄만 확인
+        if "\n" in result:
+            lines = _nonempty_lines(result)
+            first = next(lines, "")
+            result = next(lines, first) if len(first) < 5 else first
 
         # 3. 따옴표 제거
-        if (result.startswith('"') and result.endswith('"')) or \
-           (result.startswith("'") and result.endswith("'")):
-            result = result[1:-1]
+        quoted = _WRAPPING_QUOTES_RE.match(result)
+        if quoted:
+            result = quoted.group(2)
 
         # 4. 괄호로 둘러싸인 설명 제거 (예: "(Translation: ...)" 또는 "(English)")
-        import re
-        result = re.sub(r'\s*\([^)]*translation[^)]*\)\s*', '', result, flags=re.IGNORECASE)
-        result = re.sub(r'\s*\([^)]*english[^)]*\)\s*', '', result, flags=re.IGNORECASE)
-        result = re.sub(r'\s*\([^)]*korean[^)]*\)\s*', '', result, flags=re.IGNORECASE)
+        result = _PAREN_NOTE_RE.sub("", result)
 
         # 5. 이중 언어 출력 감지 및 제거 (예: "한국어 → English")
         arrow_patterns = [' → ', ' -> ', ' - ', ' / ']
@@ -959,27 +1327,17 @@ Text: {text}
         Returns:
             (audio_bytes, duration_ms)
         """
-        if not text.strip():
+        stripped = text.strip()
+        if not stripped:
             return b"", 0
 
-        # Polly 음성 ID 및 엔진 매핑
-        # Neural 지원 음성: Seoyeon(ko), Joanna(en), Zhiyu(zh), Takumi(ja), Lucia(es), Lea(fr), Vicki(de), Camila(pt)
-        voice_config = {
-            "ko": ("Seoyeon", "neural"),
-            "en": ("Joanna", "neural"),
-            "zh": ("Zhiyu", "neural"),
-            "ja": ("Takumi", "neural"),  # Mizuki는 neural 미지원, Takumi 사용
-            "es": ("Lucia", "neural"),
-            "fr": ("Lea", "neural"),
-            "de": ("Vicki", "neural"),
-            "pt": ("Camila", "neural"),
-            "ru": ("Tatyana", "standard"),  # neural 미지원
-            "ar": ("Zeina", "standard"),    # neural 미지원
-            "hi": ("Aditi", "standard"),    # neural 미지원
-            "tr": ("Filiz", "standard"),    # neural 미지원
-        }
-
-        voice_id, engine = voice_config.get(target_lang, ("Joanna", "neural"))
+        # 반복 문구는 LRU 캐시 재사용 (Polly는 문자 수 과금 → 비용도 절감)
+        cache_key = (stripped.casefold(), target_lang)
+        cached = self.tts_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        voice_id, engine = _POLLY_VOICES.get(target_lang, _DEFAULT_POLLY_VOICE)
 
         try:
             response = self.polly_client.synthesize_speech(
@@ -992,19 +1350,20 @@ Text: {text}
 
             audio_data = response["AudioStream"].read()
 
-            # 대략적인 duration 계산 (MP3 비트레이트 기준)
-            # 실제로는 AudioStream의 메타데이터에서 가져와야 함
-            duration_ms = int(len(audio_data) / 24 * 8)  # 대략적 추정
+            # duration 추정 (Polly 24kHz MP3는 약 48kbps → bytes * 8 / kbps = ms)
+            duration_ms = len(audio_data) * 8 // Config.POLLY_MP3_BITRATE_KBPS
 
+            if audio_data and len(stripped) <= Config.LRU_CACHE_MAX_TEXT_LENGTH:
+                self.tts_cache.put(cache_key, (audio_data, duration_ms))
             return audio_data, duration_ms
 
         except Exception as e:
             error_name = type(e).__name__
             if "AccessDenied" in str(e) or "AccessDenied" in error_name:
-                print(f"[TTS Error] ❌ AWS Polly AccessDeniedException - IAM 권한 필요!")
-                print(f"[TTS Error] IAM 사용자에 'AmazonPollyFullAccess' 정책을 추가하세요.")
+                log.error("[TTS Error] ❌ AWS Polly AccessDeniedException - IAM 권한 필요!")
+                log.error("[TTS Error] IAM 사용자에 'AmazonPollyFullAccess' 정책을 추가하세요.")
             else:
-                print(f"[TTS Error] {error_name}: {e}")
+                log.error("[TTS Error] %s: %s", error_name, e)
             return b"", 0
 
 
@@ -1017,15 +1376,67 @@ class ConversationServicer(conversation_pb2_grpc.ConversationServiceServicer):
 
     def __init__(self, model_manager: ModelManager):
         self.models = model_manager
-        self.sessions: Dict[str, SessionState] = {}
-        self.lock = threading.Lock()
+        # session_id 해시 샤드별 락 → 세션 등록/해제와 설정 업데이트가 단일 락에서 경합하지 않음
+        # 스트림 종료 시 명시적으로 제거, 값은 약한 참조 → 제거 누락 시에도 참조가 사라지면 정리되는 backstop
+        self.session_shards: List[Tuple[threading.Lock, "weakref.WeakValueDictionary[str, SessionState]"]] = [
+            (threading.Lock(), weakref.WeakValueDictionary()) for _ in range(Config.SESSION_SHARDS)
+        ]
+        # 타겟 언어별 번역/TTS fan-out (latency: N × T → max(T))
+        self.trans_pool = futures.ThreadPoolExecutor(
+            max_workers=Config.MAX_TRANSLATION_CONCURRENCY, thread_name_prefix="translate"
+        )
+
+    def _session_shard(self, session_id: str) -> Tuple[threading.Lock, "weakref.WeakValueDictionary[str, SessionState]"]:
+        return self.session_shards[hash(session_id) % len(self.session_shards)]
+
+    def _remove_session(self, session_id: str):
+        lock, sessions = self._session_shard(session_id)
+        with lock:
+            sessions.pop(session_id, None)
+
+    def _discard_session(self, state: "SessionState"):
+        """등록된 세션이 state 자신일 때만 제거 (같은 session_id로 새로 등록된 세션은 유지)"""
+        lock, sessions = self._session_shard(state.session_id)
+        with lock:
+            if sessions.get(state.session_id) is state:
+                del sessions[state.session_id]
 
     def StreamChat(self, request_iterator, context):
-        """양방향 스트리밍 RPC 처리"""
+        """
+        양방향 스트리밍 RPC 처리
+
+        요청 수신(VAD/버퍼링)은 reader 스레드, 발화 파이프라인(STT → 번역 → TTS)은 스트림 전용 worker에서 실행
+        → 이전 발화를 처리하는 동안에도 다음 발화 오디오를 계속 수신, 응답은 큐를 통해 순서대로 전송
+        """
+        log.info("New stream connected")
+
+        responses: "queue.Queue" = queue.Queue()
+        reader = threading.Thread(
+            target=self._read_stream, args=(request_iterator, responses), name="stream-reader", daemon=True
+        )
+        reader.start()
+
+        while True:
+            response = responses.get()
+            if response is None:
+                break
+            yield response
+
+    def _run_pipeline(self, state: SessionState, audio_pcm: np.ndarray, responses: "queue.Queue", error_tag: str):
+        """발화 1개 파이프라인 실행 → 응답을 큐로 전달 (에러 발생해도 스트림 유지)"""
+        try:
+            for response in self._process_audio(state, audio_pcm, True):
+                responses.put(response)
+        except Exception as proc_err:
+            log.error("[%s] %s", error_tag, proc_err)
+
+    def _read_stream(self, request_iterator, responses: "queue.Queue"):
+        """요청 수신 루프 (reader 스레드) - 종료 시 None을 넣어 StreamChat 종료"""
         session_state: Optional[SessionState] = None
         current_session_id = None
-
-        print(f"\n[{datetime.now().strftime('%H:%M:%S')}] New stream connected")
+        # 스트림당 worker 1개 → 발화 순서대로 처리, 수신과 병행
+        pipeline = futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="pipeline")
+        pending: Optional[futures.Future] = None
 
         try:
             for request in request_iterator:
@@ -1057,7 +1468,9 @@ class ConversationServicer(conversation_pb2_grpc.ConversationServiceServicer):
                             translation_enabled=p.translation_enabled
                         )
 
-                    # 세션 상태 생성
+                    # 세션 상태 생성 (이 스트림이 쓰던 이전 세션은 해제)
+                    if session_state is not None:
+                        self._discard_session(session_state)
                     session_state = SessionState(
                         session_id=current_session_id,
                         room_id=room_id,
@@ -1068,22 +1481,25 @@ class ConversationServicer(conversation_pb2_grpc.ConversationServiceServicer):
                     # 버퍼링 전략 결정
                     session_state.determine_primary_strategy()
 
-                    with self.lock:
-                        self.sessions[current_session_id] = session_state
+                    lock, sessions = self._session_shard(current_session_id)
+                    with lock:
+                        sessions[current_session_id] = session_state
 
                     strategy_name = "CHUNK (1.5s)" if session_state.primary_strategy == BufferingStrategy.CHUNK_BASED else "SENTENCE"
                     target_langs = session_state.get_target_languages()
 
-                    print(f"[Session Init] {current_session_id[:8]}...")
-                    print(f"  Speaker: {speaker.nickname} (speaks: {speaker.source_language})")
-                    print(f"  Participants: {[(p.nickname, p.target_language) for p in session_state.participants.values()]}")
-                    print(f"  Targets to translate: {target_langs}")
-                    print(f"  Strategy: {strategy_name}")
+                    log.info("[Session Init] %s... speaker=%s (speaks: %s), participants=%d, targets=%s, strategy=%s",
+                             current_session_id[:8], speaker.nickname, speaker.source_language,
+                             len(session_state.participants), sorted(target_langs), strategy_name)
+                    if log.isEnabledFor(logging.DEBUG):
+                        log.debug("  Participants: %s",
+                                  [(p.nickname, p.target_language) for p in session_state.participants.values()])
                     if not target_langs:
-                        print(f"  ⚠️ WARNING: No translation targets! sourceLang={speaker.source_language}, check participant targetLanguages")
+                        log.warning("  ⚠️ WARNING: No translation targets! sourceLang=%s, check participant targetLanguages",
+                                    speaker.source_language)
 
                     # Ready 상태 전송
-                    yield conversation_pb2.ChatResponse(
+                    responses.put(conversation_pb2.ChatResponse(
                         session_id=current_session_id,
                         room_id=room_id,
                         status=conversation_pb2.SessionStatus(
@@ -1091,65 +1507,58 @@ class ConversationServicer(conversation_pb2_grpc.ConversationServiceServicer):
                             message="Session initialized",
                             buffering_strategy=conversation_pb2.BufferingStrategy(
                                 source_language=speaker.source_language,
-                                primary_target_language=list(target_langs)[0] if target_langs else "",
+                                primary_target_language=target_langs[0] if target_langs else "",
                                 strategy=conversation_pb2.BufferingStrategy.CHUNK_BASED
                                     if session_state.primary_strategy == BufferingStrategy.CHUNK_BASED
                                     else conversation_pb2.BufferingStrategy.SENTENCE_BASED,
                                 buffer_size_ms=0
                             )
                         )
-                    )
+                    ))
 
                 # 오디오 청크 처리 (VAD 전처리 적용)
                 elif payload_type == 'audio_chunk' and session_state:
                     audio_chunk = request.audio_chunk
-                    chunk_bytes = len(audio_chunk)
-                    audio_duration = chunk_bytes / Config.BYTES_PER_SECOND
 
                     # VAD로 음성 여부 확인
                     vad = session_state.vad
                     has_speech, is_sentence_end = vad.process_chunk(audio_chunk)
 
-                    # 처리 임계값 (최소 0.5초, 최대 3초)
-                    min_speech_bytes = int(Config.BYTES_PER_SECOND * 0.5)  # 0.5초
-                    max_buffer_bytes = Config.SENTENCE_MAX_BYTES  # 3초
-
                     if has_speech:
                         # 음성 프레임만 추출하여 버퍼에 누적
-                        speech_audio = vad.filter_speech(audio_chunk)
-                        if speech_audio:
-                            session_state.audio_buffer.extend(speech_audio)
-                            speech_duration = len(speech_audio) / Config.BYTES_PER_SECOND
-                            buffer_total = len(session_state.audio_buffer) / Config.BYTES_PER_SECOND
-                            print(f"[VAD] Speech: +{speech_duration:.2f}s, buffer: {buffer_total:.2f}s")
-
-                    # 문장 끝 감지 또는 버퍼가 3초 이상이면 처리
+                        speech_bytes = vad.filter_speech_into(audio_chunk, session_state.audio_buffer)
+                        if speech_bytes:
+                            log.debug("[VAD] Speech: +%.2fs, buffer: %.2fs",
+                                      speech_bytes * Config.INV_BYTES_PER_SECOND,
+                                      len(session_state.audio_buffer) * Config.INV_BYTES_PER_SECOND)
+
+                    # 문장 끝 감지(최소 0.5초) 또는 버퍼가 최대 길이 이상이면 처리
                     should_process = False
                     process_reason = ""
+                    buffered = len(session_state.audio_buffer)
 
-                    if is_sentence_end and len(session_state.audio_buffer) >= min_speech_bytes:
+                    if is_sentence_end and buffered >= Config.MIN_SPEECH_BYTES:
                         should_process = True
                         process_reason = "sentence_end"
-                    elif len(session_state.audio_buffer) >= max_buffer_bytes:
+                    elif buffered >= Config.SENTENCE_MAX_BYTES:
                         should_process = True
                         process_reason = "buffer_full"
 
                     if should_process:
-                        process_bytes = bytes(session_state.audio_buffer)
-                        session_state.audio_buffer.clear()
+                        # take()가 이전 발화 view의 뱅크를 재사용하므로 진행 중인 파이프라인 완료 후 교체
+                        if pending is not None:
+                            pending.result()
+                        process_pcm = session_state.audio_buffer.take()
                         if process_reason == "buffer_full":
                             vad.reset()  # 버퍼 오버플로우 시에만 VAD 리셋
 
-                        buffer_duration = len(process_bytes) / Config.BYTES_PER_SECOND
-                        print(f"[VAD] Processing ({process_reason}): {buffer_duration:.2f}s")
+                        log.debug("[VAD] Processing (%s): %.2fs",
+                                  process_reason, process_pcm.nbytes * Config.INV_BYTES_PER_SECOND)
 
-                        # 오디오 처리 (에러 발생해도 스트림 유지)
-                        try:
-                            for response in self._process_audio(session_state, process_bytes, True):
-                                yield response
-                        except Exception as proc_err:
-                            print(f"[Audio Processing Error] {proc_err}")
-                            # 에러 발생해도 스트림 계속 유지
+                        # 파이프라인은 worker에서 실행하고 바로 다음 청크 수신 계속
+                        pending = pipeline.submit(
+                            self._run_pipeline, session_state, process_pcm, responses, "Audio Processing Error"
+                        )
 
                 # 세션 종료
                 elif payload_type == 'session_end':
@@ -1158,50 +1567,48 @@ class ConversationServicer(conversation_pb2_grpc.ConversationServiceServicer):
                         session_state.vad.reset()
 
                         # 남은 버퍼 처리 (최소 0.3초 이상)
-                        min_speech_bytes = int(Config.BYTES_PER_SECOND * 0.3)
-                        if len(session_state.audio_buffer) >= min_speech_bytes:
-                            process_bytes = bytes(session_state.audio_buffer)
-                            session_state.audio_buffer.clear()
-
-                            try:
-                                for response in self._process_audio(session_state, process_bytes, True):
-                                    yield response
-                            except Exception as proc_err:
-                                print(f"[Session End Processing Error] {proc_err}")
+                        if pending is not None:
+                            pending.result()
+                        if len(session_state.audio_buffer) >= Config.SESSION_END_MIN_BYTES:
+                            process_pcm = session_state.audio_buffer.take()
+                            self._run_pipeline(session_state, process_pcm, responses, "Session End Processing Error")
                         else:
                             session_state.audio_buffer.clear()
 
                     # 세션 정리
                     if current_session_id:
-                        with self.lock:
-                            self.sessions.pop(current_session_id, None)
+                        self._remove_session(current_session_id)
 
-                    print(f"[Session End] {current_session_id[:8] if current_session_id else 'unknown'}...")
                     if session_state:
-                        print(f"  Processed: {session_state.chunks_processed}")
-                        print(f"  Sentences: {session_state.sentences_completed}")
-                        print(f"  Skipped: {session_state.silence_skipped}")
+                        log.info("[Session End] %s... processed=%d, sentences=%d, skipped=%d",
+                                 current_session_id[:8] if current_session_id else 'unknown',
+                                 session_state.chunks_processed, session_state.sentences_completed,
+                                 session_state.silence_skipped)
+                    else:
+                        log.info("[Session End] %s...", current_session_id[:8] if current_session_id else 'unknown')
 
                     break
 
         except Exception as e:
-            print(f"[Stream Error] {e}")
-            yield conversation_pb2.ChatResponse(
+            log.error("[Stream Error] %s", e)
+            responses.put(conversation_pb2.ChatResponse(
                 session_id=current_session_id or "",
                 error=conversation_pb2.ErrorResponse(
                     code="STREAM_ERROR",
                     message=str(e)
                 )
-            )
+            ))
 
         finally:
-            # 정리
-            if current_session_id:
-                with self.lock:
-                    self.sessions.pop(current_session_id, None)
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] Stream closed")
-
-    def _process_audio(self, state: SessionState, audio_bytes: bytes, is_final: bool):
+            # 진행 중인 발화 응답까지 큐에 넣은 뒤 종료 신호
+            # 이 스트림의 세션 제거 (약한 참조는 누락 시 backstop)
+            pipeline.shutdown(wait=True)
+            if session_state is not None:
+                self._discard_session(session_state)
+            log.info("Stream closed")
+            responses.put(None)
+
+    def _process_audio(self, state: SessionState, audio_pcm: np.ndarray, is_final: bool):
         """
         오디오 버퍼 처리 및 응답 생성
 
@@ -1211,58 +1618,39 @@ class ConversationServicer(conversation_pb2_grpc.ConversationServiceServicer):
         Yields:
             ChatResponse 메시지들
         """
-        audio_duration = len(audio_bytes) / Config.BYTES_PER_SECOND
-        print(f"[Audio] Processing {len(audio_bytes)} bytes ({audio_duration:.1f}s)")
+        log.debug("[Audio] Processing %d bytes (%.1fs)", audio_pcm.nbytes, audio_pcm.nbytes * Config.INV_BYTES_PER_SECOND)
 
         state.chunks_processed += 1
         if is_final:
             state.sentences_completed += 1
 
-        # 오디오 정규화
-        audio_array = np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32) / 32768.0
+        # 오디오 정규화 (풀 버퍼에 cast + scale 1 pass, STT 후 반환)
+        audio_array = _float32_pool.acquire(len(audio_pcm))
+        np.multiply(audio_pcm, np.float32(1.0 / 32768.0), out=audio_array)
 
         # STT
         source_lang = state.speaker.source_language
-        print(f"[STT] Starting transcription: lang={source_lang}, samples={len(audio_array)}")
-        original_text, confidence = self.models.transcribe(audio_array, source_lang)
+        log.debug("[STT] Starting transcription: lang=%s, samples=%d", source_lang, len(audio_array))
+        try:
+            original_text, confidence = self.models.transcribe(audio_array, source_lang, pcm16=audio_pcm)
+        finally:
+            _float32_pool.release(audio_array)
 
         if not original_text:
-            print(f"[STT] No text detected from audio")
+            log.debug("[STT] No text detected from audio")
             return
 
-        print(f"[STT] Result: {len(original_text)} chars (confidence: {confidence:.2f})")
+        log.debug("[STT] Result: %d chars (confidence: %.2f)", len(original_text), confidence)
 
         # Check if text is a filler word (skip translation/TTS but still send transcript)
-        is_filler = original_text.lower().strip() in Config.FILLER_WORDS or \
-                    original_text.strip() in Config.FILLER_WORDS
-        if is_filler:
-            print(f"[Filter] Skipping filler word")
+        if _is_filler(original_text):
+            log.debug("[Filter] Skipping filler word")
             # Still send transcript for chat log, but skip translation/TTS
-            transcript_id = str(uuid.uuid4())[:8]
-            yield conversation_pb2.ChatResponse(
-                session_id=state.session_id,
-                room_id=state.room_id,
-                transcript=conversation_pb2.TranscriptResult(
-                    id=transcript_id,
-                    speaker=conversation_pb2.SpeakerInfo(
-                        participant_id=state.speaker.participant_id,
-                        nickname=state.speaker.nickname,
-                        profile_img=state.speaker.profile_img,
-                        source_language=source_lang
-                    ),
-                    original_text=original_text,
-                    original_language=source_lang,
-                    translations=[],  # No translation for filler
-                    is_partial=False,
-                    is_final=True,
-                    timestamp_ms=int(time.time() * 1000),
-                    confidence=confidence
-                )
-            )
+            yield state.transcript_response(_next_transcript_id(), original_text, confidence)
             return
 
         # 고유 ID 생성
-        transcript_id = str(uuid.uuid4())[:8]
+        transcript_id = _next_transcript_id()
 
         # 타겟 언어별 번역 수행
         target_languages = state.get_target_languages()
@@ -1270,33 +1658,22 @@ class ConversationServicer(conversation_pb2_grpc.ConversationServiceServicer):
 
         # Skip translation for very short texts (1 character)
         if len(original_text.strip()) <= 1:
-            print(f"[Translation] Skipping very short text: {len(original_text)} chars")
+            log.debug("[Translation] Skipping very short text: %d chars", len(original_text))
             # Still send transcript without translation
-            yield conversation_pb2.ChatResponse(
-                session_id=state.session_id,
-                room_id=state.room_id,
-                transcript=conversation_pb2.TranscriptResult(
-                    id=transcript_id,
-                    speaker=conversation_pb2.SpeakerInfo(
-                        participant_id=state.speaker.participant_id,
-                        nickname=state.speaker.nickname,
-                        profile_img=state.speaker.profile_img,
-                        source_language=source_lang
-                    ),
-                    original_text=original_text,
-                    original_language=source_lang,
-                    translations=[],
-                    is_partial=False,
-                    is_final=True,
-                    timestamp_ms=int(time.time() * 1000),
-                    confidence=confidence
-                )
-            )
+            yield state.transcript_response(transcript_id, original_text, confidence)
             return
 
-        for target_lang in target_languages:
-            # 번역
-            translated_text = self.models.translate(original_text, source_lang, target_lang)
+        # 언어별 번역을 동시에 실행, 결과는 target_languages 순서로 수집
+        trans_futures = [
+            (target_lang, self.trans_pool.submit(self.models.translate, original_text, source_lang, target_lang))
+            for target_lang in target_languages
+        ]
+        for target_lang, future in trans_futures:
+            try:
+                translated_text = future.result(timeout=Config.TRANSLATION_TIMEOUT)
+            except Exception as e:
+                log.warning("[Translation] %s failed: %s", target_lang, e)
+                continue
 
             if translated_text:
                 target_participants = state.get_participants_by_target_language(target_lang)
@@ -1307,67 +1684,50 @@ class ConversationServicer(conversation_pb2_grpc.ConversationServiceServicer):
                         target_participant_ids=target_participants
                     )
                 )
-                print(f"    → {target_lang}: {len(translated_text)} chars")
+                log.debug("    → %s: %d chars", target_lang, len(translated_text))
 
         # 1. Transcript 결과 전송
-        yield conversation_pb2.ChatResponse(
-            session_id=state.session_id,
-            room_id=state.room_id,
-            transcript=conversation_pb2.TranscriptResult(
-                id=transcript_id,
-                speaker=conversation_pb2.SpeakerInfo(
-                    participant_id=state.speaker.participant_id,
-                    nickname=state.speaker.nickname,
-                    profile_img=state.speaker.profile_img,
-                    source_language=source_lang
-                ),
-                original_text=original_text,
-                original_language=source_lang,
-                translations=translations,
-                is_partial=not is_final,
-                is_final=is_final,
-                timestamp_ms=int(time.time() * 1000),
-                confidence=confidence
-            )
-        )
+        yield state.transcript_response(transcript_id, original_text, confidence, translations, is_final)
 
-        # 2. TTS 오디오 생성 및 전송 (타겟별)
+        # 2. TTS 오디오 생성 및 전송 (타겟별 병렬 합성, 완료 순서대로 전송)
+        tts_futures = {}
         for translation in translations:
             target_lang = translation.target_language
             translated_text = translation.translated_text
 
             # Skip TTS for very short translations (filler-like)
             if len(translated_text.strip()) < Config.MIN_TTS_TEXT_LENGTH:
-                print(f"[TTS] Skipping short text: {len(translated_text)} chars")
+                log.debug("[TTS] Skipping short text: %d chars", len(translated_text))
                 continue
 
             # Skip TTS if translated text is also a filler word
-            if translated_text.lower().strip() in Config.FILLER_WORDS or \
-               translated_text.strip() in Config.FILLER_WORDS:
-                print(f"[TTS] Skipping filler translation")
+            if _is_filler(translated_text):
+                log.debug("[TTS] Skipping filler translation")
                 continue
 
-            print(f"[TTS] Synthesizing: {len(translated_text)} chars (lang={target_lang})")
-            audio_data, duration_ms = self.models.synthesize_speech(translated_text, target_lang)
+            log.debug("[TTS] Synthesizing: %d chars (lang=%s)", len(translated_text), target_lang)
+            future = self.trans_pool.submit(self.models.synthesize_speech, translated_text, target_lang)
+            tts_futures[future] = translation
 
-            if audio_data:
-                print(f"[TTS] Generated {len(audio_data)} bytes, duration={duration_ms}ms")
-                yield conversation_pb2.ChatResponse(
-                    session_id=state.session_id,
-                    room_id=state.room_id,
-                    audio=conversation_pb2.AudioResult(
-                        transcript_id=transcript_id,
-                        target_language=target_lang,
-                        target_participant_ids=list(translation.target_participant_ids),
-                        audio_data=audio_data,
-                        format="mp3",
-                        sample_rate=24000,
-                        duration_ms=duration_ms,
-                        speaker_participant_id=state.speaker.participant_id
-                    )
-                )
-            else:
-                print(f"[TTS] Failed to generate audio: {len(translated_text)} chars (lang={target_lang})")
+        try:
+            for future in futures.as_completed(tts_futures, timeout=Config.TTS_TIMEOUT):
+                translation = tts_futures[future]
+                target_lang = translation.target_language
+                try:
+                    audio_data, duration_ms = future.result()
+                except Exception as e:
+                    log.warning("[TTS] %s failed: %s", target_lang, e)
+                    continue
+
+                if audio_data:
+                    log.debug("[TTS] Generated %d bytes, duration=%dms", len(audio_data), duration_ms)
+                    yield state.audio_response(transcript_id, target_lang, translation.target_participant_ids,
+                                               audio_data, duration_ms)
+                else:
+                    log.warning("[TTS] Failed to generate audio: %d chars (lang=%s)",
+                                len(translation.translated_text), target_lang)
+        except futures.TimeoutError:
+            log.warning("[TTS] Timed out waiting for %d synthesis results", len(tts_futures))
 
     def UpdateParticipantSettings(self, request, context):
         """참가자 설정 업데이트"""
@@ -1376,14 +1736,20 @@ class ConversationServicer(conversation_pb2_grpc.ConversationServiceServicer):
 
         # 해당 방의 모든 세션에서 참가자 설정 업데이트
         updated = False
-        with self.lock:
-            for session in self.sessions.values():
-                if session.room_id == room_id and participant_id in session.participants:
-                    p = session.participants[participant_id]
-                    p.target_language = request.target_language
-                    p.translation_enabled = request.translation_enabled
-                    session.determine_primary_strategy()
-                    updated = True
+        for lock, sessions in self.session_shards:
+            # 샤드 락은 스냅샷 복사 동안만 보유, 스캔/업데이트는 락 밖에서
+            with lock:
+                snapshot = list(sessions.values())
+            for session in snapshot:
+                if session.room_id != room_id:
+                    continue
+                with session.lock:
+                    if participant_id in session.participants:
+                        p = session.participants[participant_id]
+                        p.target_language = request.target_language
+                        p.translation_enabled = request.translation_enabled
+                        session.determine_primary_strategy()
+                        updated = True
 
         return conversation_pb2.ParticipantSettingsResponse(
             success=updated,
@@ -1396,6 +1762,9 @@ class ConversationServicer(conversation_pb2_grpc.ConversationServiceServicer):
 # =============================================================================
 
 def serve():
+    # 백그라운드 로그 출력 스레드 시작
+    _log_listener.start()
+
     # 모델 로딩
     model_manager = ModelManager()
     model_manager.initialize()
@@ -1406,6 +1775,13 @@ def serve():
         options=[
             ('grpc.max_receive_message_length', 50 * 1024 * 1024),  # 50MB
             ('grpc.max_send_message_length', 50 * 1024 * 1024),
+            ('grpc.keepalive_time_ms', Config.GRPC_KEEPALIVE_TIME_MS),
+            ('grpc.keepalive_timeout_ms', Config.GRPC_KEEPALIVE_TIMEOUT_MS),
+            ('grpc.keepalive_permit_without_calls', 1),
+            ('grpc.http2.max_pings_without_data', 0),
+            # 클라이언트 keepalive ping을 GOAWAY(too_many_pings) 없이 허용
+            ('grpc.http2.min_ping_interval_without_data_ms', Config.GRPC_KEEPALIVE_TIME_MS // 2),
+            ('grpc.max_concurrent_streams', Config.GRPC_MAX_CONCURRENT_STREAMS),
         ]
     )
 
@@ -1438,6 +1814,8 @@ def serve():
     except KeyboardInterrupt:
         print("\nShutting down...")
         server.stop(grace=5)
+    finally:
+        _log_listener.stop()
 
 
 if __name__ == '__main__':
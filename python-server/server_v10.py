@@ -1,8 +1,17 @@
 import sys
 import os
-from concurrent import futures
+import asyncio
+
+# protobuf C 런타임(upb) 사용 - generated 모듈 import 전에 설정해야 적용됨
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+# OpenMP/MKL 스레드 수 고정 (torch/CT2 import 전) - 세션 스레드 × 코어 수 oversubscription 방지
+# 값은 Config.WHISPER_CPU_THREADS 기본값과 동일 (코어 수 / STT worker 수)
+_threads_per_worker = str(max(1, (os.cpu_count() or 2) // max(1, int(os.getenv("WHISPER_NUM_WORKERS", "2")))))
+os.environ.setdefault("OMP_NUM_THREADS", _threads_per_worker)
+os.environ.setdefault("MKL_NUM_THREADS", _threads_per_worker)
 
 import grpc
+from google.protobuf.internal import api_implementation
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -26,18 +35,35 @@ def serve():
         print(f"AWS Region: {Config.AWS_REGION}")
     print(f"Translation Backend: {Config.TRANSLATION_BACKEND}")
     print(f"Debug Logging: {'ENABLED' if DebugLogger.ENABLED else 'DISABLED'}")
+    print(f"Protobuf Runtime: {api_implementation.Type()}")
+    if api_implementation.Type() == "python":
+        print("  ⚠ pure-Python protobuf in use - install protobuf>=4.25 wheels for upb")
     print("=" * 70 + "\n")
 
     # Load AI models
     model_manager = ModelManager()
     model_manager.initialize()
 
-    # Create gRPC server
-    server = grpc.server(
-        futures.ThreadPoolExecutor(max_workers=Config.MAX_WORKERS),
+    try:
+        asyncio.run(aserve(model_manager))
+    except KeyboardInterrupt:
+        pass  # aserve()의 finally에서 server.stop() 처리
+
+
+async def aserve(model_manager: ModelManager):
+    """grpc.aio 서버 실행 (스트림은 이벤트 루프에서 멀티플렉싱)"""
+    server = grpc.aio.server(
         options=[
             ('grpc.max_receive_message_length', 50 * 1024 * 1024),
             ('grpc.max_send_message_length', 50 * 1024 * 1024),
+            ('grpc.http2.write_buffer_size', Config.GRPC_WRITE_BUFFER_SIZE),
+            ('grpc.keepalive_time_ms', Config.GRPC_KEEPALIVE_TIME_MS),
+            ('grpc.keepalive_timeout_ms', Config.GRPC_KEEPALIVE_TIMEOUT_MS),
+            ('grpc.keepalive_permit_without_calls', 1),
+            ('grpc.http2.max_pings_without_data', 0),
+            # 클라이언트 keepalive ping을 GOAWAY(too_many_pings) 없이 허용
+            ('grpc.http2.min_ping_interval_without_data_ms', Config.GRPC_KEEPALIVE_TIME_MS // 2),
+            ('grpc.max_concurrent_streams', Config.GRPC_MAX_CONCURRENT_STREAMS),
         ]
     )
 
@@ -47,21 +73,21 @@ def serve():
     )
 
     server.add_insecure_port(f'[::]:{Config.GRPC_PORT}')
-    server.start()
+    await server.start()
 
     # Display startup info
     stt_display = model_manager.get_stt_display()
 
-    print(f"\n🚀 gRPC Server started on port {Config.GRPC_PORT}")
+    print(f"\n🚀 gRPC Server started on port {Config.GRPC_PORT} (asyncio)")
     print(f"📡 STT: {stt_display}")
     print(f"🌐 Translation: {Config.TRANSLATION_BACKEND}")
     print("Press Ctrl+C to stop\n")
 
     try:
-        server.wait_for_termination()
-    except KeyboardInterrupt:
+        await server.wait_for_termination()
+    finally:
         print("\n🛑 Shutting down server...")
-        server.stop(5)
+        await server.stop(5)
 
 
 if __name__ == "__main__":
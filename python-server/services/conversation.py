@@ -3,17 +3,20 @@ gRPC Conversation Service
 양방향 스트리밍 오디오 처리 및 번역 서비스
 """
 
-import uuid
+import queue
 import time
-import threading
-from typing import Dict, Optional
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from typing import Optional
 
 import numpy as np
 
 from config.settings import Config
 from utils.logger import DebugLogger
-from models.session import Participant, Speaker, SessionState
+from models.session import Participant, Speaker, SessionState, SessionRegistry
 from language.topology import BufferingStrategy
+from language.filler import is_filler_text
+from services.responses import build_session_protos, make_transcript, make_audio, next_transcript_id
 
 import sys
 import os
@@ -23,22 +26,57 @@ from generated import conversation_pb2_grpc
 
 
 class ConversationServicer(conversation_pb2_grpc.ConversationServiceServicer):
-    """gRPC 서비스 구현 (v10 - 상세 디버깅 포함)"""
+    """
+    gRPC 서비스 구현 (v10 - grpc.aio)
+
+    스트림 수신/응답은 이벤트 루프에서 처리하고, 블로킹 파이프라인(STT/번역/TTS)은
+    pipeline_pool 스레드에서 실행 → 스트림 수가 스레드 수에 묶이지 않음
+    """
 
     def __init__(self, model_manager):
         self.models = model_manager
-        self.sessions: Dict[str, SessionState] = {}
-        self.lock = threading.Lock()
+        self.sessions = SessionRegistry()
+        # 동시 실행 파이프라인 수 제한 (번역/TTS fan-out은 models.executor 사용 → 교착 방지 위해 분리)
+        self.pipeline_pool = ThreadPoolExecutor(max_workers=Config.MAX_WORKERS, thread_name_prefix="stream")
+        # partial STT 전용 풀 - 로컬 STT 동시 실행 수만큼만 스레드 사용 (대기 중인 partial이 파이프라인 슬롯을 잡지 않음)
+        self.stt_pool = ThreadPoolExecutor(max_workers=Config.MAX_CONCURRENT_STT, thread_name_prefix="stt")
+
+    async def StreamChat(self, request_iterator, context):
+        """
+        양방향 스트리밍 RPC 처리
+
+        요청 수신(_handle_stream)과 응답 전송을 분리: 파이프라인이 도는 동안에도
+        다음 오디오 청크를 계속 받고, 응답은 outbox에 들어오는 즉시 전송
+        """
+        outbox: asyncio.Queue = asyncio.Queue()
+        done = object()
 
-    def StreamChat(self, request_iterator, context):
-        """양방향 스트리밍 RPC 처리"""
+        receiver = asyncio.ensure_future(self._handle_stream(request_iterator, outbox))
+        receiver.add_done_callback(lambda _: outbox.put_nowait(done))
+
+        try:
+            while True:
+                response = await outbox.get()
+                if response is done:
+                    break
+                yield response
+        finally:
+            if not receiver.done():
+                receiver.cancel()
+
+    async def _handle_stream(self, request_iterator, outbox: asyncio.Queue):
+        """요청 스트림 처리 (응답은 outbox로 전달)"""
         session_state: Optional[SessionState] = None
         current_session_id = None
+        # 처리 중인 발화 파이프라인 (세션당 1개, 응답 순서 유지)
+        pending: Optional[asyncio.Task] = None
+        # 진행 중인 partial 전사 (한 번에 1개, final은 기다리지 않음 - 늦게 끝난 partial은 utterance_seq로 폐기)
+        partial_task: Optional[asyncio.Task] = None
 
         DebugLogger.log("STREAM", "New gRPC stream connected")
 
         try:
-            for request in request_iterator:
+            async for request in request_iterator:
                 current_session_id = request.session_id
                 room_id = request.room_id
                 participant_id = request.participant_id
@@ -48,6 +86,15 @@ class ConversationServicer(conversation_pb2_grpc.ConversationServiceServicer):
                 if payload_type == 'session_init':
                     init = request.session_init
 
+                    # 오디오 포맷은 세션 초기화 시 1회만 확인 (청크 처리는 Config 상수 사용)
+                    declared_bps = init.sample_rate * init.channels * (init.bits_per_sample // 8)
+                    if declared_bps and declared_bps != Config.BYTES_PER_SECOND:
+                        DebugLogger.log("AUDIO_FORMAT", "Unexpected audio format, assuming 16kHz mono int16", {
+                            "sample_rate": init.sample_rate,
+                            "channels": init.channels,
+                            "bits_per_sample": init.bits_per_sample,
+                        })
+
                     speaker = Speaker(
                         participant_id=init.speaker.participant_id,
                         nickname=init.speaker.nickname,
@@ -56,13 +103,19 @@ class ConversationServicer(conversation_pb2_grpc.ConversationServiceServicer):
                     )
 
                     # 기존 세션이 있는지 확인
-                    with self.lock:
-                        existing_session = self.sessions.get(current_session_id)
+                    existing_session = self.sessions.get(current_session_id)
 
                     if existing_session:
                         # 기존 세션이 있으면 스피커 정보만 업데이트 (버퍼와 상태 유지)
-                        existing_session.speaker = speaker
-                        existing_session.determine_primary_strategy()
+                        with existing_session.lock:
+                            existing_session.speaker = speaker
+                            build_session_protos(existing_session)
+                            existing_session.determine_primary_strategy()
+                        if existing_session is not session_state:
+                            # 다른 스트림의 세션을 이어받음 (이 스트림이 쓰던 이전 세션은 해제)
+                            if session_state is not None:
+                                self.sessions.discard(session_state)
+                            self.sessions.attach(existing_session)
                         session_state = existing_session
 
                         DebugLogger.log("SPEAKER_UPDATE", f"Speaker updated", {
@@ -71,7 +124,9 @@ class ConversationServicer(conversation_pb2_grpc.ConversationServiceServicer):
                             "source_lang": speaker.source_language,
                         })
                     else:
-                        # 새 세션 생성
+                        # 새 세션 생성 (이 스트림이 쓰던 이전 세션은 해제)
+                        if session_state is not None:
+                            self.sessions.discard(session_state)
                         participants = {}
                         for p in init.participants:
                             participants[p.participant_id] = Participant(
@@ -88,15 +143,15 @@ class ConversationServicer(conversation_pb2_grpc.ConversationServiceServicer):
                             speaker=speaker,
                             participants=participants
                         )
+                        build_session_protos(session_state)
 
                         session_state.determine_primary_strategy()
 
-                        with self.lock:
-                            self.sessions[current_session_id] = session_state
+                        self.sessions.add(session_state)
 
                         target_langs = session_state.get_target_languages()
 
-                        DebugLogger.log("SESSION_INIT", f"Session initialized", {
+                        DebugLogger.log_lazy("SESSION_INIT", "Session initialized", lambda: {
                             "session": current_session_id[:8],
                             "speaker": speaker.nickname,
                             "source_lang": speaker.source_language,
@@ -106,7 +161,7 @@ class ConversationServicer(conversation_pb2_grpc.ConversationServiceServicer):
                         })
 
                         # 새 세션일 때만 READY 상태 응답
-                        yield conversation_pb2.ChatResponse(
+                        outbox.put_nowait(conversation_pb2.ChatResponse(
                             session_id=current_session_id,
                             room_id=room_id,
                             status=conversation_pb2.SessionStatus(
@@ -114,95 +169,108 @@ class ConversationServicer(conversation_pb2_grpc.ConversationServiceServicer):
                                 message="Session initialized (v10)",
                                 buffering_strategy=conversation_pb2.BufferingStrategy(
                                     source_language=speaker.source_language,
-                                    primary_target_language=list(target_langs)[0] if target_langs else "",
+                                    primary_target_language=target_langs[0] if target_langs else "",
                                     strategy=conversation_pb2.BufferingStrategy.CHUNK_BASED
                                         if session_state.primary_strategy == BufferingStrategy.CHUNK_BASED
                                         else conversation_pb2.BufferingStrategy.SENTENCE_BASED,
                                     buffer_size_ms=0
                                 )
                             )
-                        )
+                        ))
 
                 # 오디오 청크 처리
                 elif payload_type == 'audio_chunk' and session_state:
                     audio_chunk = request.audio_chunk
-                    chunk_bytes = len(audio_chunk)
-                    audio_duration = chunk_bytes / Config.BYTES_PER_SECOND
+                    debug = DebugLogger.ENABLED
+                    per_chunk = DebugLogger.PER_CHUNK
+                    session_state.chunks_received += 1
 
-                    DebugLogger.audio_received(current_session_id, chunk_bytes, audio_duration)
+                    if per_chunk or (debug and session_state.chunks_received % DebugLogger.CHUNK_SAMPLE_INTERVAL == 0):
+                        chunk_bytes = len(audio_chunk)
+                        DebugLogger.audio_received(current_session_id, chunk_bytes,
+                                                   chunk_bytes * Config.INV_BYTES_PER_SECOND)
 
                     # VAD 처리
                     vad = session_state.vad
                     has_speech, is_sentence_end = vad.process_chunk(audio_chunk)
-                    buffer_duration = len(session_state.audio_buffer) / Config.BYTES_PER_SECOND
 
-                    DebugLogger.vad_result(has_speech, is_sentence_end, buffer_duration)
-
-                    min_speech_bytes = int(Config.BYTES_PER_SECOND * 0.5)
-                    max_buffer_bytes = Config.SENTENCE_MAX_BYTES
+                    if per_chunk:
+                        DebugLogger.vad_result(has_speech, is_sentence_end,
+                                               len(session_state.audio_buffer) * Config.INV_BYTES_PER_SECOND)
 
                     if has_speech:
-                        speech_audio = vad.filter_speech(audio_chunk)
-                        if speech_audio:
-                            session_state.audio_buffer.extend(speech_audio)
+                        vad.filter_speech_into(audio_chunk, session_state.audio_buffer)
 
                     should_process = False
                     process_reason = ""
 
-                    if is_sentence_end and len(session_state.audio_buffer) >= min_speech_bytes:
+                    if is_sentence_end and len(session_state.audio_buffer) >= Config.MIN_SPEECH_BYTES:
                         should_process = True
                         process_reason = "sentence_end"
-                    elif len(session_state.audio_buffer) >= max_buffer_bytes:
-                        should_process = True
-                        process_reason = "buffer_full"
+                    elif len(session_state.audio_buffer) >= Config.SENTENCE_MAX_BYTES:
+                        if vad.speech_confirmed:
+                            should_process = True
+                            process_reason = "buffer_full"
+                        else:
+                            # 연속 음성 없이 짧은 노이즈만 쌓인 버퍼 → STT 호출 없이 폐기
+                            self._discard_unconfirmed(session_state)
 
                     if should_process:
-                        process_bytes = bytes(session_state.audio_buffer)
-                        session_state.audio_buffer.clear()
+                        # 이전 발화의 PCM view는 다음 take() 이후 덮어쓰이므로 그 전에 파이프라인 완료 대기
+                        if pending is not None:
+                            await pending
+                            pending = None
+
+                        process_pcm = session_state.audio_buffer.take()
                         if process_reason == "buffer_full":
                             vad.reset()
+                        else:
+                            vad.speech_confirmed = False
 
-                        DebugLogger.log("PROCESS", f"Processing audio buffer", {
-                            "reason": process_reason,
-                            "bytes": len(process_bytes),
-                            "duration_sec": f"{len(process_bytes) / Config.BYTES_PER_SECOND:.2f}"
-                        })
-
-                        try:
-                            pipeline_start = time.time()
-
-                            for response in self._process_audio(session_state, process_bytes, True):
-                                yield response
-
-                            pipeline_latency = (time.time() - pipeline_start) * 1000
-                            DebugLogger.log("PIPELINE_DONE", f"Pipeline complete", {
-                                "total_latency_ms": f"{pipeline_latency:.0f}"
+                        if DebugLogger.enabled("PROCESS"):
+                            DebugLogger.log("PROCESS", f"Processing audio buffer", {
+                                "reason": process_reason,
+                                "bytes": process_pcm.nbytes,
+                                "duration_sec": f"{process_pcm.nbytes * Config.INV_BYTES_PER_SECOND:.2f}"
                             })
 
-                        except Exception as proc_err:
-                            DebugLogger.log("PROCESS_ERROR", f"Audio processing failed: {proc_err}")
+                        # 파이프라인은 백그라운드로 실행하고 바로 다음 청크 수신 계속
+                        pending = asyncio.ensure_future(
+                            self._run_pipeline(session_state, process_pcm, outbox, "PROCESS_ERROR")
+                        )
+
+                    # 버퍼링 중: 새 음성이 충분히 쌓이면 partial 전사만 먼저 전송 (번역/TTS 없음)
+                    # 이전 발화 파이프라인이 LocalAgreement를 쓰는 동안, 또는 이전 partial이 아직 진행 중이면 생략
+                    # Whisper 외 백엔드(Amazon Transcribe 등)는 partial마다 유료 스트림/전체 디코딩이 필요하므로 생략
+                    elif (Config.PARTIAL_STT_ENABLED and vad.speech_confirmed and
+                          (pending is None or pending.done()) and (partial_task is None or partial_task.done()) and
+                          len(session_state.audio_buffer) - session_state.partial_mark >= Config.PARTIAL_STT_INTERVAL_BYTES and
+                          self.models.uses_whisper_stt(session_state.speaker.source_language)):
+                        session_state.partial_mark = len(session_state.audio_buffer)
+                        # 디코딩은 백그라운드로 실행하고 바로 다음 청크 수신 계속 (VAD/버퍼링이 STT를 기다리지 않음)
+                        partial_task = asyncio.ensure_future(
+                            self._run_partial(session_state, session_state.audio_buffer.snapshot_float32(), outbox)
+                        )
 
                 # 세션 종료
                 elif payload_type == 'session_end':
                     if session_state:
+                        speech_confirmed = session_state.vad.speech_confirmed
                         session_state.vad.reset()
 
-                        min_speech_bytes = int(Config.BYTES_PER_SECOND * 0.3)
-                        if len(session_state.audio_buffer) >= min_speech_bytes:
-                            process_bytes = bytes(session_state.audio_buffer)
-                            session_state.audio_buffer.clear()
+                        if pending is not None:
+                            await pending
+                            pending = None
 
-                            try:
-                                for response in self._process_audio(session_state, process_bytes, True):
-                                    yield response
-                            except Exception as proc_err:
-                                DebugLogger.log("END_PROCESS_ERROR", f"Final processing failed: {proc_err}")
+                        if speech_confirmed and len(session_state.audio_buffer) >= Config.SESSION_END_MIN_BYTES:
+                            process_pcm = session_state.audio_buffer.take()
+                            await self._run_pipeline(session_state, process_pcm, outbox, "END_PROCESS_ERROR")
                         else:
                             session_state.audio_buffer.clear()
+                            session_state.utterance_seq += 1
 
                     if current_session_id:
-                        with self.lock:
-                            self.sessions.pop(current_session_id, None)
+                        self.sessions.remove(current_session_id)
 
                     DebugLogger.log("SESSION_END", "Session ended", {
                         "session": current_session_id[:8] if current_session_id else "unknown",
@@ -214,243 +282,389 @@ class ConversationServicer(conversation_pb2_grpc.ConversationServiceServicer):
 
         except Exception as e:
             DebugLogger.log("STREAM_ERROR", f"Stream error: {e}")
-            yield conversation_pb2.ChatResponse(
+            outbox.put_nowait(conversation_pb2.ChatResponse(
                 session_id=current_session_id or "",
                 error=conversation_pb2.ErrorResponse(
                     code="STREAM_ERROR",
                     message=str(e)
                 )
-            )
+            ))
 
         finally:
-            if current_session_id:
-                with self.lock:
-                    self.sessions.pop(current_session_id, None)
+            # 클라이언트가 스트림을 닫아도 진행 중인 발화 결과는 마저 전송 (취소 시에는 함께 취소)
+            if partial_task is not None:
+                try:
+                    await partial_task
+                except asyncio.CancelledError:
+                    partial_task.cancel()
+                    if pending is not None:
+                        pending.cancel()
+                    raise
+            if pending is not None:
+                try:
+                    await pending
+                except asyncio.CancelledError:
+                    pending.cancel()
+                    raise
+            # 이 스트림의 세션 참조 해제 (같은 세션을 이어받은 재접속 스트림이 있으면 유지)
+            if session_state is not None:
+                self.sessions.discard(session_state)
             DebugLogger.log("STREAM", "Stream closed")
 
-    def _process_audio(self, state: SessionState, audio_bytes: bytes, is_final: bool):
-        """오디오 처리 파이프라인 (상세 디버깅 포함)"""
+    @staticmethod
+    def _discard_unconfirmed(state: SessionState):
+        """VAD가 발화로 확정하지 않은 버퍼 폐기 (무음/노이즈 구간 STT 생략)"""
+        if DebugLogger.enabled("VAD_SKIP"):
+            DebugLogger.log("VAD_SKIP", "No confirmed speech in buffer, skipping STT", {
+                "bytes": len(state.audio_buffer),
+            })
+        state.audio_buffer.clear()
+        state.partial_mark = 0
+        state.utterance_seq += 1
+        state.vad.reset()
+
+    async def _run_partial(self, state: SessionState, audio_f32: np.ndarray, outbox: asyncio.Queue):
+        """
+        partial 전사 1회 실행 → 응답을 outbox로 전달 (수신 루프와 별도 태스크)
+
+        디코딩만 stt_pool에서 실행하고 LocalAgreement/utterance_id 갱신은 이벤트 루프에서 수행
+        (final 파이프라인의 reset과 같은 스레드에서 순서대로 처리됨)
+        """
+        utterance_seq = state.utterance_seq
+        agreement = state.stt_agreement
+        committed = agreement.committed_text
+        try:
+            loop = asyncio.get_running_loop()
+            text, confidence = await loop.run_in_executor(
+                self.stt_pool, self._transcribe_partial, state, audio_f32, committed
+            )
+        except Exception as partial_err:
+            DebugLogger.log("PARTIAL_ERROR", f"Partial STT failed: {partial_err}")
+            return
+
+        # 디코딩 중 발화가 이미 final 처리(또는 폐기)됨 → 늦은 partial은 버림
+        if state.utterance_seq != utterance_seq:
+            DebugLogger.log("PARTIAL_STALE", "Utterance already flushed, dropping partial")
+            return
+
+        text = agreement.compose(text)
+        if not text or is_filler_text(text):
+            return
+        agreement.update(text)
+
+        if not state.utterance_id:
+            state.utterance_id = next_transcript_id()
+
+        DebugLogger.log_lazy("STT_PARTIAL", "Partial transcript", lambda: {"text_preview": text[:30]})
+        outbox.put_nowait(make_transcript(state, state.utterance_id, text, confidence, is_final=False))
+
+    async def _run_pipeline(self, state: SessionState, audio_pcm: np.ndarray,
+                            outbox: asyncio.Queue, error_tag: str):
+        """발화 1개 파이프라인 실행 → 응답을 outbox로 전달"""
+        try:
+            pipeline_start = time.monotonic_ns()
 
-        pipeline_start = time.time()
-        audio_duration = len(audio_bytes) / Config.BYTES_PER_SECOND
+            async for response in self._process_audio_async(state, audio_pcm, True):
+                outbox.put_nowait(response)
 
-        DebugLogger.log("PIPELINE_START", f"Starting audio pipeline", {
-            "bytes": len(audio_bytes),
-            "duration_sec": f"{audio_duration:.2f}",
-            "is_final": is_final
-        })
+            pipeline_latency = (time.monotonic_ns() - pipeline_start) // 1_000_000
+            if DebugLogger.enabled("PIPELINE_DONE"):
+                DebugLogger.log("PIPELINE_DONE", f"Pipeline complete", {
+                    "total_latency_ms": f"{pipeline_latency:.0f}"
+                })
+
+        except Exception as proc_err:
+            DebugLogger.log(error_tag, f"Audio processing failed: {proc_err}")
+
+    async def _process_audio_async(self, state: SessionState, audio_pcm: np.ndarray, is_final: bool):
+        """
+        블로킹 _process_audio 제너레이터를 pipeline_pool에서 실행하며 응답을 순서대로 전달
+
+        audio_pcm은 세션 PCMBuffer의 take() view (더블 버퍼이므로 다음 take() 전까지 유효)
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+
+        def run():
+            try:
+                for response in self._process_audio(state, audio_pcm, is_final):
+                    loop.call_soon_threadsafe(queue.put_nowait, response)
+            except Exception as e:
+                loop.call_soon_threadsafe(queue.put_nowait, e)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, done)
+
+        loop.run_in_executor(self.pipeline_pool, run)
+
+        while True:
+            item = await queue.get()
+            if item is done:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    def _process_audio(self, state: SessionState, audio_pcm: np.ndarray, is_final: bool):
+        """
+        오디오 처리 파이프라인 (상세 디버깅 포함)
+
+        Args:
+            audio_pcm: 세션 PCMBuffer에서 꺼낸 int16 PCM view
+        """
+
+        pipeline_start = time.monotonic_ns()
+        if DebugLogger.enabled("PIPELINE_START"):
+            DebugLogger.log("PIPELINE_START", f"Starting audio pipeline", {
+                "bytes": audio_pcm.nbytes,
+                "duration_sec": f"{audio_pcm.nbytes * Config.INV_BYTES_PER_SECOND:.2f}",
+                "is_final": is_final
+            })
 
         state.chunks_processed += 1
         if is_final:
             state.sentences_completed += 1
 
         # ===== STEP 1: STT (with Room Cache) =====
-        stt_start = time.time()
+        stt_start = time.monotonic_ns()
         source_lang = state.speaker.source_language
 
+        # partial 단계에서 LocalAgreement로 확정된 텍스트는 final 디코딩의 prefix로 고정하고
+        # 미확정 꼬리만 새로 디코딩 (partial에 보여준 확정부와 final이 어긋나지 않음)
+        # Whisper 외 백엔드는 prefix를 쓰지 않고 발화 전체를 반환하므로 결과를 그대로 사용
+        agreement = state.stt_agreement
+        committed = agreement.committed_text if self.models.uses_whisper_stt(source_lang) else ""
+
         def do_transcribe(audio_data):
-            audio_arr = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
-            return self.models.transcribe(audio_arr, source_lang)
+            text, conf = self.models.transcribe(
+                state.audio_buffer.to_float32(audio_data), source_lang, prefix=committed or None, pcm16=audio_data
+            )
+            return (agreement.compose(text) if committed else text), conf
 
         original_text, confidence, stt_cached = self.models.room_cache.get_or_create_stt(
             room_id=state.room_id,
             speaker_id=state.speaker.participant_id,
-            audio_bytes=audio_bytes,
+            audio_bytes=audio_pcm,
             transcribe_fn=do_transcribe
         )
 
-        stt_latency = (time.time() - stt_start) * 1000
+        stt_latency = (time.monotonic_ns() - stt_start) // 1_000_000
         state.total_stt_latency_ms += stt_latency
 
         if stt_cached:
-            DebugLogger.log("CACHE_STT", f"Using cached STT result", {"text_preview": original_text[:30] if original_text else ""})
+            DebugLogger.log_lazy("CACHE_STT", "Using cached STT result", lambda: {"text_preview": original_text[:30] if original_text else ""})
+
+        # partial 전사를 보낸 발화는 같은 id로 final 전송 (클라이언트가 partial을 대체)
+        transcript_id = state.utterance_id or next_transcript_id()
+        state.utterance_id = ""
+        state.partial_mark = 0
+        state.utterance_seq += 1
+        state.stt_agreement.reset(state.speaker.source_language)
 
         if not original_text:
             DebugLogger.log("PIPELINE_SKIP", "No text from STT, skipping rest of pipeline")
             return
 
         # Filler word check
-        is_filler = original_text.lower().strip() in Config.FILLER_WORDS or \
-                    original_text.strip() in Config.FILLER_WORDS
-        if is_filler:
-            DebugLogger.log("FILLER", f"Detected filler word, skipping translation/TTS")
-            transcript_id = str(uuid.uuid4())[:8]
-            yield conversation_pb2.ChatResponse(
-                session_id=state.session_id,
-                room_id=state.room_id,
-                transcript=conversation_pb2.TranscriptResult(
-                    id=transcript_id,
-                    speaker=conversation_pb2.SpeakerInfo(
-                        participant_id=state.speaker.participant_id,
-                        nickname=state.speaker.nickname,
-                        profile_img=state.speaker.profile_img,
-                        source_language=source_lang
-                    ),
-                    original_text=original_text,
-                    original_language=source_lang,
-                    translations=[],
-                    is_partial=False,
-                    is_final=True,
-                    timestamp_ms=int(time.time() * 1000),
-                    confidence=confidence
-                )
-            )
+        if is_filler_text(original_text):
+            DebugLogger.log("FILLER", "Detected filler word, skipping translation/TTS")
+            yield make_transcript(state, transcript_id, original_text, confidence)
             return
 
-        transcript_id = str(uuid.uuid4())[:8]
-
         # ===== STEP 2: Translation =====
         target_languages = state.get_target_languages()
         translations = []
 
         if len(original_text.strip()) <= 1:
             DebugLogger.log("TRANS_SKIP", "Text too short, skipping translation")
-            yield conversation_pb2.ChatResponse(
-                session_id=state.session_id,
-                room_id=state.room_id,
-                transcript=conversation_pb2.TranscriptResult(
-                    id=transcript_id,
-                    speaker=conversation_pb2.SpeakerInfo(
-                        participant_id=state.speaker.participant_id,
-                        nickname=state.speaker.nickname,
-                        profile_img=state.speaker.profile_img,
-                        source_language=source_lang
-                    ),
-                    original_text=original_text,
-                    original_language=source_lang,
-                    translations=[],
-                    is_partial=False,
-                    is_final=True,
-                    timestamp_ms=int(time.time() * 1000),
-                    confidence=confidence
-                )
-            )
+            yield make_transcript(state, transcript_id, original_text, confidence)
             return
 
-        trans_start = time.time()
-        for target_lang in target_languages:
-            def do_translate(text, src, tgt):
-                return self.models.translate(text, src, tgt)
-
-            translated_text, trans_cached = self.models.room_cache.get_or_create_translation(
-                room_id=state.room_id,
-                text=original_text,
-                source_lang=source_lang,
-                target_lang=target_lang,
-                translate_fn=do_translate
-            )
-
-            if trans_cached:
-                DebugLogger.log("CACHE_TRANS", f"Using cached translation", {"target": target_lang})
+        # 타겟 언어별 번역을 병렬로 실행하고, 번역이 끝나는 즉시 해당 언어 TTS 시작
+        # → latency: T_stt + Σ(T_mt + T_tts) 에서 T_stt + max(T_mt + T_tts) 로 단축
+        # AWS 호출(Translate 백엔드, Polly)은 네트워크 대기뿐이므로 aws_executor, 로컬 Qwen은 공용 executor
+        executor = self.models.executor
+        aws_executor = self.models.aws_executor
+        trans_executor = aws_executor if Config.TRANSLATION_BACKEND == "aws" else executor
+        trans_start = time.monotonic_ns()
+        trans_futures = {
+            trans_executor.submit(self._translate_for_target, state, original_text, source_lang, target_lang): target_lang
+            for target_lang in target_languages
+        }
+
+        translated_by_lang = {}
+
+        original_stripped = original_text.strip()
+        stream_tts = Config.TTS_STREAM_AUDIO
+        tts_chunks: "queue.SimpleQueue" = queue.SimpleQueue()
+        tts_futures = {}
+        # 번역 1개가 멈춰도 발화(및 스트림의 다음 파이프라인)가 무한 대기하지 않도록 타임아웃
+        try:
+            for future in as_completed(trans_futures, timeout=Config.TRANSLATION_TIMEOUT):
+                target_lang = trans_futures[future]
+                try:
+                    translated_text = future.result()
+                except Exception as e:
+                    DebugLogger.log("TRANS_ERROR", f"Translation failed for {target_lang}: {e}")
+                    continue
+
+                if not translated_text:
+                    continue
+                translated_by_lang[target_lang] = translated_text
+
+                # 번역 결과가 원문과 동일하면 (고유명사 등) 새로 들려줄 내용이 없으므로 TTS 생략
+                if translated_text.strip() != original_stripped and self._should_synthesize(translated_text):
+                    if stream_tts:
+                        tts_future = aws_executor.submit(self._stream_tts_for_target, translated_text, target_lang, tts_chunks)
+                    else:
+                        tts_future = aws_executor.submit(self._synthesize_for_target, state, translated_text, target_lang)
+                    tts_futures[tts_future] = target_lang
+        except FuturesTimeoutError:
+            pending_langs = [lang for f, lang in trans_futures.items() if not f.done()]
+            DebugLogger.log("TRANS_ERROR", f"Translation timed out for {pending_langs}")
 
+        # 트랜스크립트의 번역 순서는 타겟 언어 순서로 고정
+        for target_lang in target_languages:
+            translated_text = translated_by_lang.get(target_lang)
             if translated_text:
-                target_participants = state.get_participants_by_target_language(target_lang)
                 translations.append(
                     conversation_pb2.TranslationEntry(
                         target_language=target_lang,
                         translated_text=translated_text,
-                        target_participant_ids=target_participants
+                        target_participant_ids=state.get_participants_by_target_language(target_lang)
                     )
                 )
-        trans_latency = (time.time() - trans_start) * 1000
+        trans_latency = (time.monotonic_ns() - trans_start) // 1_000_000
         state.total_translation_latency_ms += trans_latency
 
         # Send Transcript
-        DebugLogger.log("TRANSCRIPT_SEND", f"Sending transcript", {
-            "text_len": len(original_text),
-            "translations": len(translations)
-        })
+        if DebugLogger.enabled("TRANSCRIPT_SEND"):
+            DebugLogger.log("TRANSCRIPT_SEND", f"Sending transcript", {
+                "text_len": len(original_text),
+                "translations": len(translations)
+            })
+
+        yield make_transcript(state, transcript_id, original_text, confidence, translations, is_final)
+
+        # ===== STEP 3: TTS (with Room Cache) - 완료되는 순서대로 전송 =====
+        tts_start = time.monotonic_ns()
+        target_ids_by_lang = {t.target_language: t.target_participant_ids for t in translations}
+        if stream_tts:
+            # 언어별 청크가 도착하는 즉시 전송 (언어별 None = 해당 언어 스트림 종료)
+            remaining = len(tts_futures)
+            while remaining:
+                try:
+                    target_lang, audio_chunk = tts_chunks.get(timeout=Config.TTS_TIMEOUT)
+                except queue.Empty:
+                    DebugLogger.log("TTS_ERROR", f"TTS stream timed out ({remaining} pending)")
+                    break
+                if audio_chunk is None:
+                    remaining -= 1
+                    continue
+                yield make_audio(state, transcript_id, target_lang, target_ids_by_lang[target_lang], audio_chunk,
+                                 self.models.audio_duration_ms(audio_chunk, Config.TTS_OUTPUT_FORMAT))
+            tts_futures = {}
+
+        for future in as_completed(tts_futures):
+            target_lang = tts_futures[future]
+            try:
+                audio_data, duration_ms, tts_cached = future.result()
+            except Exception as e:
+                DebugLogger.log("TTS_ERROR", f"TTS failed for {target_lang}: {e}")
+                continue
 
-        yield conversation_pb2.ChatResponse(
-            session_id=state.session_id,
-            room_id=state.room_id,
-            transcript=conversation_pb2.TranscriptResult(
-                id=transcript_id,
-                speaker=conversation_pb2.SpeakerInfo(
-                    participant_id=state.speaker.participant_id,
-                    nickname=state.speaker.nickname,
-                    profile_img=state.speaker.profile_img,
-                    source_language=source_lang
-                ),
-                original_text=original_text,
-                original_language=source_lang,
-                translations=translations,
-                is_partial=not is_final,
-                is_final=is_final,
-                timestamp_ms=int(time.time() * 1000),
-                confidence=confidence
-            )
-        )
+            if tts_cached:
+                DebugLogger.log_lazy("CACHE_TTS", "Using cached TTS", lambda: {
+                    "target": target_lang, "audio_bytes": len(audio_data) if audio_data else 0
+                })
 
-        # ===== STEP 3: TTS (with Room Cache) =====
-        tts_start = time.time()
-        for translation in translations:
-            target_lang = translation.target_language
-            translated_text = translation.translated_text
+            if audio_data:
+                if DebugLogger.enabled("TTS_SEND"):
+                    DebugLogger.log("TTS_SEND", f"Sending TTS audio", {
+                        "target_lang": target_lang,
+                        "audio_bytes": len(audio_data),
+                        "duration_ms": duration_ms,
+                        "cached": tts_cached
+                    })
 
-            if len(translated_text.strip()) < Config.MIN_TTS_TEXT_LENGTH:
-                continue
+                yield make_audio(state, transcript_id, target_lang, target_ids_by_lang[target_lang],
+                                 audio_data, duration_ms)
 
-            if translated_text.lower().strip() in Config.FILLER_WORDS or \
-               translated_text.strip() in Config.FILLER_WORDS:
-                continue
+        tts_latency = (time.monotonic_ns() - tts_start) // 1_000_000
+        state.total_tts_latency_ms += tts_latency
 
-            def do_synthesize(text, lang):
-                return self.models.synthesize_speech(text, lang)
+        # Pipeline summary
+        total_latency = (time.monotonic_ns() - pipeline_start) // 1_000_000
+        if DebugLogger.enabled("PIPELINE"):
+            DebugLogger.pipeline_complete(total_latency, {
+                "stt_ms": f"{stt_latency:.0f}",
+                "trans_ms": f"{trans_latency:.0f}",
+                "tts_ms": f"{tts_latency:.0f}",
+            })
+
+    def _transcribe_partial(self, state: SessionState, audio_f32: np.ndarray, committed: str):
+        """
+        버퍼링 중인 오디오의 중간 전사 (stt_pool에서 실행, Whisper 경로만)
+
+        audio_f32는 스케줄 시점에 partial 전용 scratch로 떠둔 사본 (final 파이프라인과 버퍼/scratch 공유 없음)
+        Room 캐시는 거치지 않음 (매번 오디오가 달라 재사용 불가)
+        LocalAgreement로 확정된 접두부는 디코더 prefix로 넘겨 미확정 꼬리만 새로 생성
+
+        Returns:
+            (text, confidence): prefix 이후 디코딩 결과 (compose 전)
+        """
+        return self.models.transcribe(audio_f32, state.speaker.source_language, prefix=committed or None)
+
+    def _translate_for_target(self, state: SessionState, text: str, source_lang: str, target_lang: str) -> str:
+        """타겟 언어 1개 번역 (Room 캐시 경유, executor에서 실행)"""
+        translated_text, trans_cached = self.models.room_cache.get_or_create_translation(
+            room_id=state.room_id,
+            text=text,
+            source_lang=source_lang,
+            target_lang=target_lang,
+            translate_fn=self.models.translate
+        )
 
-            audio_data, duration_ms, tts_cached = self.models.room_cache.get_or_create_tts(
-                room_id=state.room_id,
-                text=translated_text,
-                target_lang=target_lang,
-                synthesize_fn=do_synthesize
-            )
+        if trans_cached:
+            DebugLogger.log_lazy("CACHE_TRANS", "Using cached translation", lambda: {"target": target_lang})
 
-            if tts_cached:
-                DebugLogger.log("CACHE_TTS", f"Using cached TTS", {"target": target_lang, "audio_bytes": len(audio_data) if audio_data else 0})
+        return translated_text
 
-            if audio_data:
-                DebugLogger.log("TTS_SEND", f"Sending TTS audio", {
-                    "target_lang": target_lang,
-                    "audio_bytes": len(audio_data),
-                    "duration_ms": duration_ms,
-                    "cached": tts_cached
-                })
+    def _synthesize_for_target(self, state: SessionState, text: str, target_lang: str):
+        """타겟 언어 1개 TTS (Room 캐시 경유, executor에서 실행)"""
+        return self.models.room_cache.get_or_create_tts(
+            room_id=state.room_id,
+            text=text,
+            target_lang=target_lang,
+            synthesize_fn=self.models.synthesize_speech
+        )
 
-                yield conversation_pb2.ChatResponse(
-                    session_id=state.session_id,
-                    room_id=state.room_id,
-                    audio=conversation_pb2.AudioResult(
-                        transcript_id=transcript_id,
-                        target_language=target_lang,
-                        target_participant_ids=list(translation.target_participant_ids),
-                        audio_data=audio_data,
-                        format="mp3",
-                        sample_rate=24000,
-                        duration_ms=duration_ms,
-                        speaker_participant_id=state.speaker.participant_id
-                    )
-                )
+    def _stream_tts_for_target(self, text: str, target_lang: str, out: "queue.SimpleQueue"):
+        """타겟 언어 1개 TTS를 청크 단위로 out에 전달 (executor에서 실행, 끝나면 (lang, None))"""
+        try:
+            for audio_chunk in self.models.synthesize_speech_frames(text, target_lang):
+                out.put((target_lang, audio_chunk))
+        except Exception as e:
+            DebugLogger.log("TTS_ERROR", f"TTS stream failed for {target_lang}: {e}")
+        finally:
+            out.put((target_lang, None))
 
-        tts_latency = (time.time() - tts_start) * 1000
-        state.total_tts_latency_ms += tts_latency
+    @staticmethod
+    def _should_synthesize(translated_text: str) -> bool:
+        """너무 짧거나 필러인 번역은 TTS 생략"""
+        if len(translated_text.strip()) < Config.MIN_TTS_TEXT_LENGTH:
+            return False
+        return not is_filler_text(translated_text)
 
-        # Pipeline summary
-        total_latency = (time.time() - pipeline_start) * 1000
-        DebugLogger.pipeline_complete(total_latency, {
-            "stt_ms": f"{stt_latency:.0f}",
-            "trans_ms": f"{trans_latency:.0f}",
-            "tts_ms": f"{tts_latency:.0f}",
-        })
-
-    def UpdateParticipantSettings(self, request, context):
+    async def UpdateParticipantSettings(self, request, context):
         """참가자 설정 업데이트"""
         room_id = request.room_id
         participant_id = request.participant_id
 
         updated = False
-        with self.lock:
-            for session in self.sessions.values():
-                if session.room_id == room_id and participant_id in session.participants:
+        for session in self.sessions.sessions_in_room(room_id):
+            with session.lock:
+                if participant_id in session.participants:
                     p = session.participants[participant_id]
                     p.target_language = request.target_language
                     p.translation_enabled = request.translation_enabled
@@ -0,0 +1,97 @@
+"""
+Response Templates - 세션 단위 ChatResponse 템플릿
+
+세션 동안 불변인 필드(session/room id, SpeakerInfo, 오디오 포맷 등)는 한 번만 구성하고
+응답마다 CopyFrom 후 발화별 필드만 채움
+"""
+
+import time
+import secrets
+import itertools
+
+from config.settings import Config
+from models.session import SessionState
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from generated import conversation_pb2
+
+# transcript id: 프로세스 시작 시 임의 오프셋에서 증가하는 32bit 카운터 (발화마다 CSPRNG 호출 없음)
+# 보안용이 아닌 transcript ↔ audio 상관 키, 재시작 시 오프셋이 달라 이전 id와 겹칠 가능성 낮음
+_transcript_ids = itertools.count(secrets.randbits(32))
+
+
+def next_transcript_id() -> str:
+    """8자리 hex transcript id (itertools.count의 next()는 GIL 하에서 원자적)"""
+    return f"{next(_transcript_ids) & 0xFFFFFFFF:08x}"
+
+
+def build_session_protos(state: SessionState):
+    """
+    세션 동안 불변인 proto 필드를 미리 구성 (세션 초기화/스피커 변경 시에만 호출)
+
+    응답마다 CopyFrom 후 가변 필드만 채움
+    """
+    speaker = state.speaker
+    state.pb_speaker = conversation_pb2.SpeakerInfo(
+        participant_id=speaker.participant_id,
+        nickname=speaker.nickname,
+        profile_img=speaker.profile_img,
+        source_language=speaker.source_language
+    )
+    state.transcript_template = conversation_pb2.ChatResponse(
+        session_id=state.session_id,
+        room_id=state.room_id,
+        transcript=conversation_pb2.TranscriptResult(
+            speaker=state.pb_speaker,
+            original_language=speaker.source_language,
+            is_partial=False,
+            is_final=True,
+        )
+    )
+    state.audio_template = conversation_pb2.ChatResponse(
+        session_id=state.session_id,
+        room_id=state.room_id,
+        audio=conversation_pb2.AudioResult(
+            format=Config.TTS_OUTPUT_FORMAT,
+            sample_rate=Config.TTS_SAMPLE_RATES[Config.TTS_OUTPUT_FORMAT],
+            speaker_participant_id=speaker.participant_id
+        )
+    )
+
+
+def make_transcript(state: SessionState, transcript_id: str, original_text: str, confidence: float,
+                    translations=(), is_final: bool = True):
+    """세션 템플릿 기반 트랜스크립트 응답 생성"""
+    if state.transcript_template is None:
+        build_session_protos(state)
+    response = conversation_pb2.ChatResponse()
+    response.CopyFrom(state.transcript_template)
+    transcript = response.transcript
+    transcript.id = transcript_id
+    transcript.original_text = original_text
+    transcript.confidence = confidence
+    transcript.timestamp_ms = int(time.time() * 1000)
+    if translations:
+        transcript.translations.extend(translations)
+    if not is_final:
+        transcript.is_partial = True
+        transcript.is_final = False
+    return response
+
+
+def make_audio(state: SessionState, transcript_id: str, target_lang: str, target_participant_ids,
+               audio_data: bytes, duration_ms: int):
+    """세션 템플릿 기반 TTS 오디오 응답 생성"""
+    if state.audio_template is None:
+        build_session_protos(state)
+    response = conversation_pb2.ChatResponse()
+    response.CopyFrom(state.audio_template)
+    audio = response.audio
+    audio.transcript_id = transcript_id
+    audio.target_language = target_lang
+    audio.target_participant_ids.extend(target_participant_ids)
+    audio.audio_data = audio_data
+    audio.duration_ms = duration_ms
+    return response
@@ -4,7 +4,6 @@ Room당 하나의 프로세서로 효율적인 리소스 사용
 """
 
 import time
-import uuid
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Tuple, Optional, Set
 from dataclasses import dataclass
@@ -12,6 +11,8 @@ import threading
 
 from config.settings import Config
 from utils.logger import DebugLogger
+from language.filler import is_filler_text
+from services.responses import make_transcript, make_audio, next_transcript_id
 
 import sys
 import os
@@ -110,7 +111,7 @@ class RoomProcessor:
         if not target_languages or len(text.strip()) <= 1:
             return []
 
-        start_time = time.time()
+        start_time = time.monotonic_ns()
         results: List[TranslationResult] = []
         executor = self.get_executor()
 
@@ -150,16 +151,18 @@ class RoomProcessor:
                 if result:
                     results.append(result)
                     if result.cached:
-                        DebugLogger.log("CACHE_TRANS", f"Cached: {lang}")
+                        if DebugLogger.enabled("CACHE_TRANS"):
+                            DebugLogger.log("CACHE_TRANS", f"Cached: {lang}")
             except Exception as e:
                 DebugLogger.log("TRANS_ERROR", f"Future failed for {lang}: {e}")
 
-        latency_ms = (time.time() - start_time) * 1000
-        DebugLogger.log("TRANS_PARALLEL", f"Parallel translation complete", {
-            "languages": len(target_languages),
-            "results": len(results),
-            "latency_ms": f"{latency_ms:.0f}"
-        })
+        latency_ms = (time.monotonic_ns() - start_time) // 1_000_000
+        if DebugLogger.enabled("TRANS_PARALLEL"):
+            DebugLogger.log("TRANS_PARALLEL", f"Parallel translation complete", {
+                "languages": len(target_languages),
+                "results": len(results),
+                "latency_ms": f"{latency_ms:.0f}"
+            })
 
         return results
 
@@ -181,7 +184,7 @@ class RoomProcessor:
         if not translations:
             return []
 
-        start_time = time.time()
+        start_time = time.monotonic_ns()
         results: List[TTSResult] = []
         executor = self.get_executor()
 
@@ -189,8 +192,7 @@ class RoomProcessor:
         tts_candidates = [
             t for t in translations
             if len(t.translated_text.strip()) >= Config.MIN_TTS_TEXT_LENGTH
-            and t.translated_text.lower().strip() not in Config.FILLER_WORDS
-            and t.translated_text.strip() not in Config.FILLER_WORDS
+            and not is_filler_text(t.translated_text)
         ]
 
         if not tts_candidates:
@@ -231,16 +233,18 @@ class RoomProcessor:
                 if result:
                     results.append(result)
                     if result.cached:
-                        DebugLogger.log("CACHE_TTS", f"Cached: {result.target_lang}")
+                        if DebugLogger.enabled("CACHE_TTS"):
+                            DebugLogger.log("CACHE_TTS", f"Cached: {result.target_lang}")
             except Exception as e:
                 DebugLogger.log("TTS_ERROR", f"Future failed for {translation.target_lang}: {e}")
 
-        latency_ms = (time.time() - start_time) * 1000
-        DebugLogger.log("TTS_PARALLEL", f"Parallel TTS complete", {
-            "candidates": len(tts_candidates),
-            "results": len(results),
-            "latency_ms": f"{latency_ms:.0f}"
-        })
+        latency_ms = (time.monotonic_ns() - start_time) // 1_000_000
+        if DebugLogger.enabled("TTS_PARALLEL"):
+            DebugLogger.log("TTS_PARALLEL", f"Parallel TTS complete", {
+                "candidates": len(tts_candidates),
+                "results": len(results),
+                "latency_ms": f"{latency_ms:.0f}"
+            })
 
         return results
 
@@ -255,28 +259,26 @@ class RoomProcessor:
 
         STT → 병렬 번역 → 병렬 TTS
         """
-        import numpy as np
+        pipeline_start = time.monotonic_ns()
+        audio_duration = len(audio_bytes) * Config.INV_BYTES_PER_SECOND
 
-        pipeline_start = time.time()
-        audio_duration = len(audio_bytes) / Config.BYTES_PER_SECOND
-
-        DebugLogger.log("PIPELINE_START", f"Starting parallel pipeline", {
-            "bytes": len(audio_bytes),
-            "duration_sec": f"{audio_duration:.2f}",
-            "is_final": is_final
-        })
+        if DebugLogger.enabled("PIPELINE_START"):
+            DebugLogger.log("PIPELINE_START", f"Starting parallel pipeline", {
+                "bytes": len(audio_bytes),
+                "duration_sec": f"{audio_duration:.2f}",
+                "is_final": is_final
+            })
 
         state.chunks_processed += 1
         if is_final:
             state.sentences_completed += 1
 
         # ===== STEP 1: STT =====
-        stt_start = time.time()
+        stt_start = time.monotonic_ns()
         source_lang = state.speaker.source_language
 
         def do_transcribe(audio_data):
-            audio_arr = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
-            return self.models.transcribe(audio_arr, source_lang)
+            return self.models.transcribe(state.audio_buffer.to_float32(audio_data), source_lang, pcm16=audio_data)
 
         original_text, confidence, stt_cached = self.models.room_cache.get_or_create_stt(
             room_id=state.room_id,
@@ -285,7 +287,7 @@ class RoomProcessor:
             transcribe_fn=do_transcribe
         )
 
-        stt_latency = (time.time() - stt_start) * 1000
+        stt_latency = (time.monotonic_ns() - stt_start) // 1_000_000
         state.total_stt_latency_ms += stt_latency
 
         if not original_text:
@@ -293,44 +295,22 @@ class RoomProcessor:
             return
 
         # Filler word check
-        is_filler = original_text.lower().strip() in Config.FILLER_WORDS or \
-                    original_text.strip() in Config.FILLER_WORDS
-        if is_filler:
-            transcript_id = str(uuid.uuid4())[:8]
-            yield conversation_pb2.ChatResponse(
-                session_id=state.session_id,
-                room_id=state.room_id,
-                transcript=conversation_pb2.TranscriptResult(
-                    id=transcript_id,
-                    speaker=conversation_pb2.SpeakerInfo(
-                        participant_id=state.speaker.participant_id,
-                        nickname=state.speaker.nickname,
-                        profile_img=state.speaker.profile_img,
-                        source_language=source_lang
-                    ),
-                    original_text=original_text,
-                    original_language=source_lang,
-                    translations=[],
-                    is_partial=False,
-                    is_final=True,
-                    timestamp_ms=int(time.time() * 1000),
-                    confidence=confidence
-                )
-            )
+        if is_filler_text(original_text):
+            yield make_transcript(state, next_transcript_id(), original_text, confidence)
             return
 
-        transcript_id = str(uuid.uuid4())[:8]
+        transcript_id = next_transcript_id()
         target_languages = state.get_target_languages()
 
         # ===== STEP 2: Parallel Translation =====
-        trans_start = time.time()
+        trans_start = time.monotonic_ns()
         translation_results = self.translate_parallel(
             text=original_text,
             source_lang=source_lang,
             target_languages=list(target_languages),
             get_participants_fn=state.get_participants_by_target_language
         )
-        trans_latency = (time.time() - trans_start) * 1000
+        trans_latency = (time.monotonic_ns() - trans_start) // 1_000_000
         state.total_translation_latency_ms += trans_latency
 
         # Build protobuf translations
@@ -344,61 +324,31 @@ class RoomProcessor:
         ]
 
         # Send Transcript
-        yield conversation_pb2.ChatResponse(
-            session_id=state.session_id,
-            room_id=state.room_id,
-            transcript=conversation_pb2.TranscriptResult(
-                id=transcript_id,
-                speaker=conversation_pb2.SpeakerInfo(
-                    participant_id=state.speaker.participant_id,
-                    nickname=state.speaker.nickname,
-                    profile_img=state.speaker.profile_img,
-                    source_language=source_lang
-                ),
-                original_text=original_text,
-                original_language=source_lang,
-                translations=translations,
-                is_partial=not is_final,
-                is_final=is_final,
-                timestamp_ms=int(time.time() * 1000),
-                confidence=confidence
-            )
-        )
+        yield make_transcript(state, transcript_id, original_text, confidence, translations, is_final)
 
         # ===== STEP 3: Parallel TTS =====
-        tts_start = time.time()
+        tts_start = time.monotonic_ns()
         tts_results = self.synthesize_parallel(
             translations=translation_results,
             speaker_participant_id=state.speaker.participant_id
         )
-        tts_latency = (time.time() - tts_start) * 1000
+        tts_latency = (time.monotonic_ns() - tts_start) // 1_000_000
         state.total_tts_latency_ms += tts_latency
 
         # Send TTS Audio
         for tts_result in tts_results:
-            yield conversation_pb2.ChatResponse(
-                session_id=state.session_id,
-                room_id=state.room_id,
-                audio=conversation_pb2.AudioResult(
-                    transcript_id=transcript_id,
-                    target_language=tts_result.target_lang,
-                    target_participant_ids=tts_result.target_participant_ids,
-                    audio_data=tts_result.audio_data,
-                    format="mp3",
-                    sample_rate=24000,
-                    duration_ms=tts_result.duration_ms,
-                    speaker_participant_id=state.speaker.participant_id
-                )
-            )
+            yield make_audio(state, transcript_id, tts_result.target_lang, tts_result.target_participant_ids,
+                             tts_result.audio_data, tts_result.duration_ms)
 
         # Pipeline summary
-        total_latency = (time.time() - pipeline_start) * 1000
-        DebugLogger.pipeline_complete(total_latency, {
-            "stt_ms": f"{stt_latency:.0f}",
-            "trans_ms": f"{trans_latency:.0f}",
-            "tts_ms": f"{tts_latency:.0f}",
-            "parallel": True
-        })
+        total_latency = (time.monotonic_ns() - pipeline_start) // 1_000_000
+        if DebugLogger.enabled("PIPELINE"):
+            DebugLogger.pipeline_complete(total_latency, {
+                "stt_ms": f"{stt_latency:.0f}",
+                "trans_ms": f"{trans_latency:.0f}",
+                "tts_ms": f"{tts_latency:.0f}",
+                "parallel": True
+            })
 
 
 class RoomProcessorManager:
@@ -2,35 +2,59 @@
 Debug Logger - Detailed timing and flow tracking
 """
 
-import json
+import os
 from datetime import datetime
+from typing import Callable
+
+
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() == "true"
 
 
 class DebugLogger:
     """상세 디버깅을 위한 로거 클래스"""
 
-    ENABLED = True  # 디버깅 활성화/비활성화
-    VERBOSE = True  # 상세 로그 (오디오 바이트 등)
+    ENABLED = _env_flag("DEBUG_LOG", "true")  # 디버깅 활성화/비활성화
+    VERBOSE = _env_flag("DEBUG_VERBOSE", "true")  # 상세 로그 (data 필드 출력)
+    # 청크마다 발생하는 로그 (AUDIO_IN, VAD) - 기본 off, 켜지 않으면 100청크마다 요약만 출력
+    PER_CHUNK = ENABLED and _env_flag("LOG_AUDIO_PER_CHUNK", "false")
+    CHUNK_SAMPLE_INTERVAL = 100
+    # 출력하지 않을 카테고리 (예: DEBUG_LOG_MUTE="CACHE_HIT,CACHE_SET")
+    MUTED_CATEGORIES = frozenset(c for c in os.getenv("DEBUG_LOG_MUTE", "").split(",") if c)
 
     @staticmethod
     def timestamp():
         return datetime.now().strftime('%H:%M:%S.%f')[:-3]
 
+    @staticmethod
+    def enabled(category: str) -> bool:
+        """해당 카테고리 로그가 출력되는지 (hot path에서 data dict/f-string 생성 전에 확인)"""
+        return DebugLogger.ENABLED and category not in DebugLogger.MUTED_CATEGORIES
+
+    @staticmethod
+    def log_lazy(category: str, message: str, data_fn: Callable[[], dict]):
+        """출력할 때만 data_fn()으로 data dict 생성"""
+        if DebugLogger.enabled(category):
+            DebugLogger.log(category, message, data_fn() if DebugLogger.VERBOSE else None)
+
     @staticmethod
     def log(category: str, message: str, data: dict = None):
-        if not DebugLogger.ENABLED:
+        if not DebugLogger.enabled(category):
             return
 
         ts = DebugLogger.timestamp()
 
         if data and DebugLogger.VERBOSE:
-            data_str = json.dumps(data, ensure_ascii=False, default=str)
+            # json.dumps 대신 key=value f-string (dict 직렬화 비용 제거)
+            data_str = " ".join(f"{k}={v}" for k, v in data.items())
             print(f"[{ts}] [{category}] {message} | {data_str}")
         else:
             print(f"[{ts}] [{category}] {message}")
 
     @staticmethod
     def audio_received(session_id: str, chunk_bytes: int, duration_sec: float):
+        if not DebugLogger.enabled("AUDIO_IN"):
+            return
         DebugLogger.log("AUDIO_IN", f"Received audio chunk", {
             "session": session_id[:8],
             "bytes": chunk_bytes,
@@ -40,12 +64,16 @@ class DebugLogger:
 
     @staticmethod
     def vad_result(has_speech: bool, is_sentence_end: bool, buffer_duration: float):
+        if not DebugLogger.enabled("VAD"):
+            return
         DebugLogger.log("VAD", f"Speech={has_speech}, SentenceEnd={is_sentence_end}", {
             "buffer_sec": f"{buffer_duration:.2f}"
         })
 
     @staticmethod
     def stt_start(audio_bytes: int, language: str):
+        if not DebugLogger.enabled("STT_START"):
+            return
         DebugLogger.log("STT_START", f"Starting transcription", {
             "bytes": audio_bytes,
             "lang": language
@@ -53,6 +81,8 @@ class DebugLogger:
 
     @staticmethod
     def stt_result(text: str, confidence: float, latency_ms: float):
+        if not DebugLogger.enabled("STT_DONE"):
+            return
         DebugLogger.log("STT_DONE", f"Transcription complete", {
             "text_len": len(text),
             "text_preview": text[:50] + "..." if len(text) > 50 else text,
@@ -62,12 +92,16 @@ class DebugLogger:
 
     @staticmethod
     def translation_start(text: str, source: str, target: str):
+        if not DebugLogger.enabled("TRANS_START"):
+            return
         DebugLogger.log("TRANS_START", f"Translating {source}→{target}", {
             "text_len": len(text)
         })
 
     @staticmethod
     def translation_result(result: str, source: str, target: str, latency_ms: float):
+        if not DebugLogger.enabled("TRANS_DONE"):
+            return
         DebugLogger.log("TRANS_DONE", f"Translation {source}→{target} complete", {
             "result_len": len(result),
             "result_preview": result[:50] + "..." if len(result) > 50 else result,
@@ -76,6 +110,8 @@ class DebugLogger:
 
     @staticmethod
     def tts_start(text: str, language: str):
+        if not DebugLogger.enabled("TTS_START"):
+            return
         DebugLogger.log("TTS_START", f"Synthesizing speech", {
             "text_len": len(text),
             "lang": language
@@ -83,6 +119,8 @@ class DebugLogger:
 
     @staticmethod
     def tts_result(audio_bytes: int, duration_ms: int, latency_ms: float):
+        if not DebugLogger.enabled("TTS_DONE"):
+            return
         DebugLogger.log("TTS_DONE", f"TTS complete", {
             "audio_bytes": audio_bytes,
             "duration_ms": duration_ms,
@@ -91,6 +129,8 @@ class DebugLogger:
 
     @staticmethod
     def pipeline_complete(total_latency_ms: float, breakdown: dict):
+        if not DebugLogger.enabled("PIPELINE"):
+            return
         DebugLogger.log("PIPELINE", f"Complete pipeline", {
             "total_latency_ms": f"{total_latency_ms:.0f}",
             **breakdown